@@ -3,14 +3,36 @@ Configuración del panel de administración de Django.
 """
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+
+from proyecto.exports import StreamingExportMixin
+from proyecto.pagination import KeysetPaginationMixin
+from proyecto.search import IndexedSearchMixin
+
 from .models import CustomUser, UserSession
 
 
 @admin.register(CustomUser)
-class CustomUserAdmin(UserAdmin):
+class CustomUserAdmin(KeysetPaginationMixin, IndexedSearchMixin, StreamingExportMixin, UserAdmin):
     """Configuración del panel de administración para CustomUser."""
 
     model = CustomUser
+    # Conteo estimado y páginas por clave sobre el índice (date_joined, id)
+    keyset_ordering = ('-date_joined', '-pk')
+    actions = ['export_csv', 'export_jsonl']
+    # Columnas de la exportación (sin contraseña ni tokens)
+    export_fields = (
+        'id',
+        'email',
+        'first_name',
+        'last_name',
+        'email_verified',
+        'is_active',
+        'is_staff',
+        'newsletter_subscription',
+        'terms_accepted',
+        'date_joined',
+        'last_login',
+    )
     list_display = [
         'email',
         'first_name',
@@ -79,14 +101,30 @@ class CustomUserAdmin(UserAdmin):
         }),
     )
     search_fields = ('email', 'first_name', 'last_name')
+    # Búsqueda sobre índices en PostgreSQL y MySQL (ver proyecto/search.py)
+    indexed_search_fields = {
+        'postgresql': ('email__icontains', 'first_name__icontains', 'last_name__icontains'),
+        'mysql': ('email__istartswith', 'first_name__istartswith', 'last_name__istartswith'),
+    }
     ordering = ('-date_joined',)
     readonly_fields = ('date_joined', 'last_login')
 
 
 @admin.register(UserSession)
-class UserSessionAdmin(admin.ModelAdmin):
+class UserSessionAdmin(IndexedSearchMixin, StreamingExportMixin, admin.ModelAdmin):
     """Configuración del panel de administración para UserSession."""
 
+    actions = ['export_csv', 'export_jsonl']
+    # Columnas de la exportación (sin la clave de sesión, que da acceso a la cuenta)
+    export_fields = (
+        'id',
+        'user__email',
+        'ip_address',
+        'user_agent',
+        'created_at',
+        'last_activity',
+    )
+
     list_display = [
         'user',
         'session_key_short',
@@ -98,6 +136,11 @@ class UserSessionAdmin(admin.ModelAdmin):
     ]
     list_filter = ['created_at', 'last_activity']
     search_fields = ['user__email', 'session_key', 'ip_address']
+    # La clave de sesión por prefijo y la IP completa (ver proyecto/search.py)
+    indexed_search_fields = {
+        'postgresql': ('user__email__icontains', 'session_key__startswith', 'ip_address__exact'),
+        'mysql': ('user__email__istartswith', 'session_key__startswith', 'ip_address__exact'),
+    }
     readonly_fields = [
         'user',
         'session_key',
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class app_1Config(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'app_1'
+
+    def ready(self):
+        # Registrar las señales (versión del dashboard)
+        from . import signals  # noqa: F401
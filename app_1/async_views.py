@@ -0,0 +1,288 @@
+"""
+Vistas async de login, dashboard, verificación de email y sesión.
+
+Con ASGI_MODE=True (uvicorn bajo Gunicorn, ver gunicorn.conf.py) app_1/urls.py
+usa estas vistas en lugar de las de app_1/views.py. Mientras esperan a la
+base de datos (ORM async) o al servidor SMTP (proyecto/async_mail.py), el
+worker sigue atendiendo otras conexiones en lugar de bloquear un hilo por
+request. session_events (el canal de eventos de la sesión) solo existe en
+versión async y bajo WSGI responde 204.
+
+Lo que Django solo ofrece en versión síncrona (validar el formulario de
+login, que llama a authenticate(); los límites de intentos en caché; el
+render de plantillas, que puede consultar la base de datos) se ejecuta con
+sync_to_async en el hilo del request.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth import alogin
+from django.contrib.auth.decorators import login_required
+from django.contrib.sessions.models import Session
+from django.db.models import Min
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import aget_object_or_404, redirect, render
+from django.utils.safestring import mark_safe
+from django.views.decorators.cache import cache_control, never_cache
+from django.views.decorators.http import condition, require_http_methods
+
+from .forms import CustomAuthenticationForm
+from .models import CustomUser, UserSession
+from .session_events import session_event_stream, sse_message
+from .utils import asend_login_notification_email, check_login_rate_limit, get_client_ip
+from .views import (
+    DASHBOARD_EXPIRES_KEY,
+    dashboard_etag,
+    dashboard_last_modified,
+    dashboard_version_queryset,
+)
+
+arender = sync_to_async(render)
+
+
+def load_user(view):
+    """
+    Carga el usuario y la sesión con el ORM async antes de la vista.
+
+    request.user es un objeto perezoso que consulta la base de datos de
+    forma síncrona; dentro de una vista async (o de los decoradores que
+    leen request.user, como las funciones de ETag) eso falla. Debe ser el
+    primer decorador.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        request.user = await request.auser()
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+
+def load_dashboard_version(view):
+    """
+    Carga con el ORM async la versión del dashboard que leen dashboard_etag
+    y dashboard_last_modified (ver app_1/views.py), que se ejecutan de
+    forma síncrona dentro del decorador condition.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        request.dashboard_version = await dashboard_version_queryset(request.user).afirst()
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+
+@load_user
+@never_cache
+@require_http_methods(["GET", "POST"])
+async def page_login(request):
+    """
+    Vista de inicio de sesión (async).
+    Autentica al usuario y envía notificación de login.
+    """
+    if request.user.is_authenticated:
+        return redirect('dashboard')
+
+    if request.method == 'POST':
+        # Rechazar los intentos excesivos antes de que el formulario calcule el hash
+        retry_after = await sync_to_async(check_login_rate_limit)(request)
+        if retry_after:
+            messages.error(
+                request,
+                'Demasiados intentos de inicio de sesión. Por favor intenta '
+                f'de nuevo en {retry_after} segundos.'
+            )
+            # Formulario sin validar: mostrar sus errores ejecutaría authenticate()
+            form = CustomAuthenticationForm(
+                request, initial={'username': request.POST.get('username', '')}
+            )
+            response = await arender(request, 'app_1/page_login.html', {'form': form}, status=429)
+            response['Retry-After'] = str(retry_after)
+            return response
+
+        form = CustomAuthenticationForm(request, data=request.POST)
+
+        # is_valid() autentica al usuario; el hash se calcula en el pool de
+        # procesos (app_1/hashers.py) mientras el hilo del request espera
+        if await sync_to_async(form.is_valid)():
+            remember_me = form.cleaned_data.get('remember_me', False)
+            user = form.get_user()
+
+            if user is not None:
+                # Iniciar sesión
+                await alogin(request, user)
+
+                # Recordar por 30 días o expirar al cerrar el navegador
+                await request.session.aset_expiry(30 * 24 * 60 * 60 if remember_me else 0)
+
+                # Registrar sesión del usuario
+                try:
+                    await UserSession.objects.acreate(
+                        user=user,
+                        session_key=request.session.session_key,
+                        ip_address=get_client_ip(request),
+                        user_agent=request.META.get('HTTP_USER_AGENT', '')
+                    )
+                except Exception:
+                    pass  # No interrumpir el login si falla el registro de sesión
+
+                # Enviar notificación de login
+                try:
+                    await asend_login_notification_email(user, request)
+                except Exception:
+                    pass  # No interrumpir el login si falla el email
+
+                messages.success(
+                    request,
+                    f'¡Bienvenido, {user.get_full_name()}!'
+                )
+
+                # Redirigir a la página solicitada o al dashboard
+                next_url = request.GET.get('next', 'dashboard')
+                return redirect(next_url)
+            else:
+                messages.error(
+                    request,
+                    'Correo electrónico o contraseña incorrectos.'
+                )
+        else:
+            # Usuario no registrado o cuenta inactiva
+            email = request.POST.get('username', '').lower().strip()
+            if email:
+                try:
+                    user = await CustomUser.objects.aget(email=email)
+                    if not user.is_active:
+                        messages.error(
+                            request,
+                            'Tu cuenta está inactiva. Por favor contacta '
+                            'al soporte.'
+                        )
+                    else:
+                        messages.error(
+                            request,
+                            'Contraseña incorrecta.'
+                        )
+                except CustomUser.DoesNotExist:
+                    messages.error(
+                        request,
+                        mark_safe(
+                            'No existe una cuenta con este correo electrónico. '
+                            '<a href="/register/" class="alert-link">¿Deseas registrarte?</a>'
+                        )
+                    )
+    else:
+        form = CustomAuthenticationForm()
+
+    context = {
+        'form': form,
+    }
+
+    return await arender(request, 'app_1/page_login.html', context)
+
+
+@load_user
+@login_required
+@load_dashboard_version
+@require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=dashboard_etag, last_modified_func=dashboard_last_modified)
+async def dashboard(request):
+    """
+    Vista protegida del dashboard (async).
+    Muestra información de sesiones activas.
+
+    Responde 304 Not Modified si el navegador ya tiene la versión actual
+    (ver dashboard_etag); en ese caso no se consultan las sesiones.
+    """
+    # Limpiar sesiones inválidas (una consulta)
+    await UserSession.acleanup_invalid_sessions(request.user)
+
+    # Obtener sesiones activas
+    active_sessions = [
+        session async for session in UserSession.objects.filter(user=request.user)
+    ]
+
+    # Recordar cuándo vence la primera de las otras sesiones para volver a
+    # renderizar en ese momento (la actual se renueva en cada request)
+    current_session_key = request.session.session_key
+    expire_date = (await Session.objects.filter(
+        session_key__in=[session.session_key for session in active_sessions]
+    ).exclude(
+        session_key=current_session_key
+    ).aaggregate(Min('expire_date')))['expire_date__min']
+    expires_at = expire_date.timestamp() if expire_date else None
+    # Asignar marca la sesión como modificada: solo si el valor cambió
+    if await request.session.aget(DASHBOARD_EXPIRES_KEY) != expires_at:
+        await request.session.aset(DASHBOARD_EXPIRES_KEY, expires_at)
+
+    context = {
+        'user': request.user,
+        'active_sessions': active_sessions,
+        'current_session_key': current_session_key,
+        'multiple_sessions': len(active_sessions) > 1,
+        'sessions_count': len(active_sessions),
+    }
+
+    return await arender(request, 'app_1/dashboard.html', context)
+
+
+@load_user
+@login_required
+@never_cache
+@require_http_methods(["GET"])
+async def session_keepalive(request):
+    """
+    Renueva la sesión sin renderizar ninguna página (async). Responde los
+    segundos que faltan para que venza.
+    """
+    return JsonResponse({'expires_in': await request.session.aget_expiry_age()})
+
+
+@load_user
+@require_http_methods(["GET"])
+async def session_events(request):
+    """
+    Canal de server-sent events de la sesión actual: expiración, cierre
+    desde otro dispositivo y vencimiento (ver app_1/session_events.py).
+    """
+    # Mantener el canal abierto no es actividad del usuario
+    request.renew_session = False
+
+    if not settings.ASGI_MODE:
+        # Bajo WSGI cada conexión abierta ocuparía un hilo; con 204 el
+        # navegador no se reconecta y session-timeout.js usa sus temporizadores
+        return HttpResponse(status=204)
+
+    if not request.user.is_authenticated:
+        return HttpResponse(sse_message('revoked'), content_type='text/event-stream')
+
+    response = StreamingHttpResponse(
+        session_event_stream(request.session.session_key),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    # Evitar que un proxy (nginx) acumule los eventos
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@require_http_methods(["GET"])
+async def verify_email(request, token):
+    """
+    Vista para verificar el email del usuario usando el token (async).
+    """
+    user = await aget_object_or_404(
+        CustomUser,
+        email_verification_token=token
+    )
+
+    if user.email_verified:
+        messages.info(request, 'Tu correo electrónico ya está verificado.')
+    else:
+        await user.averify_email()
+        messages.success(
+            request,
+            '¡Correo electrónico verificado exitosamente! Ya puedes '
+            'iniciar sesión.'
+        )
+
+    return redirect('page_login')
@@ -0,0 +1,133 @@
+"""
+Backends de autenticación de la aplicación.
+
+CachedModelBackend evita la consulta a app_1_customuser que
+AuthenticationMiddleware hace en cada request autenticado: el usuario se
+guarda serializado en la caché (CACHES['default']) durante
+USER_CACHE_TIMEOUT segundos. Solo se activa con USER_CACHE_ENABLED (caché
+compartida por todos los workers, como Redis), porque las invalidaciones
+deben llegar a todos los procesos; si no, el usuario se lee de la base de
+datos como en ModelBackend.
+
+La caché se invalida (ver app_1/signals.py y CustomUser.touch_dashboard)
+al guardar o eliminar el usuario, lo que incluye verify_email(), el cambio
+de contraseña y el registro del último login. La verificación del hash de
+sesión de Django sigue funcionando: compara contra la contraseña del
+usuario en caché, que se descarta en cuanto la contraseña cambia.
+
+También guarda en la caché los permisos de cada usuario (los del usuario y
+los de sus grupos) durante PERMISSION_CACHE_TIMEOUT segundos, de modo que
+has_perm() en las páginas del admin no consulta la base de datos. Igual
+que el usuario, solo con PERMISSION_CACHE_ENABLED (caché compartida). Las
+claves incluyen una versión global:
+- Cambiar los grupos o permisos de un usuario elimina solo sus entradas
+- Cambiar los permisos de un grupo, o crear/eliminar grupos o permisos,
+  cambia la versión global e invalida todas las entradas
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+_key_prefix = None
+
+
+def user_cache_key(user_id):
+    """
+    Clave de caché de un usuario. Incluye los campos del modelo para que
+    una migración que agrega o quita campos no lea objetos con otra forma.
+    """
+    global _key_prefix
+    if _key_prefix is None:
+        fields = ','.join(field.attname for field in get_user_model()._meta.concrete_fields)
+        _key_prefix = 'auth:user:' + hashlib.md5(fields.encode(), usedforsecurity=False).hexdigest()[:8]
+    return f'{_key_prefix}:{user_id}'
+
+
+def invalidate_cached_users(user_ids):
+    """Elimina de la caché los usuarios indicados."""
+    cache.delete_many([user_cache_key(user_id) for user_id in user_ids])
+
+
+# Clave de la versión global de la caché de permisos
+PERMISSIONS_VERSION_KEY = 'auth:perms:version'
+
+# Orígenes de permisos de ModelBackend: permisos propios y de los grupos
+PERMISSION_SOURCES = ('user', 'group')
+
+
+def permissions_version():
+    """Versión global de la caché de permisos (se crea si no existe)."""
+    version = cache.get(PERMISSIONS_VERSION_KEY)
+    if version is None:
+        # Una versión nueva (y no 1) evita reutilizar entradas de una versión expulsada
+        cache.add(PERMISSIONS_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(PERMISSIONS_VERSION_KEY, time.time_ns())
+    return version
+
+
+def permission_cache_key(user_id, from_name, version=None):
+    """Clave de caché de los permisos de un usuario según su origen ('user' o 'group')."""
+    if version is None:
+        version = permissions_version()
+    return f'auth:perms:{version}:{user_id}:{from_name}'
+
+
+def invalidate_permissions(user_ids=None):
+    """
+    Elimina de la caché los permisos de los usuarios indicados; sin
+    usuarios, cambia la versión global e invalida los de todos.
+    """
+    if user_ids is None:
+        cache.set(PERMISSIONS_VERSION_KEY, time.time_ns(), None)
+        return
+
+    version = permissions_version()
+    cache.delete_many([
+        permission_cache_key(user_id, from_name, version)
+        for user_id in user_ids
+        for from_name in PERMISSION_SOURCES
+    ])
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend que lee el usuario de la sesión y sus permisos desde la caché."""
+
+    def get_user(self, user_id):
+        if not settings.USER_CACHE_ENABLED:
+            return super().get_user(user_id)
+
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+            return user
+
+        return user if self.user_can_authenticate(user) else None
+
+    def _get_permissions(self, user_obj, obj, from_name):
+        """
+        Permisos del usuario desde la caché compartida; ModelBackend los
+        guarda solo en el objeto, es decir, durante un request.
+        """
+        if not settings.PERMISSION_CACHE_ENABLED:
+            return super()._get_permissions(user_obj, obj, from_name)
+
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+
+        perm_cache_name = f'_{from_name}_perm_cache'
+        if not hasattr(user_obj, perm_cache_name):
+            key = permission_cache_key(user_obj.pk, from_name)
+            perms = cache.get(key)
+            if perms is None:
+                perms = super()._get_permissions(user_obj, obj, from_name)
+                cache.set(key, perms, settings.PERMISSION_CACHE_TIMEOUT)
+            setattr(user_obj, perm_cache_name, perms)
+        return getattr(user_obj, perm_cache_name)
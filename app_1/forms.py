@@ -5,7 +5,8 @@ from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from .models import CustomUser
+from django.db import IntegrityError, transaction
+from .models import DUPLICATE_EMAIL_MESSAGE, CustomUser
 
 
 class CustomUserRegistrationForm(UserCreationForm):
@@ -107,29 +108,26 @@ class CustomUserRegistrationForm(UserCreationForm):
         )
 
     def clean_email(self):
-        """Valida que el email sea único y válido para Gmail."""
+        """
+        Normaliza el email. Que no esté registrado lo verifica el índice
+        único de lower(email) al insertar (ver save()), sin consultar antes.
+        """
         email = self.cleaned_data.get('email')
 
         if email:
             email = email.lower().strip()
 
-            # Verificar si el email ya existe
-            if CustomUser.objects.filter(email=email).exists():
-                raise ValidationError(
-                    'Ya existe un usuario con este correo electrónico.'
-                )
-
         return email
 
-    def clean_password1(self):
-        """Valida la contraseña usando todos los validadores configurados."""
-        password = self.cleaned_data.get('password1')
-
-        # Ejecutar todos los validadores de Django (incluido el personalizado)
-        if password:
-            validate_password(password, self.instance)
-
-        return password
+    def _get_validation_exclusions(self):
+        """
+        Excluye el email de validate_unique() y validate_constraints(): ambos
+        harían un SELECT antes del INSERT. El formato ya lo valida el campo
+        del formulario.
+        """
+        exclude = super()._get_validation_exclusions()
+        exclude.add('email')
+        return exclude
 
     def save(self, commit=True):
         """Guarda el usuario y configura campos adicionales."""
@@ -145,7 +143,16 @@ class CustomUserRegistrationForm(UserCreationForm):
         )
 
         if commit:
-            user.save()
+            try:
+                if transaction.get_connection().in_atomic_block:
+                    # Dentro de una transacción el error la invalidaría: aislarlo en un savepoint
+                    with transaction.atomic():
+                        user.save()
+                else:
+                    user.save()
+            except IntegrityError:
+                # Otro registro con el mismo email ganó la carrera
+                raise ValidationError({'email': DUPLICATE_EMAIL_MESSAGE})
 
         return user
 
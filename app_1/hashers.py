@@ -0,0 +1,278 @@
+"""
+Hashers de contraseñas de la aplicación.
+
+PBKDF2 con 1.000.000 de iteraciones ocupa la CPU de un worker durante
+cientos de milisegundos en cada authenticate(), set_password() y
+check_password(). Los hashers de este módulo calculan el hash en un pool
+acotado de procesos, de modo que los hilos del worker (gthread) o el bucle
+asíncrono siguen atendiendo otros requests mientras tanto.
+
+Sus parámetros (iteraciones de PBKDF2, time_cost y memory_cost de Argon2,
+work_factor de scrypt) se leen de PASSWORD_HASHER_PARAMS, que genera
+"python manage.py calibrate_hashers" midiendo cada algoritmo en el
+servidor. Cuando los parámetros o el algoritmo cambian, el hash de cada
+usuario se recalcula al iniciar sesión (rehash_password), como hace Django.
+
+El pool aplica contrapresión: si hay PASSWORD_HASHING_MAX_PENDING hashes
+en curso, los siguientes esperan un espacio hasta PASSWORD_HASHING_TIMEOUT
+segundos y luego fallan con ServiceOverloaded (respuesta 503, ver
+proyecto/middleware.py) en lugar de acumular requests sin límite. Un hash
+ocupa su espacio hasta que el proceso del pool termina de calcularlo,
+aunque el request haya dejado de esperarlo.
+
+El formato del hash es el mismo de Django (pbkdf2_sha256$...), así que los
+hashes existentes siguen siendo válidos y se puede volver al hasher de
+Django en cualquier momento.
+
+Configuración (settings.py):
+- PASSWORD_HASHER_PARAMS: Parámetros calibrados por algoritmo (ver PASSWORD_HASHING_CONFIG)
+- PASSWORD_HASHING_WORKERS: Procesos del pool por worker (0 = calcular en el mismo proceso)
+- PASSWORD_HASHING_MAX_PENDING: Hashes en curso o en cola por worker
+- PASSWORD_HASHING_TIMEOUT: Segundos máximos de espera por un hash
+"""
+import base64
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+    make_password,
+)
+from django.utils.encoding import force_bytes
+
+from proyecto.middleware import ServiceOverloaded
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_pid = None
+_slots = None
+_slots_pid = None
+_lock = threading.Lock()
+
+
+def _pbkdf2(digest_name, password, salt, iterations):
+    """Calcula PBKDF2 (se ejecuta en los procesos del pool)."""
+    return hashlib.pbkdf2_hmac(digest_name, password, salt, iterations)
+
+
+def _scrypt(password, salt, n, r, p):
+    """Calcula scrypt con memoria suficiente para n y r (se ejecuta en el pool)."""
+    # OpenSSL limita scrypt a 32 MB por defecto; scrypt usa unos 128 * n * r * p bytes
+    maxmem = 128 * r * (n + p + 2) + 1024 * 1024
+    return hashlib.scrypt(password, salt=salt, n=n, r=r, p=p, maxmem=maxmem, dklen=64)
+
+
+def _argon2_hash(password, salt, time_cost, memory_cost, parallelism):
+    """Calcula un hash Argon2id y retorna su forma codificada (se ejecuta en el pool)."""
+    import argon2
+
+    return argon2.low_level.hash_secret(
+        password,
+        salt,
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        hash_len=argon2.DEFAULT_HASH_LENGTH,
+        type=argon2.low_level.Type.ID,
+    ).decode('ascii')
+
+
+def _argon2_verify(encoded, password):
+    """Verifica una contraseña contra un hash Argon2 (se ejecuta en el pool)."""
+    import argon2
+
+    try:
+        return argon2.PasswordHasher().verify(encoded, password)
+    except argon2.exceptions.VerificationError:
+        return False
+
+
+def calibrated(algorithm, name, default):
+    """Parámetro calibrado de un algoritmo (PASSWORD_HASHER_PARAMS) o el valor de Django."""
+    return settings.PASSWORD_HASHER_PARAMS.get(algorithm, {}).get(name, default)
+
+
+def get_pool():
+    """
+    Pool de procesos del worker actual y su semáforo de hashes en curso,
+    creados al primer uso. Si el proceso cambió (fork de Gunicorn con
+    preload), se crean de nuevo. El semáforo no se recrea con el pool (tras
+    BrokenProcessPool): los hashes del pool anterior siguen ocupando sus
+    espacios hasta terminar.
+    """
+    global _pool, _pool_pid, _slots, _slots_pid
+
+    with _lock:
+        if _slots is None or _slots_pid != os.getpid():
+            _slots = threading.BoundedSemaphore(settings.PASSWORD_HASHING_MAX_PENDING)
+            _slots_pid = os.getpid()
+        if _pool is None or _pool_pid != os.getpid():
+            # forkserver evita hacer fork de un proceso con hilos (gthread)
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING_WORKERS,
+                mp_context=multiprocessing.get_context(method),
+            )
+            _pool_pid = os.getpid()
+        return _pool, _slots
+
+
+def run_in_pool(function, *args):
+    """
+    Ejecuta una función de hashing en el pool respetando el límite de
+    hashes en curso. Con PASSWORD_HASHING_WORKERS = 0 se ejecuta en el
+    mismo proceso.
+
+    Raises:
+        ServiceOverloaded: Si no hay espacio en el pool o el hash no
+            termina dentro de PASSWORD_HASHING_TIMEOUT
+    """
+    global _pool
+
+    if not settings.PASSWORD_HASHING_WORKERS:
+        return function(*args)
+
+    pool, slots = get_pool()
+    timeout = settings.PASSWORD_HASHING_TIMEOUT
+
+    if not slots.acquire(timeout=timeout):
+        raise ServiceOverloaded('Demasiadas solicitudes de autenticación en curso.')
+    try:
+        try:
+            future = pool.submit(function, *args)
+        except BaseException:
+            slots.release()
+            raise
+        # Liberar el espacio cuando el hash termina: cancel() no detiene un
+        # hash que ya se está calculando
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise ServiceOverloaded('El cálculo de la contraseña tardó demasiado.')
+    except BrokenProcessPool:
+        # Un proceso del pool murió: se recrea en el próximo uso y este hash
+        # se calcula en el mismo proceso para no rechazar al usuario
+        with _lock:
+            if _pool is pool:
+                _pool = None
+        return function(*args)
+
+
+class PooledPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2PasswordHasher (mismo algoritmo y formato) que calcula el hash en el pool."""
+
+    @property
+    def iterations(self):
+        return calibrated(self.algorithm, 'iterations', PBKDF2PasswordHasher.iterations)
+
+    def encode(self, password, salt, iterations=None):
+        self._check_encode_args(password, salt)
+        iterations = iterations or self.iterations
+        hash = run_in_pool(
+            _pbkdf2, self.digest().name, force_bytes(password), force_bytes(salt), iterations
+        )
+        hash = base64.b64encode(hash).decode('ascii').strip()
+        return '%s$%d$%s$%s' % (self.algorithm, iterations, salt, hash)
+
+
+class CalibratedScryptPasswordHasher(ScryptPasswordHasher):
+    """ScryptPasswordHasher con parámetros calibrados que calcula el hash en el pool."""
+
+    @property
+    def work_factor(self):
+        return calibrated(self.algorithm, 'work_factor', ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return calibrated(self.algorithm, 'block_size', ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return calibrated(self.algorithm, 'parallelism', ScryptPasswordHasher.parallelism)
+
+    def encode(self, password, salt, n=None, r=None, p=None):
+        self._check_encode_args(password, salt)
+        n = n or self.work_factor
+        r = r or self.block_size
+        p = p or self.parallelism
+        hash = run_in_pool(_scrypt, password.encode(), salt.encode(), n, r, p)
+        hash = base64.b64encode(hash).decode('ascii').strip()
+        return '%s$%d$%s$%d$%d$%s' % (self.algorithm, n, salt, r, p, hash)
+
+
+class CalibratedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2PasswordHasher con parámetros calibrados que calcula el hash en el pool."""
+
+    @property
+    def time_cost(self):
+        return calibrated(self.algorithm, 'time_cost', Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return calibrated(self.algorithm, 'memory_cost', Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return calibrated(self.algorithm, 'parallelism', Argon2PasswordHasher.parallelism)
+
+    def encode(self, password, salt):
+        argon2 = self._load_library()
+        params = self.params()
+        data = run_in_pool(
+            _argon2_hash,
+            password.encode(),
+            salt.encode(),
+            params.time_cost,
+            params.memory_cost,
+            params.parallelism,
+        )
+        return self.algorithm + data
+
+    def verify(self, password, encoded):
+        self._load_library()
+        algorithm, rest = encoded.split('$', 1)
+        assert algorithm == self.algorithm
+        return run_in_pool(_argon2_verify, '$' + rest, password)
+
+
+# ----------------------------------------------------------------------------
+# Rehash al iniciar sesión
+# ----------------------------------------------------------------------------
+
+def rehash_password(user, raw_password):
+    """
+    Recalcula el hash de un usuario con los parámetros actuales.
+
+    Se usa como setter de check_password(): Django lo llama cuando la
+    contraseña es correcta pero su hash usa otro algoritmo o parámetros.
+    El hash nuevo se asigna al usuario antes de que login() guarde el hash
+    de sesión, así la sesión nace con él y sigue siendo válida en cualquier
+    worker. El update condicional (mismo hash anterior) no pisa un cambio de
+    contraseña hecho mientras tanto, y no emite señales ni password_changed.
+    Si falla, el login continúa con el hash anterior.
+    """
+    from .backends import invalidate_cached_users
+
+    try:
+        password = make_password(raw_password)
+        updated = type(user)._default_manager.filter(
+            pk=user.pk, password=user.password,
+        ).update(password=password)
+    except Exception:
+        logger.exception('No se pudo recalcular el hash de la contraseña del usuario %s', user.pk)
+        return
+
+    if updated:
+        user.password = password
+        invalidate_cached_users([user.pk])
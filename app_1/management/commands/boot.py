@@ -0,0 +1,179 @@
+"""
+Comando de arranque del contenedor.
+
+Ejecuta en un solo proceso de Django los pasos previos a iniciar Gunicorn:
+- collectstatic, solo si los archivos estáticos cambiaron
+- migrate, solo si hay migraciones pendientes
+- creación del superusuario por defecto
+
+Reporta el tiempo de cada fase al final.
+
+Uso:
+    python manage.py boot
+    python manage.py boot --no-migrate --no-superuser   # Fase de build
+"""
+import hashlib
+import json
+import os
+import time
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import get_finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+# Archivo dentro de STATIC_ROOT con la huella de la última recolección
+STATIC_FINGERPRINT_FILE = '.boot-static-fingerprint'
+
+
+def compute_static_fingerprint():
+    """
+    Calcula una huella del árbol de archivos estáticos de origen.
+    Usa la ruta, el tamaño y la fecha de modificación de cada archivo
+    encontrado por los finders, además del backend de almacenamiento.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(settings.STORAGES, sort_keys=True, default=str).encode())
+
+    entries = []
+    for finder in get_finders():
+        for path, storage in finder.list(['CVS', '.*', '*~']):
+            stat = os.stat(storage.path(path))
+            prefix = getattr(storage, 'prefix', None) or ''
+            entries.append(f'{prefix}/{path}:{stat.st_size}:{stat.st_mtime_ns}')
+
+    for entry in sorted(entries):
+        digest.update(entry.encode())
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def read_static_fingerprint():
+    """Lee la huella guardada en STATIC_ROOT, o None si no existe."""
+    path = os.path.join(settings.STATIC_ROOT, STATIC_FINGERPRINT_FILE)
+    try:
+        with open(path) as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def write_static_fingerprint(fingerprint):
+    """Guarda la huella en STATIC_ROOT."""
+    path = os.path.join(settings.STATIC_ROOT, STATIC_FINGERPRINT_FILE)
+    with open(path, 'w') as file:
+        file.write(fingerprint)
+
+
+def pending_migrations(database=DEFAULT_DB_ALIAS):
+    """Retorna el plan de migraciones pendientes para la base de datos."""
+    connection = connections[database]
+    executor = MigrationExecutor(connection)
+    targets = executor.loader.graph.leaf_nodes()
+    return executor.migration_plan(targets)
+
+
+class Command(BaseCommand):
+    help = (
+        'Prepara el contenedor en un solo proceso: collectstatic y migrate '
+        'solo cuando hay cambios, y creación del superusuario por defecto.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-static',
+            action='store_true',
+            help='No recolectar archivos estáticos.',
+        )
+        parser.add_argument(
+            '--no-migrate',
+            action='store_true',
+            help='No aplicar migraciones.',
+        )
+        parser.add_argument(
+            '--no-superuser',
+            action='store_true',
+            help='No crear el superusuario por defecto.',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Ejecutar collectstatic y migrate aunque no haya cambios.',
+        )
+
+    def handle(self, *args, **options):
+        self.timings = []
+        self.force = options['force']
+        started = time.perf_counter()
+
+        if not options['no_static']:
+            self.run_phase('collectstatic', self.collect_static)
+
+        if not options['no_migrate']:
+            self.run_phase('migrate', self.migrate)
+
+        if not options['no_superuser']:
+            self.run_phase('superusuario', self.create_superuser)
+
+        self.report(time.perf_counter() - started)
+
+    def run_phase(self, name, func):
+        """Ejecuta una fase y registra su duración y resultado."""
+        start = time.perf_counter()
+        result = func()
+        self.timings.append((name, time.perf_counter() - start, result))
+
+    def collect_static(self):
+        """Ejecuta collectstatic si la huella de los estáticos cambió."""
+        fingerprint = compute_static_fingerprint()
+
+        # Con almacenamiento tipo Manifest, el manifiesto también debe existir
+        manifest_name = getattr(staticfiles_storage, 'manifest_name', None)
+        manifest_exists = (
+            manifest_name is None
+            or os.path.exists(os.path.join(settings.STATIC_ROOT, manifest_name))
+        )
+
+        if (not self.force
+                and manifest_exists
+                and fingerprint == read_static_fingerprint()):
+            self.stdout.write('✅ Archivos estáticos sin cambios, se omite collectstatic')
+            return 'omitido'
+
+        self.stdout.write('📁 Recolectando archivos estáticos...')
+        call_command('collectstatic', interactive=False, verbosity=0)
+        write_static_fingerprint(fingerprint)
+
+        for line in getattr(staticfiles_storage, 'summary', list)():
+            self.stdout.write(f'   {line}')
+        return 'ejecutado'
+
+    def migrate(self):
+        """Ejecuta migrate si hay migraciones pendientes."""
+        plan = pending_migrations()
+
+        if not plan and not self.force:
+            self.stdout.write('✅ Base de datos al día, se omite migrate')
+            return 'omitido'
+
+        self.stdout.write(f'🔄 Aplicando {len(plan)} migraciones...')
+        call_command('migrate', interactive=False, verbosity=1)
+        return 'ejecutado'
+
+    def create_superuser(self):
+        """Crea el superusuario por defecto si no existe."""
+        from create_default_superuser import create_superuser
+
+        return 'creado' if create_superuser() else 'omitido'
+
+    def report(self, total):
+        """Imprime el tiempo de cada fase."""
+        self.stdout.write('')
+        self.stdout.write('⏱️  Tiempos de arranque:')
+        for name, duration, result in self.timings:
+            self.stdout.write(f'   {name:<15} {duration:8.2f} s  ({result})')
+        self.stdout.write(self.style.SUCCESS(f'   {"total":<15} {total:8.2f} s'))
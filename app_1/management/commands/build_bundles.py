@@ -0,0 +1,53 @@
+"""
+Genera los paquetes de CSS y JavaScript definidos en STATIC_BUNDLES.
+
+Uso:
+    python manage.py build_bundles
+    python manage.py build_bundles --check   # Falla si algún paquete está desactualizado
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from proyecto.bundles import build_bundle, bundle_path, write_bundle
+
+
+class Command(BaseCommand):
+    help = 'Concatena y minifica los CSS y JS de cada layout en un solo archivo.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='No escribir; terminar con error si algún paquete está desactualizado.',
+        )
+
+    def handle(self, *args, **options):
+        outdated = []
+
+        for bundle_name, sources in settings.STATIC_BUNDLES.items():
+            try:
+                content = build_bundle(bundle_name, sources)
+            except FileNotFoundError as error:
+                raise CommandError(f'{bundle_name}: {error}')
+
+            size = len(content.encode('utf-8')) / 1024
+
+            if options['check']:
+                try:
+                    with open(bundle_path(bundle_name), encoding='utf-8') as file:
+                        current = file.read()
+                except OSError:
+                    current = None
+                if current != content:
+                    outdated.append(bundle_name)
+                continue
+
+            if write_bundle(bundle_name, content):
+                self.stdout.write(f'📦 {bundle_name} ({len(sources)} archivos, {size:.1f} KB)')
+            else:
+                self.stdout.write(f'✅ {bundle_name} sin cambios ({size:.1f} KB)')
+
+        if outdated:
+            raise CommandError(
+                'Paquetes desactualizados (ejecutar build_bundles): ' + ', '.join(outdated)
+            )
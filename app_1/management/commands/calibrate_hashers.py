@@ -0,0 +1,206 @@
+"""
+Mide PBKDF2, Argon2 y scrypt en este servidor y elige sus parámetros.
+
+Para cada algoritmo busca el costo que hace que un hash tarde lo más
+cercano posible a --target-ms (sin pasarse, salvo con el costo mínimo) y
+guarda el resultado en PASSWORD_HASHING_CONFIG. Al reiniciar el servidor
+las contraseñas nuevas usan esos parámetros y las existentes se recalculan
+al iniciar sesión (ver app_1/hashers.py).
+
+- PBKDF2: iteraciones (el tiempo es proporcional a las iteraciones)
+- Argon2id: memory_cost fijo (--argon2-memory) y time_cost creciente;
+  si time_cost = 1 ya supera el objetivo, se reduce la memoria
+- scrypt: work_factor (N) en potencias de 2, con r = 8 y p = 1
+
+Las mediciones se hacen en este proceso, un hash a la vez: el pool de
+hashing ejecuta cada hash en un solo núcleo, así que la latencia medida es
+el costo de CPU de un login.
+
+Uso:
+    python manage.py calibrate_hashers
+    python manage.py calibrate_hashers --target-ms 300 --algorithm argon2
+    python manage.py calibrate_hashers --dry-run   # Solo mostrar las mediciones
+"""
+import json
+import os
+import platform
+import secrets
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from app_1.hashers import _argon2_hash, _pbkdf2, _scrypt
+
+ALGORITHMS = ('pbkdf2_sha256', 'argon2', 'scrypt')
+
+# Iteraciones mínimas de PBKDF2-SHA256: las de Django, para que un servidor
+# lento no recalcule los hashes existentes con menos iteraciones
+PBKDF2_MIN_ITERATIONS = PBKDF2PasswordHasher.iterations
+
+# Costos mínimos de Argon2id y scrypt (recomendaciones de OWASP)
+ARGON2_MIN_MEMORY = 19 * 1024  # KiB
+SCRYPT_MIN_WORK_FACTOR = 2 ** 14
+
+# Límites para no calibrar valores absurdos en un servidor muy rápido
+ARGON2_MAX_TIME_COST = 20
+SCRYPT_MAX_WORK_FACTOR = 2 ** 22
+
+
+def measure(function, *args, samples=3):
+    """Mediana en milisegundos de varias ejecuciones de una función."""
+    times = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        function(*args)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+class Command(BaseCommand):
+    help = 'Mide los algoritmos de hashing de contraseñas y guarda los parámetros para un tiempo objetivo.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target-ms',
+            type=float,
+            default=250,
+            help='Milisegundos objetivo por hash (por defecto 250).',
+        )
+        parser.add_argument(
+            '--algorithm',
+            choices=ALGORITHMS,
+            help='Algoritmo para las contraseñas nuevas (por defecto el actual de la configuración, o pbkdf2_sha256).',
+        )
+        parser.add_argument(
+            '--argon2-memory',
+            type=int,
+            default=64 * 1024,
+            help='Memoria por hash de Argon2 en KiB (por defecto 65536 = 64 MiB).',
+        )
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=3,
+            help='Mediciones por valor probado (se usa la mediana).',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Mostrar las mediciones sin escribir la configuración.',
+        )
+
+    def handle(self, *args, **options):
+        self.target = options['target_ms']
+        self.samples = options['samples']
+        if self.target <= 0:
+            raise CommandError('--target-ms debe ser mayor que 0.')
+
+        self.password = secrets.token_urlsafe(12).encode()
+        self.salt = secrets.token_urlsafe(16).encode()
+
+        self.stdout.write(
+            f'⏱️  Calibrando para {self.target:.0f} ms por hash en {platform.node()} '
+            f'({os.cpu_count()} CPU)'
+        )
+
+        params, measured = {}, {}
+        for algorithm, calibrate in (
+            ('pbkdf2_sha256', self.calibrate_pbkdf2),
+            ('argon2', lambda: self.calibrate_argon2(options['argon2_memory'])),
+            ('scrypt', self.calibrate_scrypt),
+        ):
+            result = calibrate()
+            if result is None:
+                continue
+            params[algorithm], measured[algorithm] = result
+            values = ', '.join(f'{name}={value}' for name, value in params[algorithm].items())
+            self.stdout.write(f'   {algorithm:<14} {values:<45} {measured[algorithm]:7.1f} ms')
+
+        config = self.read_config()
+        algorithm = options['algorithm'] or config.get('algorithm', 'pbkdf2_sha256')
+        if algorithm not in params:
+            raise CommandError(f'{algorithm} no está disponible en este servidor.')
+
+        if options['dry_run']:
+            self.stdout.write(f'ℹ️  --dry-run: no se escribió {settings.PASSWORD_HASHING_CONFIG}')
+            return
+
+        config = {
+            'algorithm': algorithm,
+            'target_ms': self.target,
+            'measured_ms': measured,
+            'params': params,
+            'host': platform.node(),
+            'cpu_count': os.cpu_count(),
+            'calibrated_at': timezone.now().isoformat(timespec='seconds'),
+        }
+        with open(settings.PASSWORD_HASHING_CONFIG, 'w', encoding='utf-8') as file:
+            json.dump(config, file, indent=2)
+            file.write('\n')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {algorithm} ({measured[algorithm]:.1f} ms) guardado en {settings.PASSWORD_HASHING_CONFIG}; '
+            f'reiniciar el servidor para aplicarlo'
+        ))
+
+    def read_config(self):
+        """Configuración actual, o {} si todavía no se calibró."""
+        try:
+            with open(settings.PASSWORD_HASHING_CONFIG, encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def calibrate_pbkdf2(self):
+        """Iteraciones de PBKDF2-SHA256 para el tiempo objetivo (redondeadas a 10.000)."""
+        probe = 100000
+        elapsed = measure(_pbkdf2, 'sha256', self.password, self.salt, probe, samples=self.samples)
+        iterations = max(PBKDF2_MIN_ITERATIONS, int(probe * self.target / elapsed) // 10000 * 10000)
+        elapsed = measure(_pbkdf2, 'sha256', self.password, self.salt, iterations, samples=self.samples)
+        return {'iterations': iterations}, elapsed
+
+    def calibrate_argon2(self, memory_cost):
+        """time_cost y memory_cost de Argon2id (paralelismo 1) para el tiempo objetivo."""
+        try:
+            import argon2  # noqa: F401
+        except ImportError:
+            self.stdout.write('   argon2         ⚠️  argon2-cffi no está instalado; se omite')
+            return None
+
+        def run(time_cost, memory):
+            return measure(_argon2_hash, self.password, self.salt, time_cost, memory, 1,
+                           samples=self.samples)
+
+        # Reducir la memoria si ni siquiera una pasada cabe en el objetivo
+        elapsed = run(1, memory_cost)
+        while elapsed > self.target and memory_cost // 2 >= ARGON2_MIN_MEMORY:
+            memory_cost //= 2
+            elapsed = run(1, memory_cost)
+
+        time_cost = 1
+        while time_cost < ARGON2_MAX_TIME_COST:
+            next_elapsed = run(time_cost + 1, memory_cost)
+            if next_elapsed > self.target:
+                break
+            time_cost, elapsed = time_cost + 1, next_elapsed
+
+        return {'time_cost': time_cost, 'memory_cost': memory_cost, 'parallelism': 1}, elapsed
+
+    def calibrate_scrypt(self):
+        """work_factor de scrypt (potencia de 2) para el tiempo objetivo."""
+        def run(n):
+            return measure(_scrypt, self.password, self.salt, n, 8, 1, samples=self.samples)
+
+        work_factor = SCRYPT_MIN_WORK_FACTOR
+        elapsed = run(work_factor)
+        while work_factor < SCRYPT_MAX_WORK_FACTOR:
+            next_elapsed = run(work_factor * 2)
+            if next_elapsed > self.target:
+                break
+            work_factor, elapsed = work_factor * 2, next_elapsed
+
+        return {'work_factor': work_factor, 'block_size': 8, 'parallelism': 1}, elapsed
@@ -0,0 +1,84 @@
+"""
+Exporta los usuarios o sus sesiones a CSV o JSONL por streaming.
+
+Usa las mismas columnas que las acciones de exportación del admin y escribe
+las filas a medida que las lee (ver proyecto/exports.py), así que la
+memoria no crece con la cantidad de usuarios.
+
+Uso:
+    python manage.py export_users --output usuarios.csv
+    python manage.py export_users --format jsonl --filter is_active=true > usuarios.jsonl
+    python manage.py export_users --sessions --filter user__email=ana@ejemplo.com
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.core.exceptions import FieldError
+
+from proyecto.exports import iter_export
+
+from app_1.admin import CustomUserAdmin, UserSessionAdmin
+from app_1.models import CustomUser, UserSession
+
+FILTER_VALUES = {'true': True, 'false': False, 'null': None}
+
+
+def parse_filters(filters):
+    """Convierte ['campo=valor', ...] en argumentos de filter()."""
+    lookups = {}
+    for item in filters:
+        name, separator, value = item.partition('=')
+        if not separator or not name:
+            raise CommandError(f'Filtro inválido "{item}"; usar campo=valor')
+        lookups[name] = FILTER_VALUES.get(value.lower(), value)
+    return lookups
+
+
+class Command(BaseCommand):
+    help = 'Exporta usuarios o sesiones a CSV o JSONL sin cargarlos en memoria.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sessions',
+            action='store_true',
+            help='Exportar las sesiones de usuario en lugar de los usuarios.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=('csv', 'jsonl'),
+            default='csv',
+            help='Formato de salida (por defecto csv).',
+        )
+        parser.add_argument(
+            '--output',
+            help='Archivo de salida (por defecto la salida estándar).',
+        )
+        parser.add_argument(
+            '--filter',
+            action='append',
+            default=[],
+            metavar='CAMPO=VALOR',
+            help='Filtro del queryset, por ejemplo is_active=true o date_joined__gte=2025-01-01 (repetible).',
+        )
+
+    def handle(self, *args, **options):
+        if options['sessions']:
+            queryset, fields = UserSession.objects.order_by('pk'), UserSessionAdmin.export_fields
+        else:
+            queryset, fields = CustomUser.objects.order_by('pk'), CustomUserAdmin.export_fields
+
+        try:
+            queryset = queryset.filter(**parse_filters(options['filter']))
+        except (FieldError, ValueError) as error:
+            raise CommandError(f'Filtro inválido: {error}')
+
+        lines = iter_export(queryset, fields, options['format'])
+        if not options['output']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+
+        rows = -1 if options['format'] == 'csv' else 0  # Sin contar el encabezado
+        with open(options['output'], 'w', newline='', encoding='utf-8') as file:
+            for line in lines:
+                file.write(line)
+                rows += 1
+        self.stderr.write(f'📤 {rows} filas exportadas a {options["output"]}')
@@ -0,0 +1,355 @@
+"""
+Importa usuarios en bloque desde un archivo CSV o JSONL.
+
+El archivo se lee fila por fila (no se carga completo en memoria) y se
+procesa en lotes de --batch-size filas:
+
+1. Cada fila se valida con las reglas del registro: email normalizado a
+   minúsculas, nombre y apellido obligatorios y AUTH_PASSWORD_VALIDATORS
+2. Los emails repetidos en el archivo o ya registrados se omiten (una
+   consulta por lote), así que importar dos veces el mismo archivo no
+   duplica usuarios
+3. Las contraseñas se calculan en un pool de procesos mientras se escribe
+   el lote anterior
+4. Cada lote se inserta con bulk_create(ignore_conflicts=True): si otro
+   proceso registra el mismo email a la vez, la fila se omite sin error
+5. Con --send-verification, los emails de verificación de cada lote se
+   envían juntos por una sola conexión al servidor de correo
+
+Columnas: email, first_name, last_name y, opcionales, password (sin ella el
+usuario deberá restablecer su contraseña), terms_accepted y
+newsletter_subscription (1/0, true/false, sí/no).
+
+Uso:
+    python manage.py import_users usuarios.csv
+    python manage.py import_users usuarios.jsonl --send-verification --base-url https://ejemplo.com
+    python manage.py import_users usuarios.csv --dry-run --rejects rechazados.csv
+"""
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from app_1.models import CustomUser
+from app_1.utils import generate_verification_token, send_verification_emails
+
+REQUIRED_COLUMNS = ('email', 'first_name', 'last_name')
+
+TRUE_VALUES = {'1', 'true', 'si', 'sí', 'yes', 'x'}
+
+# Rechazos que se muestran en pantalla cuando no se usa --rejects
+MAX_PRINTED_REJECTS = 20
+
+
+def _init_worker():
+    """Inicializa Django en cada proceso del pool de hashing."""
+    import django
+
+    django.setup()
+    # El proceso ya es parte de un pool: no crear otro dentro (ver app_1/hashers.py)
+    settings.PASSWORD_HASHING_WORKERS = 0
+
+
+def _hash_passwords(passwords):
+    """Calcula los hashes de una parte del lote (se ejecuta en el pool)."""
+    return [make_password(password or None) for password in passwords]
+
+
+def parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value or '').strip().lower() in TRUE_VALUES
+
+
+def iter_rows(path, file_format):
+    """
+    Lee el archivo fila por fila.
+
+    Yields:
+        tuple: (número de línea, fila como dict o None, error o None)
+    """
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        if file_format == 'csv':
+            reader = csv.DictReader(file)
+            missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or [])]
+            if missing:
+                raise CommandError(f'Faltan columnas en el CSV: {", ".join(missing)}')
+            for row in reader:
+                yield reader.line_num, row, None
+            return
+
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as error:
+                yield number, None, f'JSON inválido: {error}'
+                continue
+            if not isinstance(row, dict):
+                yield number, None, 'Cada línea debe ser un objeto JSON'
+                continue
+            yield number, row, None
+
+
+def build_user(row):
+    """
+    Valida una fila con las reglas del registro.
+
+    Returns:
+        tuple: (usuario sin guardar, contraseña, lista de errores)
+    """
+    errors = []
+    email = str(row.get('email') or '').lower().strip()
+    first_name = str(row.get('first_name') or '').strip()
+    last_name = str(row.get('last_name') or '').strip()
+    password = str(row.get('password') or '')
+
+    try:
+        validate_email(email)
+        if len(email) > CustomUser._meta.get_field('email').max_length:
+            raise ValidationError('email demasiado largo')
+    except ValidationError:
+        errors.append('Correo electrónico inválido.')
+    for label, value in (('nombre', first_name), ('apellido', last_name)):
+        if not value:
+            errors.append(f'El {label} es obligatorio.')
+        elif len(value) > 150:
+            errors.append(f'El {label} no debe exceder los 150 caracteres.')
+
+    user = CustomUser(
+        email=email,
+        username=email,
+        first_name=first_name,
+        last_name=last_name,
+        terms_accepted=parse_bool(row.get('terms_accepted')),
+        newsletter_subscription=parse_bool(row.get('newsletter_subscription')),
+    )
+    if password:
+        try:
+            validate_password(password, user)
+        except ValidationError as error:
+            errors.extend(error.messages)
+
+    return user, password, errors
+
+
+class Command(BaseCommand):
+    help = 'Importa usuarios desde un archivo CSV o JSONL en lotes, sin duplicar los existentes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Archivo .csv o .jsonl')
+        parser.add_argument(
+            '--format',
+            choices=('csv', 'jsonl'),
+            help='Formato del archivo (por defecto según la extensión).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Filas por lote (validación, hashing e inserción).',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Procesos para calcular las contraseñas (0 = en este proceso).',
+        )
+        parser.add_argument(
+            '--send-verification',
+            action='store_true',
+            help='Enviar el email de verificación a los usuarios creados.',
+        )
+        parser.add_argument(
+            '--base-url',
+            default=settings.HOSTING_URL,
+            help='URL del sitio para los enlaces de verificación (por defecto HOSTING_URL).',
+        )
+        parser.add_argument(
+            '--rejects',
+            help='Archivo CSV donde guardar las filas rechazadas y el motivo.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo validar; no calcular contraseñas ni escribir en la base de datos.',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        self.batch_size = max(1, options['batch_size'])
+        self.workers = max(0, options['workers'])
+        self.send_verification = options['send_verification']
+        self.base_url = options['base_url']
+        self.dry_run = options['dry_run']
+        self.verbosity = options['verbosity']
+
+        if self.send_verification and not self.base_url:
+            raise CommandError('--send-verification requiere --base-url (o HOSTING_URL).')
+        if not os.path.exists(path):
+            raise CommandError(f'No existe el archivo {path}')
+
+        self.stats = {'rows': 0, 'created': 0, 'existing': 0, 'rejected': 0, 'emails': 0}
+        self.rejects = []
+        self.reject_writer = None
+        self.executor = None
+        reject_file = open(options['rejects'], 'w', newline='', encoding='utf-8') if options['rejects'] else None
+        if reject_file:
+            self.reject_writer = csv.writer(reject_file)
+            self.reject_writer.writerow(['linea', 'email', 'motivo'])
+        if self.workers and not self.dry_run:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+        start = time.perf_counter()
+        try:
+            self.import_rows(iter_rows(path, file_format))
+        finally:
+            if self.executor:
+                self.executor.shutdown(cancel_futures=True)
+            if reject_file:
+                reject_file.close()
+        elapsed = time.perf_counter() - start
+
+        self.report(elapsed, options['rejects'])
+
+    def import_rows(self, rows):
+        """Valida las filas en lotes y escribe cada lote mientras se calcula el siguiente."""
+        seen = set()
+        batch = []
+        pending = None
+
+        for number, row, error in rows:
+            self.stats['rows'] += 1
+            if error:
+                self.reject(number, '', [error])
+                continue
+
+            user, password, errors = build_user(row)
+            if not errors and user.email in seen:
+                errors = ['Email repetido en el archivo.']
+            if errors:
+                self.reject(number, user.email, errors)
+                continue
+
+            seen.add(user.email)
+            batch.append((user, password))
+            if len(batch) >= self.batch_size:
+                pending = self.process_batch(batch, pending)
+                batch = []
+
+        if batch:
+            pending = self.process_batch(batch, pending)
+        if pending:
+            self.write_batch(*pending)
+
+    def process_batch(self, batch, pending):
+        """
+        Omite los emails ya registrados, empieza a calcular las contraseñas
+        del lote y escribe el lote anterior mientras tanto.
+
+        Returns:
+            tuple: (usuarios, hashes o futures) del lote, para escribirlo después
+        """
+        emails = [user.email for user, _ in batch]
+        existing = set(
+            CustomUser.objects.annotate(email_lower=Lower('email'))
+            .filter(email_lower__in=emails)
+            .values_list('email_lower', flat=True)
+        )
+        batch = [(user, password) for user, password in batch if user.email not in existing]
+        self.stats['existing'] += len(emails) - len(batch)
+
+        if self.dry_run:
+            self.stats['created'] += len(batch)
+            return None
+
+        users = [user for user, _ in batch]
+        passwords = [password for _, password in batch]
+        if self.executor:
+            # Una parte del lote por proceso
+            size = max(1, -(-len(passwords) // self.workers))
+            hashes = [
+                self.executor.submit(_hash_passwords, passwords[index:index + size])
+                for index in range(0, len(passwords), size)
+            ]
+        else:
+            hashes = [_hash_passwords(passwords)]
+
+        if pending:
+            self.write_batch(*pending)
+        return users, hashes
+
+    def write_batch(self, users, hashes):
+        """Inserta un lote y envía sus emails de verificación."""
+        passwords = []
+        for part in hashes:
+            passwords.extend(part.result() if hasattr(part, 'result') else part)
+
+        now = timezone.now()
+        for user, password in zip(users, passwords):
+            user.password = password
+            user.date_joined = now
+            user.dashboard_updated_at = now
+            if self.send_verification:
+                user.email_verification_token = generate_verification_token()
+                user.email_verification_sent_at = now
+
+        with transaction.atomic():
+            CustomUser.objects.bulk_create(users, batch_size=self.batch_size, ignore_conflicts=True)
+
+        # Con ignore_conflicts no se sabe qué filas se insertaron: son las
+        # que tienen el hash recién calculado (la sal es única)
+        ours = {user.email: user.password for user in users}
+        created = [
+            user for user in CustomUser.objects.filter(email__in=ours)
+            if ours[user.email] == user.password
+        ]
+        self.stats['created'] += len(created)
+        self.stats['existing'] += len(users) - len(created)
+
+        if self.send_verification and created:
+            try:
+                self.stats['emails'] += send_verification_emails(created, self.base_url)
+            except Exception as error:
+                self.stderr.write(f'⚠️  No se pudieron enviar {len(created)} emails de verificación: {error}')
+
+        if self.verbosity >= 2:
+            self.stdout.write(f'📦 Lote de {len(users)} filas: {len(created)} creados')
+
+    def reject(self, number, email, errors):
+        self.stats['rejected'] += 1
+        reason = ' '.join(errors)
+        if self.reject_writer:
+            self.reject_writer.writerow([number, email, reason])
+        elif len(self.rejects) < MAX_PRINTED_REJECTS:
+            self.rejects.append((number, email, reason))
+
+    def report(self, elapsed, rejects_path):
+        stats = self.stats
+        for number, email, reason in self.rejects:
+            self.stdout.write(f'   ❌ Línea {number} {email}: {reason}')
+        if not rejects_path and stats['rejected'] > len(self.rejects):
+            self.stdout.write(f'   … y {stats["rejected"] - len(self.rejects)} más (usar --rejects)')
+
+        verb = 'se crearían' if self.dry_run else 'creados'
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {stats["rows"]} filas en {elapsed:.1f} s ({stats["rows"] / max(elapsed, 1e-9):.0f} filas/s): '
+            f'{stats["created"]} {verb}, {stats["existing"]} ya existían, {stats["rejected"]} rechazadas'
+        ))
+        if self.send_verification:
+            self.stdout.write(f'📧 Emails de verificación enviados: {stats["emails"]}')
+        if rejects_path and stats['rejected']:
+            self.stdout.write(f'📝 Filas rechazadas en {rejects_path}')
@@ -0,0 +1,37 @@
+"""
+Muestra los intentos permitidos y rechazados por los límites del login.
+
+Uso:
+    python manage.py rate_limit_stats
+    python manage.py rate_limit_stats --reset   # Mostrar y poner en cero
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from proyecto.ratelimit import rate_limit_stats
+
+
+class Command(BaseCommand):
+    help = 'Muestra los contadores de intentos permitidos y rechazados de cada límite.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Poner los contadores en cero después de mostrarlos.',
+        )
+
+    def handle(self, *args, **options):
+        names = [f'login:{name}' for name in settings.LOGIN_RATE_LIMITS]
+        stats = rate_limit_stats(names, reset=options['reset'])
+
+        for name, counts in stats.items():
+            total = counts['allowed'] + counts['rejected']
+            rejected = counts['rejected'] / total * 100 if total else 0
+            self.stdout.write(
+                f'🚦 {name:<12} permitidos: {counts["allowed"]:>8}   '
+                f'rechazados: {counts["rejected"]:>8} ({rejected:.1f}%)'
+            )
+
+        if options['reset']:
+            self.stdout.write('🧹 Contadores en cero')
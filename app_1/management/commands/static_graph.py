@@ -0,0 +1,73 @@
+"""
+Reporte del grafo de archivos estáticos alcanzables.
+
+Muestra cuántos archivos de STATICFILES_DIRS son alcanzables desde las
+plantillas (y por lo tanto se recolectan), cuántos se descartan y las
+referencias a archivos inexistentes.
+
+Uso:
+    python manage.py static_graph
+    python manage.py static_graph --list unreachable
+    python manage.py static_graph --list missing
+"""
+import os
+
+from django.contrib.staticfiles.finders import get_finders
+from django.core.management.base import BaseCommand, CommandError
+
+from proyecto.finders import ReachableFileSystemFinder
+
+
+class Command(BaseCommand):
+    help = 'Muestra los archivos estáticos alcanzables desde las plantillas y los descartados.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--list',
+            choices=['reachable', 'unreachable', 'missing', 'sources'],
+            help='Listar los archivos de una categoría.',
+        )
+
+    def handle(self, *args, **options):
+        finder = next(
+            (finder for finder in get_finders() if isinstance(finder, ReachableFileSystemFinder)),
+            None,
+        )
+        if finder is None:
+            raise CommandError(
+                'ReachableFileSystemFinder no está configurado en STATICFILES_FINDERS.'
+            )
+
+        graph = finder.graph
+        all_paths = sorted(set(finder.all_paths()))
+        reachable = [path for path in all_paths if path in graph.reachable]
+        unreachable = [path for path in all_paths if path not in graph.reachable]
+
+        categories = {
+            'reachable': reachable,
+            'unreachable': unreachable,
+            'missing': sorted(f'{path}  (desde {origin})' for origin, path in graph.missing),
+            'sources': graph.sources,
+        }
+        if options['list']:
+            for line in categories[options['list']]:
+                self.stdout.write(line)
+            return
+
+        megabyte = 1024 * 1024
+        reachable_size = sum(os.path.getsize(finder.locate(path)) for path in reachable)
+        unreachable_size = sum(os.path.getsize(finder.locate(path)) for path in unreachable)
+
+        self.stdout.write('📁 Archivos estáticos de STATICFILES_DIRS:')
+        self.stdout.write(f'   Plantillas y patrones analizados: {len(graph.sources)}')
+        self.stdout.write(
+            f'   Alcanzables:    {len(reachable):5d} archivos  {reachable_size / megabyte:7.1f} MB'
+        )
+        self.stdout.write(
+            f'   Descartados:    {len(unreachable):5d} archivos  {unreachable_size / megabyte:7.1f} MB'
+        )
+        if graph.missing:
+            self.stdout.write(self.style.WARNING(
+                f'   Referencias a archivos inexistentes: {len(graph.missing)} '
+                f'(ver --list missing)'
+            ))
@@ -0,0 +1,79 @@
+"""
+Genera los subconjuntos de las fuentes de iconos usados por las plantillas.
+
+Después de agregar o quitar iconos en plantillas o JS:
+    python manage.py subset_icons
+
+El comando también regenera los paquetes (build_bundles), que incluyen el
+CSS de iconos recortado.
+
+Uso:
+    python manage.py subset_icons
+    python manage.py subset_icons --list   # Solo mostrar los iconos encontrados
+"""
+import os
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from proyecto.bundles import bundle_path, write_bundle
+from proyecto.icons import (
+    SUBSET_DIR,
+    build_icon_css,
+    find_css_codepoints,
+    find_used_icons,
+    icon_sources,
+    load_glyph_map,
+    subset_font,
+)
+
+
+class Command(BaseCommand):
+    help = 'Recorta las fuentes de iconos a los iconos usados en plantillas y JS.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='Mostrar los iconos encontrados sin generar archivos.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from fontTools import subset  # noqa: F401
+        except ImportError:
+            raise CommandError('fonttools no está instalado: pip install fonttools brotli')
+
+        glyphs = load_glyph_map()
+        used = find_used_icons(glyphs)
+
+        if options['list']:
+            for name in sorted(used):
+                self.stdout.write(name)
+            return
+
+        try:
+            sources = icon_sources()
+        except FileNotFoundError as error:
+            raise CommandError(str(error))
+
+        self.stdout.write(f'🔍 Iconos usados: {len(used)} de {len(glyphs)} disponibles')
+
+        css_codepoints = find_css_codepoints()
+        self.stdout.write(f'🔍 Glifos usados directamente en CSS: {len(css_codepoints)}')
+
+        codepoints = sorted(set(used.values()) | css_codepoints)
+        kilobyte = 1024
+        for key, source_path in sources.items():
+            output_path = bundle_path(f'{SUBSET_DIR}/{key}.woff2')
+            subset_font(source_path, codepoints, output_path)
+            self.stdout.write(
+                f'   {key:<15} {os.path.getsize(source_path) / kilobyte:8.1f} KB -> '
+                f'{os.path.getsize(output_path) / kilobyte:6.1f} KB'
+            )
+
+        if write_bundle(settings.ICON_CSS, build_icon_css(used)):
+            self.stdout.write(f'🎨 {settings.ICON_CSS} actualizado')
+
+        call_command('build_bundles', stdout=self.stdout)
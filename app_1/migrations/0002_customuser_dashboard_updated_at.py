@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 08:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_1', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='dashboard_updated_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='última actualización del dashboard'),
+        ),
+    ]
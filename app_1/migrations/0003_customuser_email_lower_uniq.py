@@ -0,0 +1,52 @@
+# Generated by Django 5.2.3 on 2026-10-19 08:52
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+# Emails duplicados que se muestran en el error
+MAX_REPORTED = 20
+
+
+def check_duplicate_emails(apps, schema_editor):
+    """
+    Falla con un mensaje claro si hay emails que solo difieren en
+    mayúsculas: la restricción no se puede crear con ellos, y se dejan para
+    revisión manual en lugar de fusionar o eliminar cuentas.
+    """
+    CustomUser = apps.get_model('app_1', 'CustomUser')
+    duplicates = (
+        CustomUser.objects.using(schema_editor.connection.alias)
+        .annotate(email_lower=Lower('email'))
+        .values('email_lower')
+        .annotate(total=Count('id'))
+        .filter(total__gt=1)
+        .order_by('email_lower')
+    )
+    emails = [row['email_lower'] for row in duplicates[:MAX_REPORTED + 1]]
+    if emails:
+        listed = ', '.join(emails[:MAX_REPORTED])
+        more = ' (y otros)' if len(emails) > MAX_REPORTED else ''
+        raise RuntimeError(
+            'No se puede crear app_1_customuser_email_lower_uniq: hay usuarios '
+            f'con el mismo email en distintas mayúsculas: {listed}{more}. '
+            'Unifica o corrige esas cuentas y vuelve a ejecutar migrate.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_1', '0002_customuser_dashboard_updated_at'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='app_1_customuser_email_lower_uniq', violation_error_message='Ya existe un usuario con este correo electrónico.'),
+        ),
+    ]
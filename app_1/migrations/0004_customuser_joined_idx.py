@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 09:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_1', '0003_customuser_email_lower_uniq'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['date_joined', 'id'], name='app_1_custom_joined_idx'),
+        ),
+    ]
@@ -0,0 +1,74 @@
+"""
+Índices para la búsqueda del admin (proyecto/search.py), según el motor:
+
+- PostgreSQL: extensión pg_trgm e índices GIN de trigramas sobre
+  UPPER(columna), la expresión que Django usa en icontains. Si la extensión
+  no se puede instalar (usuario sin permisos), se omiten con un aviso y la
+  búsqueda funciona sin índice
+- MySQL: índices B-tree de nombre y apellido para la búsqueda por prefijo
+- Otros motores: nada
+
+El índice de la IP de las sesiones es un índice normal del modelo.
+"""
+import warnings
+
+from django.db import migrations, models, transaction
+
+# (nombre, tabla, columna)
+TRIGRAM_INDEXES = (
+    ('app_1_customuser_email_trgm', 'app_1_customuser', 'email'),
+    ('app_1_customuser_first_name_trgm', 'app_1_customuser', 'first_name'),
+    ('app_1_customuser_last_name_trgm', 'app_1_customuser', 'last_name'),
+)
+
+# email y session_key ya tienen el índice de su restricción UNIQUE
+PREFIX_INDEXES = (
+    ('app_1_customuser_first_name_idx', 'app_1_customuser', 'first_name'),
+    ('app_1_customuser_last_name_idx', 'app_1_customuser', 'last_name'),
+)
+
+
+def create_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        try:
+            with transaction.atomic(using=connection.alias):
+                schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        except Exception as error:
+            warnings.warn(
+                f'No se pudo instalar pg_trgm ({error}); la búsqueda del admin funcionará sin índices',
+                RuntimeWarning,
+            )
+            return
+        for name, table, column in TRIGRAM_INDEXES:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (UPPER({column}::text) gin_trgm_ops)'
+            )
+    elif connection.vendor == 'mysql':
+        for name, table, column in PREFIX_INDEXES:
+            schema_editor.execute(f'CREATE INDEX {name} ON {table} ({column})')
+
+
+def drop_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        for name, _, _ in TRIGRAM_INDEXES:
+            schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+    elif connection.vendor == 'mysql':
+        for name, table, _ in PREFIX_INDEXES:
+            schema_editor.execute(f'DROP INDEX {name} ON {table}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_1', '0004_customuser_joined_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(fields=['ip_address'], name='app_1_usersession_ip_idx'),
+        ),
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
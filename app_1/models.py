@@ -1,9 +1,26 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.hashers import acheck_password, check_password
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django.contrib.sessions.models import Session
 
 
+# Mensaje cuando el email ya está registrado (campo, restricción y formulario)
+DUPLICATE_EMAIL_MESSAGE = 'Ya existe un usuario con este correo electrónico.'
+
+# Campos del usuario que se muestran en el dashboard
+DASHBOARD_FIELDS = frozenset({
+    'first_name',
+    'last_name',
+    'email',
+    'email_verified',
+    'newsletter_subscription',
+    'date_joined',
+})
+
+
 class CustomUser(AbstractUser):
     """
     Modelo de usuario personalizado que extiende AbstractUser de Django.
@@ -13,7 +30,7 @@ class CustomUser(AbstractUser):
         'correo electrónico',
         unique=True,
         error_messages={
-            'unique': 'Ya existe un usuario con este correo electrónico.',
+            'unique': DUPLICATE_EMAIL_MESSAGE,
         }
     )
 
@@ -66,6 +83,14 @@ class CustomUser(AbstractUser):
         default=False
     )
 
+    # Fecha del último cambio visible en el dashboard (perfil o sesiones);
+    # se usa como versión para responder 304 Not Modified
+    dashboard_updated_at = models.DateTimeField(
+        'última actualización del dashboard',
+        blank=True,
+        null=True
+    )
+
     # Usar email como nombre de usuario
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username', 'first_name', 'last_name']
@@ -74,10 +99,62 @@ class CustomUser(AbstractUser):
         verbose_name = 'usuario'
         verbose_name_plural = 'usuarios'
         ordering = ['-date_joined']
+        constraints = [
+            # Un email por usuario sin importar mayúsculas: el registro inserta
+            # directamente y la base de datos rechaza los duplicados
+            models.UniqueConstraint(
+                Lower('email'),
+                name='app_1_customuser_email_lower_uniq',
+                violation_error_message=DUPLICATE_EMAIL_MESSAGE,
+            ),
+        ]
+        indexes = [
+            # Orden del listado del admin y su paginación por clave
+            models.Index(fields=['date_joined', 'id'], name='app_1_custom_joined_idx'),
+        ]
 
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        """Actualiza la versión del dashboard si cambia algún campo que muestra."""
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or DASHBOARD_FIELDS.intersection(update_fields):
+            self.dashboard_updated_at = timezone.now()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'dashboard_updated_at'}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def touch_dashboard(cls, user_ids):
+        """Marca como modificado el dashboard de los usuarios (sin señales ni save)."""
+        from .backends import invalidate_cached_users
+
+        cls.objects.filter(pk__in=user_ids).update(dashboard_updated_at=timezone.now())
+        # update() no emite post_save: descartar también la copia en caché
+        invalidate_cached_users(user_ids)
+
+    def check_password(self, raw_password):
+        """
+        Verifica la contraseña; si su hash usa otro algoritmo o parámetros
+        (ver calibrate_hashers), lo recalcula sin emitir señales ni
+        password_changed (ver rehash_password).
+        """
+        from .hashers import rehash_password
+
+        return check_password(
+            raw_password, self.password, lambda raw: rehash_password(self, raw)
+        )
+
+    async def acheck_password(self, raw_password):
+        """Versión asíncrona de check_password()."""
+        from .hashers import rehash_password
+
+        async def setter(raw):
+            await sync_to_async(rehash_password)(self, raw)
+
+        return await acheck_password(raw_password, self.password, setter)
+
     def get_full_name(self):
         """Retorna el nombre completo del usuario."""
         return f"{self.first_name} {self.last_name}".strip()
@@ -93,6 +170,12 @@ class CustomUser(AbstractUser):
         self.email_verification_token = None
         self.save(update_fields=['email_verified', 'email_verification_token'])
 
+    async def averify_email(self):
+        """Versión async de verify_email (vistas async, ver app_1/async_views.py)."""
+        self.email_verified = True
+        self.email_verification_token = None
+        await self.asave(update_fields=['email_verified', 'email_verification_token'])
+
 
 class UserSession(models.Model):
     """
@@ -135,6 +218,8 @@ class UserSession(models.Model):
         indexes = [
             models.Index(fields=['user', 'session_key']),
             models.Index(fields=['session_key']),
+            # Búsqueda por IP en el admin
+            models.Index(fields=['ip_address'], name='app_1_usersession_ip_idx'),
         ]
 
     def __str__(self):
@@ -190,3 +275,15 @@ class UserSession(models.Model):
             if not session.is_valid():
                 session.delete()
 
+    @classmethod
+    async def acleanup_invalid_sessions(cls, user):
+        """
+        Versión async de cleanup_invalid_sessions: elimina en una sola
+        consulta las sesiones sin una sesión de Django vigente.
+        """
+        valid = Session.objects.filter(
+            session_key=models.OuterRef('session_key'),
+            expire_date__gt=timezone.now(),
+        )
+        await cls.objects.filter(user=user).exclude(models.Exists(valid)).adelete()
+
@@ -0,0 +1,117 @@
+"""
+Eventos de la sesión enviados al navegador (server-sent events).
+
+Cada sesión tiene un canal en el broker de proyecto/pubsub.py. Las señales
+(app_1/signals.py) publican en él:
+- 'expiry': la sesión se renovó (cada request la guarda de nuevo con
+  SESSION_SAVE_EVERY_REQUEST); trae los segundos que faltan para que venza
+- 'revoked': la sesión se eliminó (cerrada desde otro dispositivo con
+  terminate_session, logout o desde el admin)
+
+session_event_stream() reenvía esos eventos a la conexión SSE de la página
+(vista session_events, app_1/async_views.py) y agrega 'expired' cuando la
+sesión vence sin renovarse. session-timeout.js programa la advertencia y el
+cierre con esos datos, sin consultar al servidor periódicamente.
+
+Los canales usan un hash de la clave de sesión: la clave no aparece en Redis.
+"""
+import hashlib
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.db import transaction
+from django.utils import timezone
+
+from proyecto.pubsub import get_broker
+
+logger = logging.getLogger(__name__)
+
+# Milisegundos que espera el navegador antes de reconectarse
+RETRY_MS = 5000
+
+
+def session_channel(session_key):
+    """Canal del broker para los eventos de una sesión."""
+    return 'session:' + hashlib.sha256(session_key.encode()).hexdigest()[:32]
+
+
+def publish_session_event(session_key, event, data=None):
+    """
+    Publica un evento de la sesión al confirmar la transacción actual.
+    Un error del broker no interrumpe el request.
+    """
+    message = {'event': event, 'data': data or {}}
+
+    def send():
+        try:
+            get_broker().publish(session_channel(session_key), message)
+        except Exception as error:
+            logger.warning('No se pudo publicar el evento %s de la sesión: %s', event, error)
+
+    transaction.on_commit(send)
+
+
+def sse_message(event, data=None):
+    """Mensaje en el formato de text/event-stream."""
+    return f'event: {event}\ndata: {json.dumps(data or {})}\n\n'
+
+
+def expiry_message(expires_at):
+    # Segundos restantes en lugar de la fecha: el reloj del navegador puede diferir
+    return sse_message('expiry', {'expires_in': max(0, round(expires_at - time.time()))})
+
+
+async def session_expiry(session_key):
+    """Timestamp en que vence la sesión, o None si ya no existe o venció."""
+    expire_date = await Session.objects.filter(
+        session_key=session_key,
+        expire_date__gt=timezone.now(),
+    ).values_list('expire_date', flat=True).afirst()
+    return expire_date.timestamp() if expire_date else None
+
+
+async def session_event_stream(session_key):
+    """
+    Eventos de la sesión en formato text/event-stream hasta que se cierra
+    o vence (o hasta que el navegador se desconecta).
+    """
+    broker = get_broker()
+    heartbeat = settings.SESSION_EVENTS_HEARTBEAT
+    yield f'retry: {RETRY_MS}\n\n'
+
+    # Suscribirse antes de leer la expiración para no perder eventos
+    async with broker.subscribe(session_channel(session_key)) as subscription:
+        expires_at = await session_expiry(session_key)
+        if expires_at is None:
+            yield sse_message('revoked')
+            return
+        yield expiry_message(expires_at)
+
+        while True:
+            message = await subscription.get(min(heartbeat, max(0, expires_at - time.time())))
+            if message is not None:
+                if message['event'] == 'revoked':
+                    yield sse_message('revoked')
+                    return
+                if message['event'] == 'expiry':
+                    expires_at = message['data']['expires_at']
+                    yield expiry_message(expires_at)
+                continue
+
+            # Al vencer, o en cada latido si el broker no cruza procesos o la
+            # suscripción se cayó (la sesión pudo renovarse o cerrarse en otro
+            # worker), verificar en la base de datos
+            now = time.time()
+            if now >= expires_at or not (broker.shared and subscription.active):
+                current = await session_expiry(session_key)
+                if current is None:
+                    yield sse_message('expired' if now >= expires_at else 'revoked')
+                    return
+                if current != expires_at:
+                    expires_at = current
+                    yield expiry_message(expires_at)
+                    continue
+            yield ': ping\n\n'
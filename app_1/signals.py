@@ -0,0 +1,95 @@
+"""
+Señales de la aplicación.
+
+- Mantienen actualizada la versión del dashboard (CustomUser.dashboard_updated_at)
+  cuando cambian las sesiones del usuario, para que las respuestas 304 del
+  dashboard nunca muestren una lista de sesiones desactualizada
+- Descartan el usuario en caché (CachedModelBackend) cuando se guarda o elimina
+- Descartan los permisos en caché cuando cambian los grupos o permisos
+- Avisan a las páginas abiertas de cada sesión cuando se renueva o se
+  elimina (app_1/session_events.py)
+"""
+from django.contrib.auth.models import Group, Permission
+from django.contrib.sessions.models import Session
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .backends import invalidate_cached_users, invalidate_permissions
+from .models import CustomUser, UserSession
+from .session_events import publish_session_event
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def user_changed(sender, instance, **kwargs):
+    """Se guardó el usuario (perfil, contraseña, verificación, último login) o se eliminó."""
+    invalidate_cached_users([instance.pk])
+    # is_active e is_superuser cambian los permisos efectivos
+    invalidate_permissions([instance.pk])
+
+
+@receiver(m2m_changed, sender=CustomUser.groups.through)
+@receiver(m2m_changed, sender=CustomUser.user_permissions.through)
+def user_permissions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Cambiaron los grupos o permisos directos de un usuario. Desde el lado
+    inverso (group.user_set, permission.user_set) pk_set son usuarios.
+    """
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        invalidate_permissions([instance.pk])
+    elif pk_set:
+        invalidate_permissions(pk_set)
+    else:
+        # clear() desde el grupo o permiso: no se sabe qué usuarios tenía
+        invalidate_permissions()
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def group_permissions_changed(sender, action, **kwargs):
+    """Cambiaron los permisos de un grupo: afecta a todos sus usuarios."""
+    if action.startswith('post_'):
+        invalidate_permissions()
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+def permissions_catalog_changed(sender, **kwargs):
+    """
+    Se creó o eliminó un grupo o permiso (por ejemplo, al migrar); los
+    superusuarios tienen todos los permisos y eliminar un grupo no emite
+    m2m_changed.
+    """
+    invalidate_permissions()
+
+
+@receiver(post_save, sender=UserSession)
+@receiver(post_delete, sender=UserSession)
+def user_session_changed(sender, instance, **kwargs):
+    """Se creó, actualizó o eliminó una sesión registrada del usuario."""
+    CustomUser.touch_dashboard([instance.user_id])
+
+
+@receiver(post_save, sender=Session)
+def session_saved(sender, instance, **kwargs):
+    """Se guardó una sesión de Django: sus páginas abiertas reciben la nueva expiración."""
+    publish_session_event(instance.session_key, 'expiry', {'expires_at': instance.expire_date.timestamp()})
+
+
+@receiver(post_delete, sender=Session)
+def session_deleted(sender, instance, **kwargs):
+    """
+    Se eliminó una sesión de Django (logout, flush, terminate_session o
+    desde el admin); su registro en UserSession deja de ser válido aunque
+    todavía exista y sus páginas abiertas deben volver al login.
+    """
+    publish_session_event(instance.session_key, 'revoked')
+    user_ids = list(
+        UserSession.objects.filter(session_key=instance.session_key)
+        .values_list('user_id', flat=True)
+    )
+    if user_ids:
+        CustomUser.touch_dashboard(user_ids)
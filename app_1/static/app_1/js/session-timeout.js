@@ -3,20 +3,29 @@
  * Manejo de tiempo de espera de sesión con advertencia al usuario
  *
  * Características:
- * - Detecta inactividad del usuario después de un tiempo configurado
- * - Muestra modal de advertencia antes de cerrar sesión
- * - Permite al usuario extender la sesión
- * - Cierra sesión automáticamente si no hay respuesta
+ * - El servidor envía por server-sent events (data-events-url) cuándo vence
+ *   la sesión, cada vez que se renueva en cualquier pestaña o dispositivo
+ * - Muestra modal de advertencia antes de que la sesión venza
+ * - Permite al usuario extender la sesión (data-keepalive-url, sin
+ *   renderizar ninguna página)
+ * - Vuelve al login en cuanto la sesión se cierra desde otro dispositivo
+ * - Sin canal de eventos (WSGI o navegador sin EventSource) usa los tiempos
+ *   de la configuración desde la carga de la página
+ *
+ * Ver app_1/session_events.py
  *
  * @author Proyecto Django
- * @version 1.0.0
+ * @version 2.0.0
  */
 'use strict';
 
 (function() {
+    // Atributos data-* de la etiqueta <script> (solo disponible al cargar)
+    const options = document.currentScript ? document.currentScript.dataset : {};
+
     // Configuración de tiempos (en milisegundos)
     const config = {
-        // Tiempo de inactividad antes de mostrar advertencia (28 minutos)
+        // Tiempo de inactividad antes de mostrar advertencia sin canal de eventos (28 minutos)
         warningTime: 28 * 60 * 1000,  // 28 minutos
 
         // Tiempo de la advertencia antes de cerrar sesión (2 minutos)
@@ -27,8 +36,14 @@
         // URL de logout
         logoutUrl: '/logout/',
 
+        // URL del login (sesión cerrada desde otro dispositivo)
+        loginUrl: options.loginUrl || '/login/',
+
         // URL para mantener sesión viva
-        keepAliveUrl: '/dashboard/',   // Cualquier URL autenticada
+        keepAliveUrl: options.keepaliveUrl || '/session/keepalive/',
+
+        // URL del canal de eventos de la sesión
+        eventsUrl: options.eventsUrl || '/session/events/',
     };
 
     let warningTimer;
@@ -36,18 +51,18 @@
     let countdownInterval;
     let modal;
     let countdownElement;
+    let eventSource;
 
     /**
      * Inicializa el sistema de timeout de sesión
      */
     function init() {
         console.log('🔒 Sistema de timeout de sesión inicializado');
-        console.log('⏱️ Advertencia en:', config.warningTime / 60000, 'minutos');
-        console.log('⏱️ Cierre de sesión en:', (config.warningTime + config.logoutTime) / 60000, 'minutos');
 
         createModal();
+        // Hasta que el servidor indique la expiración real
         resetTimer();
-        setupEventListeners();
+        connectEvents();
     }
 
     /**
@@ -105,9 +120,10 @@
     }
 
     /**
-     * Reinicia los timers de sesión
+     * Programa la advertencia y el cierre según los segundos que faltan
+     * para que venza la sesión
      */
-    function resetTimer() {
+    function scheduleExpiry(expiresIn) {
         // Limpiar timers existentes
         clearTimeout(warningTimer);
         clearTimeout(logoutTimer);
@@ -118,10 +134,63 @@
             modal.modal('hide');
         }
 
-        // Configurar nuevo timer de advertencia
-        warningTimer = setTimeout(showWarning, config.warningTime);
+        const remaining = expiresIn * 1000;
+        warningTimer = setTimeout(showWarning, Math.max(0, remaining - config.logoutTime));
+
+        console.log('⏱️ La sesión vence en:', Math.round(remaining / 60000), 'minutos');
+    }
 
-        console.log('⏱️ Timers reiniciados');
+    /**
+     * Reinicia los timers de sesión con los tiempos de la configuración
+     */
+    function resetTimer() {
+        scheduleExpiry((config.warningTime + config.logoutTime) / 1000);
+    }
+
+    /**
+     * Abre el canal de eventos de la sesión
+     */
+    function connectEvents() {
+        if (!window.EventSource || !config.eventsUrl) {
+            return;
+        }
+
+        eventSource = new EventSource(config.eventsUrl);
+
+        // La sesión se renovó (en esta u otra pestaña o dispositivo)
+        eventSource.addEventListener('expiry', event => {
+            scheduleExpiry(JSON.parse(event.data).expires_in);
+        });
+
+        // La sesión se cerró desde otro dispositivo
+        eventSource.addEventListener('revoked', () => {
+            console.log('🚪 La sesión fue cerrada desde otro dispositivo');
+            closeEvents();
+            window.location.href = config.loginUrl;
+        });
+
+        // La sesión venció sin renovarse
+        eventSource.addEventListener('expired', () => {
+            closeEvents();
+            logoutNow();
+        });
+
+        eventSource.onerror = () => {
+            // CLOSED: el servidor no ofrece el canal (204); se usan los timers locales
+            if (eventSource && eventSource.readyState === EventSource.CLOSED) {
+                console.log('⚠️ Canal de eventos no disponible, usando timers locales');
+            }
+        };
+    }
+
+    /**
+     * Cierra el canal de eventos
+     */
+    function closeEvents() {
+        if (eventSource) {
+            eventSource.close();
+            eventSource = null;
+        }
     }
 
     /**
@@ -184,7 +253,7 @@
     function extendSession() {
         console.log('✅ Sesión extendida por el usuario');
 
-        // Hacer una petición al servidor para mantener la sesión viva
+        // Renovar la sesión en el servidor (las otras pestañas lo reciben por el canal de eventos)
         fetch(config.keepAliveUrl, {
             method: 'GET',
             credentials: 'same-origin',
@@ -192,16 +261,20 @@
                 'X-Requested-With': 'XMLHttpRequest'
             }
         }).then(response => {
-            if (response.ok) {
-                console.log('✅ Sesión renovada en el servidor');
-                resetTimer();
-            } else {
-                console.error('❌ Error al renovar sesión');
-                // Continuar de todas formas en el cliente
-                resetTimer();
+            if (response.redirected) {
+                // La sesión ya no existe: login_required redirigió al login
+                window.location.href = config.loginUrl;
+                return;
+            }
+            if (!response.ok) {
+                throw new Error(response.status);
             }
+            return response.json().then(data => {
+                console.log('✅ Sesión renovada en el servidor');
+                scheduleExpiry(data.expires_in);
+            });
         }).catch(error => {
-            console.error('❌ Error de red:', error);
+            console.error('❌ Error al renovar sesión:', error);
             // Continuar de todas formas en el cliente
             resetTimer();
         });
@@ -217,51 +290,20 @@
         clearTimeout(warningTimer);
         clearTimeout(logoutTimer);
         clearInterval(countdownInterval);
+        closeEvents();
 
         // Redirigir a logout
         window.location.href = config.logoutUrl;
     }
 
     /**
-     * Configura los event listeners para detectar actividad del usuario
-     */
-    function setupEventListeners() {
-        // Eventos que indican actividad del usuario
-        const events = [
-            'mousedown',
-            'mousemove',
-            'keypress',
-            'scroll',
-            'touchstart',
-            'click'
-        ];
-
-        // Agregar listeners para cada evento
-        events.forEach(event => {
-            document.addEventListener(event, handleUserActivity, true);
-        });
-
-        console.log('👂 Event listeners configurados para detectar actividad');
-    }
-
-    /**
-     * Maneja la actividad del usuario
-     */
-    function handleUserActivity() {
-        // Solo resetear si el modal NO está visible
-        // (para evitar resetear mientras se muestra la advertencia)
-        if (!modal || !modal.hasClass('show')) {
-            resetTimer();
-        }
-    }
-
-    /**
-     * Limpia todos los timers y event listeners
+     * Limpia todos los timers y el canal de eventos
      */
     function cleanup() {
         clearTimeout(warningTimer);
         clearTimeout(logoutTimer);
         clearInterval(countdownInterval);
+        closeEvents();
         console.log('🧹 Cleanup completado');
     }
 
@@ -279,6 +321,7 @@
     if (window.location.hostname === 'localhost' || window.location.hostname === '127.0.0.1') {
         window.sessionTimeout = {
             reset: resetTimer,
+            schedule: scheduleExpiry,
             showWarning: showWarning,
             extendSession: extendSession,
             logout: logoutNow,
@@ -1,3 +1,427 @@
-from django.test import TestCase
+import os
+import secrets
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib import admin, messages
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from proyecto.message_storage import CompactCookieStorage
+from proyecto.pagination import AFTER_VAR, BEFORE_VAR, decode_cursor, encode_cursor
+from proyecto.ratelimit import TokenBucket, rate_limit_stats
+
+from .forms import CustomUserRegistrationForm
+from .models import DUPLICATE_EMAIL_MESSAGE, CustomUser
+from .utils import check_login_rate_limit
+from .views import STAFF_USER_COLUMNS
+
+# Cachés de prueba: los límites no usan el directorio tmp/ratelimit-cache
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'default'},
+    'templates': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'templates'},
+    'ratelimit': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'ratelimit'},
+}
+
+# Hasher rápido: las pruebas no pasan por el pool de procesos de app_1/hashers.py
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Hasher preferido distinto del de FAST_HASHERS: fuerza el rehash al verificar
+REHASH_HASHERS = ['django.contrib.auth.hashers.ScryptPasswordHasher', *FAST_HASHERS]
+
+
+@override_settings(CACHES=TEST_CACHES)
+class TokenBucketTests(TestCase):
+    """Cubetas de proyecto/ratelimit.py (user-041)."""
+
+    def tearDown(self):
+        caches['ratelimit'].clear()
+
+    def test_rejects_after_capacity_and_refills(self):
+        bucket = TokenBucket('test', capacity=3, per_minute=6)
+        with mock.patch('proyecto.ratelimit.time.time', return_value=1000.0):
+            self.assertEqual([bucket.take('a') for _ in range(3)], [0, 0, 0])
+            # Sin fichas: una nueva llega en 60 / 6 = 10 segundos
+            self.assertEqual(bucket.take('a'), 10)
+            # Otra identidad tiene su propia cubeta
+            self.assertEqual(bucket.take('b'), 0)
+        with mock.patch('proyecto.ratelimit.time.time', return_value=1010.0):
+            self.assertEqual(bucket.take('a'), 0)
+            self.assertGreater(bucket.take('a'), 0)
+
+    def test_counts_allowed_and_rejected(self):
+        bucket = TokenBucket('test', capacity=1, per_minute=1)
+        bucket.take('a')
+        bucket.take('a')
+        self.assertEqual(rate_limit_stats(['test']), {'test': {'allowed': 1, 'rejected': 1}})
+
+
+@override_settings(
+    CACHES=TEST_CACHES,
+    LOGIN_RATE_LIMITS={
+        'ip': {'capacity': 10, 'per_minute': 1},
+        'email_ip': {'capacity': 2, 'per_minute': 1},
+        'email': {'capacity': 4, 'per_minute': 1},
+    },
+)
+class LoginRateLimitTests(TestCase):
+    """Límites del login antes de calcular el hash (user-041)."""
+
+    def tearDown(self):
+        caches['ratelimit'].clear()
+
+    def attempt(self, email, ip='10.0.0.1'):
+        request = RequestFactory().post('/login/', {'username': email}, REMOTE_ADDR=ip)
+        return check_login_rate_limit(request)
+
+    def test_email_from_one_ip_does_not_lock_out_other_ips(self):
+        self.assertEqual([self.attempt('Ana@Example.com ') for _ in range(2)], [0, 0])
+        # El email se normaliza: es la misma cubeta email|ip
+        self.assertGreater(self.attempt('ana@example.com'), 0)
+        # Quien es dueño de la cuenta, desde otra IP, todavía puede entrar
+        self.assertEqual(self.attempt('ana@example.com', ip='10.0.0.2'), 0)
+
+    def test_email_limit_across_ips(self):
+        for number in range(4):
+            self.assertEqual(self.attempt('ana@example.com', ip=f'10.0.1.{number}'), 0)
+        self.assertGreater(self.attempt('ana@example.com', ip='10.0.2.9'), 0)
+
+    def test_ip_limit(self):
+        for number in range(10):
+            self.assertEqual(self.attempt(f'user{number}@example.com'), 0)
+        self.assertGreater(self.attempt('otro@example.com'), 0)
+
+    def test_login_view_returns_429_without_hashing(self):
+        for _ in range(2):
+            self.attempt('ana@example.com', ip='127.0.0.1')
+        with mock.patch('django.contrib.auth.forms.authenticate') as authenticate:
+            response = self.client.post(
+                reverse('page_login'), {'username': 'ana@example.com', 'password': 'x'}
+            )
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '60')
+        authenticate.assert_not_called()
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class RegistrationEmailTests(TestCase):
+    """Email único sin distinguir mayúsculas al registrarse (user-043)."""
+
+    def setUp(self):
+        CustomUser.objects.create_user(
+            username='Ana@Example.com', email='Ana@Example.com', password='x',
+            first_name='Ana', last_name='Pérez',
+        )
+
+    def form(self, email):
+        return CustomUserRegistrationForm({
+            'email': email,
+            'first_name': 'Ana',
+            'last_name': 'Pérez',
+            'password1': 'Zq8!vLr2#mTx',
+            'password2': 'Zq8!vLr2#mTx',
+            'terms_accepted': 'on',
+        })
+
+    def test_index_rejects_case_variant(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            CustomUser.objects.create_user(username='ana@example.com', email='ana@example.com')
+
+    def test_duplicate_is_a_form_error(self):
+        form = self.form('ANA@example.com')
+        # La validación no consulta la tabla: el duplicado lo detecta el INSERT
+        self.assertTrue(form.is_valid(), form.errors)
+        with self.assertRaises(ValidationError) as context:
+            form.save()
+        self.assertEqual(context.exception.message_dict, {'email': [DUPLICATE_EMAIL_MESSAGE]})
+        self.assertEqual(CustomUser.objects.count(), 1)
+
+    def test_register_view_shows_duplicate(self):
+        data = dict(self.form('ana@EXAMPLE.com').data)
+        response = self.client.post(reverse('page_register'), data, follow=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, DUPLICATE_EMAIL_MESSAGE)
+        self.assertEqual(CustomUser.objects.count(), 1)
+
+    def test_new_email_is_saved_lowercase(self):
+        form = self.form('Beto@Example.com ')
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().email, 'beto@example.com')
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class ImportUsersTests(TestCase):
+    """Comando import_users (user-044)."""
+
+    def write_file(self, content):
+        file = tempfile.NamedTemporaryFile('w', suffix='.csv', encoding='utf-8', delete=False)
+        with file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def import_users(self, path):
+        call_command('import_users', path, workers=0, batch_size=2, stdout=StringIO(), stderr=StringIO())
+
+    def test_import_is_idempotent(self):
+        CustomUser.objects.create_user(username='ya@example.com', email='ya@example.com')
+        path = self.write_file(
+            'email,first_name,last_name,password\n'
+            'Ana@Example.com,Ana,Pérez,Zq8!vLr2#mTx\n'
+            'beto@example.com,Beto,Gómez,\n'
+            'ANA@example.com,Ana,Repetida,\n'
+            'YA@example.com,Ya,Registrado,\n'
+            'no-es-email,Sin,Email,\n'
+            'carla@example.com,,Sin nombre,\n'
+        )
+        self.import_users(path)
+        emails = set(CustomUser.objects.values_list('email', flat=True))
+        self.assertEqual(emails, {'ya@example.com', 'ana@example.com', 'beto@example.com'})
+
+        ana = CustomUser.objects.get(email='ana@example.com')
+        self.assertTrue(ana.check_password('Zq8!vLr2#mTx'))
+        self.assertFalse(CustomUser.objects.get(email='beto@example.com').has_usable_password())
+
+        # Importar de nuevo no crea ni modifica usuarios
+        self.import_users(path)
+        self.assertEqual(CustomUser.objects.count(), 3)
+        ana.refresh_from_db()
+        self.assertTrue(ana.check_password('Zq8!vLr2#mTx'))
+
+    def test_missing_columns(self):
+        path = self.write_file('email,first_name\nana@example.com,Ana\n')
+        with self.assertRaisesMessage(CommandError, 'last_name'):
+            self.import_users(path)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class KeysetPaginationTests(TestCase):
+    """Paginación por clave del admin de usuarios (user-046)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.admin_user = CustomUser.objects.create_superuser(
+            username='admin@example.com', email='admin@example.com', password='x',
+        )
+        CustomUser.objects.filter(pk=cls.admin_user.pk).update(date_joined=now - timedelta(days=10))
+        # Dos pares con la misma fecha: la clave primaria desempata
+        for number, days in enumerate((1, 1, 2, 3, 3)):
+            user = CustomUser.objects.create_user(username=f'u{number}@example.com', email=f'u{number}@example.com')
+            CustomUser.objects.filter(pk=user.pk).update(date_joined=now - timedelta(days=days))
+        cls.expected = list(CustomUser.objects.order_by('-date_joined', '-pk').values_list('pk', flat=True))
+
+    def setUp(self):
+        self.client.force_login(self.admin_user)
+        patcher = mock.patch.object(admin.site._registry[CustomUser], 'list_per_page', 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def changelist(self, query=''):
+        response = self.client.get(reverse('admin:app_1_customuser_changelist') + query)
+        self.assertEqual(response.status_code, 200)
+        cl = response.context['cl']
+        return cl, [user.pk for user in cl.result_list]
+
+    def test_pages_forward_and_back(self):
+        cl, pks = self.changelist()
+        self.assertIsNotNone(cl.keyset)
+        self.assertEqual(pks, self.expected[:2])
+        self.assertIsNone(cl.previous_page_url)
+
+        cl, pks = self.changelist(cl.next_page_url)
+        self.assertEqual(pks, self.expected[2:4])
+        page_two = cl
+
+        cl, pks = self.changelist(cl.next_page_url)
+        self.assertEqual(pks, self.expected[4:])
+        self.assertIsNone(cl.next_page_url)
+
+        cl, pks = self.changelist(cl.previous_page_url)
+        self.assertEqual(pks, self.expected[2:4])
+
+        cl, pks = self.changelist(page_two.previous_page_url)
+        self.assertEqual(pks, self.expected[:2])
+
+    def test_before_first_row_is_first_page(self):
+        first = CustomUser.objects.values_list('date_joined', 'pk').get(pk=self.expected[0])
+        cl, pks = self.changelist(f'?{BEFORE_VAR}={encode_cursor(first)}')
+        self.assertEqual(pks, self.expected[:2])
+        self.assertIsNone(cl.previous_page_url)
+        self.assertIsNotNone(cl.next_page_url)
+
+    def test_after_last_row_is_empty(self):
+        last = CustomUser.objects.values_list('date_joined', 'pk').get(pk=self.expected[-1])
+        cl, pks = self.changelist(f'?{AFTER_VAR}={encode_cursor(last)}')
+        self.assertEqual(pks, [])
+        self.assertIsNone(cl.next_page_url)
+
+    def test_invalid_cursor_redirects(self):
+        for cursor in ('no-es-base64!', encode_cursor(['1']), encode_cursor(['fecha', '1'])):
+            response = self.client.get(reverse('admin:app_1_customuser_changelist'), {AFTER_VAR: cursor})
+            self.assertEqual(response.status_code, 302, cursor)
+
+    def test_cursor_round_trip(self):
+        fields = [CustomUser._meta.get_field('date_joined'), CustomUser._meta.pk]
+        values = CustomUser.objects.values_list('date_joined', 'pk').get(pk=self.expected[0])
+        self.assertEqual(decode_cursor(encode_cursor(values), fields), list(values))
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class StaffUsersDataTests(TestCase):
+    """Endpoint de DataTables del listado del staff (user-048)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = CustomUser.objects.create_user(
+            username='staff@example.com', email='staff@example.com', password='x', is_staff=True,
+        )
+        for name in ('carla', 'ana', 'beto'):
+            CustomUser.objects.create_user(
+                username=f'{name}@example.com', email=f'{name}@example.com', password='x', first_name=name.title(),
+            )
+
+    def setUp(self):
+        self.client.force_login(self.staff)
+
+    def get(self, **params):
+        query = {f'columns[{index}][data]': name for index, name in enumerate(STAFF_USER_COLUMNS)}
+        query.update(draw='1', **params)
+        return self.client.get(reverse('staff_users_data'), query)
+
+    def test_returns_only_whitelisted_columns(self):
+        response = self.get(length='2')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['recordsTotal'], 4)
+        self.assertEqual(len(data['data']), 2)
+        self.assertEqual(set(data['data'][0]), set(STAFF_USER_COLUMNS))
+
+    def test_order_by_unknown_column_is_rejected(self):
+        response = self.get(**{'columns[0][data]': 'password', 'order[0][column]': '0', 'order[0][dir]': 'asc'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.json()['error'])
+        # Un índice de columna que no se envió tampoco se puede ordenar
+        self.assertEqual(self.get(**{'order[0][column]': '99'}).status_code, 400)
+
+    def test_invalid_numbers_and_cursor(self):
+        self.assertEqual(self.get(start='x').status_code, 400)
+        self.assertEqual(self.get(after='no-es-un-cursor').status_code, 400)
+
+    def test_order_search_and_cursor(self):
+        params = {'order[0][column]': '0', 'order[0][dir]': 'asc', 'length': '2'}
+        data = self.get(**params).json()
+        self.assertEqual([row['email'] for row in data['data']], ['ana@example.com', 'beto@example.com'])
+
+        data = self.get(after=data['cursors']['last'], **params).json()
+        self.assertEqual([row['email'] for row in data['data']], ['carla@example.com', 'staff@example.com'])
+
+        data = self.get(**{'search[value]': 'BET'}).json()
+        self.assertEqual(data['recordsFiltered'], 1)
+        self.assertEqual(data['data'][0]['email'], 'beto@example.com')
+
+    def test_requires_staff(self):
+        self.client.force_login(CustomUser.objects.get(email='ana@example.com'))
+        self.assertEqual(self.get().status_code, 302)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class DashboardConditionalGetTests(TestCase):
+    """ETag y 304 del dashboard (user-035)."""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            username='ana@example.com', email='ana@example.com', password='x', first_name='Ana',
+        )
+        self.client.force_login(self.user)
+
+    def test_not_modified_until_profile_changes(self):
+        response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        response = self.client.get(reverse('dashboard'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.user.first_name = 'Ana María'
+        self.user.save()
+        response = self.client.get(reverse('dashboard'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertContains(response, 'Ana María')
+
+
+@override_settings(MESSAGE_MAX_LENGTH=50)
+class CompactCookieStorageTests(TestCase):
+    """Mensajes flash solo en cookie (user-036)."""
+
+    def round_trip(self, *texts, max_cookie_size=None):
+        # Sin request.session: si el almacenamiento la usara, fallaría
+        request = RequestFactory().get('/')
+        storage = CompactCookieStorage(request)
+        if max_cookie_size is not None:
+            storage.max_cookie_size = max_cookie_size
+        for text in texts:
+            storage.add(messages.INFO, text)
+        response = HttpResponse()
+        storage.update(response)
+
+        request = RequestFactory().get('/')
+        request.COOKIES[storage.cookie_name] = response.cookies[storage.cookie_name].value
+        return [str(message) for message in CompactCookieStorage(request)]
+
+    def test_round_trip_without_duplicates(self):
+        self.assertEqual(self.round_trip('Hola', 'Hola', 'Adiós'), ['Hola', 'Adiós'])
+
+    def test_long_messages_are_truncated_then_dropped(self):
+        # Textos que zlib no reduce: solo caben recortados
+        texts = [f'{number} ' + secrets.token_urlsafe(400) for number in range(3)]
+        result = self.round_trip(*texts, max_cookie_size=300)
+        self.assertLess(len(result), len(texts))
+        # Se conservan los más recientes, recortados a MESSAGE_MAX_LENGTH
+        self.assertTrue(result[-1].startswith('2 '))
+        self.assertTrue(all(len(text) <= 50 for text in result))
+
+
+class RehashOnLoginTests(TestCase):
+    """Rehash de la contraseña al verificarla (user-040)."""
+
+    def setUp(self):
+        with self.settings(PASSWORD_HASHERS=FAST_HASHERS):
+            self.user = CustomUser.objects.create_user(
+                username='ana@example.com', email='ana@example.com', password='Zq8!vLr2#mTx',
+            )
+
+    @override_settings(PASSWORD_HASHERS=REHASH_HASHERS)
+    def test_rehash_with_preferred_hasher(self):
+        self.assertTrue(self.user.check_password('Zq8!vLr2#mTx'))
+        self.assertTrue(self.user.password.startswith('scrypt$'))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('scrypt$'))
+        self.assertTrue(self.user.check_password('Zq8!vLr2#mTx'))
+
+    @override_settings(PASSWORD_HASHERS=REHASH_HASHERS)
+    def test_rehash_does_not_overwrite_a_newer_password(self):
+        # La contraseña cambia en otro request después de cargar el usuario
+        new_password = make_password('Otra#Clave9')
+        CustomUser.objects.filter(pk=self.user.pk).update(password=new_password)
+
+        self.assertTrue(self.user.check_password('Zq8!vLr2#mTx'))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password, new_password)
+
+    @override_settings(PASSWORD_HASHERS=REHASH_HASHERS)
+    def test_wrong_password_is_not_rehashed(self):
+        old_password = self.user.password
+        self.assertFalse(self.user.check_password('incorrecta'))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password, old_password)
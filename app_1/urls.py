@@ -1,26 +1,37 @@
 """
 Configuración de URLs para la aplicación app_1.
 """
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# Vistas async del login, el dashboard, la verificación de email y la sesión bajo ASGI
+auth_views = async_views if settings.ASGI_MODE else views
 
 urlpatterns = [
     # Autenticación
-    path('', views.page_login, name='page_login'),
-    path('login/', views.page_login, name='login'),
+    path('', auth_views.page_login, name='page_login'),
+    path('login/', auth_views.page_login, name='login'),
     path('register/', views.page_register, name='page_register'),
     path('logout/', views.user_logout, name='logout'),
 
     # Verificación de email
-    path('verify-email/<str:token>/', views.verify_email, name='verify_email'),
+    path('verify-email/<str:token>/', auth_views.verify_email, name='verify_email'),
 
     # Restablecimiento de contraseña
     path('password-reset/', views.password_reset_request, name='password_reset_request'),
     path('password-reset-confirm/<str:token>/', views.password_reset_confirm, name='password_reset_confirm'),
 
     # Dashboard (protegido)
-    path('dashboard/', views.dashboard, name='dashboard'),
+    path('dashboard/', auth_views.dashboard, name='dashboard'),
 
     # Gestión de sesiones
     path('terminate-session/<str:session_key>/', views.terminate_session, name='terminate_session'),
+    path('session/keepalive/', auth_views.session_keepalive, name='session_keepalive'),
+    path('session/events/', async_views.session_events, name='session_events'),
+
+    # Listado de usuarios y sesiones para el staff (DataTables del lado del servidor)
+    path('staff/users/', views.staff_users, name='staff_users'),
+    path('staff/users/data/', views.staff_users_data, name='staff_users_data'),
+    path('staff/sessions/data/', views.staff_sessions_data, name='staff_sessions_data'),
 ]
\ No newline at end of file
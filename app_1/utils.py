@@ -2,11 +2,13 @@
 Utilidades para la aplicación, incluyendo envío de emails.
 """
 import secrets
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils import timezone
 
+from proyecto.async_mail import asend_message
+
 
 def generate_verification_token():
     """Genera un token seguro para verificación de email."""
@@ -35,6 +37,21 @@ def send_verification_email(user, request):
         f'/verify-email/{token}/'
     )
 
+    # Enviar el email
+    build_verification_email(user, verification_url).send(fail_silently=False)
+
+
+def build_verification_email(user, verification_url):
+    """
+    Construye el email de verificación (texto plano y, en producción, HTML).
+
+    Args:
+        user: Instancia del modelo CustomUser
+        verification_url: URL absoluta de verificación
+
+    Returns:
+        EmailMultiAlternatives: Mensaje listo para enviar
+    """
     # Crear mensaje de texto plano limpio y legible
     plain_message = f"""
 Hola {user.get_full_name() or user.username},
@@ -51,42 +68,62 @@ Saludos,
 El equipo de Aplicación Web
     """.strip()
 
+    message = EmailMultiAlternatives(
+        subject='Verifica tu correo electrónico - Aplicación Web',
+        body=plain_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
     # Renderizar HTML solo en producción
-    html_message = None
     if settings.IS_DEPLOYED:
         context = {
             'user': user,
             'verification_url': verification_url,
             'site_name': 'Aplicación Web',
         }
-        html_message = render_to_string(
-            'app_1/emails/verification_email.html',
-            context
+        message.attach_alternative(
+            render_to_string('app_1/emails/verification_email.html', context),
+            'text/html'
         )
 
-    # Enviar el email
-    send_mail(
-        subject='Verifica tu correo electrónico - Aplicación Web',
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
-        html_message=html_message,
-        fail_silently=False,
-    )
+    return message
 
 
-def send_login_notification_email(user, request):
+def send_verification_emails(users, base_url):
     """
-    Envía un email de notificación de inicio de sesión al usuario.
+    Envía en bloque los emails de verificación de usuarios que ya tienen
+    email_verification_token (por ejemplo, los creados por import_users),
+    usando una sola conexión al servidor de correo.
+
+    Args:
+        users: Usuarios a notificar
+        base_url: URL del sitio para construir los enlaces (ej. https://ejemplo.com)
+
+    Returns:
+        int: Cantidad de emails enviados
+    """
+    base_url = base_url.rstrip('/')
+    messages = [
+        build_verification_email(user, f'{base_url}/verify-email/{user.email_verification_token}/')
+        for user in users
+    ]
+    if not messages:
+        return 0
+    return get_connection(fail_silently=False).send_messages(messages) or 0
+
+
+def build_login_notification_email(user, request):
+    """
+    Construye el email de notificación de inicio de sesión (sin enviarlo).
 
     Args:
         user: Instancia del modelo CustomUser
         request: Objeto HttpRequest para obtener información de la sesión
-    """
-    # Verificar si el usuario desea recibir notificaciones
-    if not user.notify_on_login:
-        return
 
+    Returns:
+        EmailMultiAlternatives: Mensaje con texto plano y, en producción, HTML
+    """
     # Obtener información del request
     ip_address = get_client_ip(request)
     user_agent = request.META.get('HTTP_USER_AGENT', 'Desconocido')
@@ -109,8 +146,14 @@ Saludos,
 El equipo de Aplicación Web
     """.strip()
 
+    message = EmailMultiAlternatives(
+        subject='Nuevo inicio de sesión detectado - Aplicación Web',
+        body=plain_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
     # Renderizar HTML solo en producción
-    html_message = None
     if settings.IS_DEPLOYED:
         context = {
             'user': user,
@@ -123,22 +166,45 @@ El equipo de Aplicación Web
             'app_1/emails/login_notification.html',
             context
         )
+        message.attach_alternative(html_message, 'text/html')
 
-    # Enviar el email
-    send_mail(
-        subject='Nuevo inicio de sesión detectado - Aplicación Web',
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
-        html_message=html_message,
-        fail_silently=True,  # No fallar si el email no se puede enviar
-    )
+    return message
+
+
+def send_login_notification_email(user, request):
+    """
+    Envía un email de notificación de inicio de sesión al usuario.
+
+    Args:
+        user: Instancia del modelo CustomUser
+        request: Objeto HttpRequest para obtener información de la sesión
+    """
+    # Verificar si el usuario desea recibir notificaciones
+    if not user.notify_on_login:
+        return
+
+    # Enviar el email (sin fallar si no se puede enviar)
+    build_login_notification_email(user, request).send(fail_silently=True)
 
     # Actualizar la fecha de última notificación
     user.last_login_notification = timezone.now()
     user.save(update_fields=['last_login_notification'])
 
 
+async def asend_login_notification_email(user, request):
+    """
+    Versión async de send_login_notification_email: espera al servidor
+    SMTP sin bloquear el worker (ver proyecto/async_mail.py).
+    """
+    if not user.notify_on_login:
+        return
+
+    await asend_message(build_login_notification_email(user, request), fail_silently=True)
+
+    user.last_login_notification = timezone.now()
+    await user.asave(update_fields=['last_login_notification'])
+
+
 def get_client_ip(request):
     """
     Obtiene la dirección IP del cliente desde el request.
@@ -157,6 +223,64 @@ def get_client_ip(request):
     return ip
 
 
+def get_rate_limit_ip(request):
+    """
+    Obtiene la IP del cliente para los límites de intentos.
+
+    A diferencia de get_client_ip(), no confía en la primera entrada de
+    X-Forwarded-For, que el cliente puede cambiar en cada intento: con
+    TRUSTED_PROXY_COUNT proxies toma la entrada que agregó el más externo y,
+    sin proxies, REMOTE_ADDR.
+
+    Args:
+        request: Objeto HttpRequest
+
+    Returns:
+        str: Dirección IP del cliente
+    """
+    proxies = settings.TRUSTED_PROXY_COUNT
+    if proxies:
+        forwarded = [
+            ip.strip() for ip in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if ip.strip()
+        ]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get('REMOTE_ADDR')
+
+
+def check_login_rate_limit(request):
+    """
+    Aplica los límites de intentos de login (LOGIN_RATE_LIMITS) por IP, por
+    email normalizado desde esa IP y por email, antes de que el formulario
+    calcule el hash.
+
+    Args:
+        request: Objeto HttpRequest del POST de login
+
+    Returns:
+        int: 0 si el intento se permite; si no, segundos que debe esperar
+    """
+    from proyecto.ratelimit import TokenBucket
+
+    ip = get_rate_limit_ip(request)
+    email = request.POST.get('username', '').lower().strip()
+    identities = {
+        'ip': ip,
+        'email_ip': f'{email}|{ip}' if email else None,
+        'email': email,
+    }
+    # Si un límite ya rechaza el intento se retorna sin consumir las
+    # fichas de los siguientes
+    for name, identity in identities.items():
+        if not identity:
+            continue
+        bucket = TokenBucket(f'login:{name}', **settings.LOGIN_RATE_LIMITS[name])
+        retry_after = bucket.take(identity)
+        if retry_after:
+            return retry_after
+    return 0
+
+
 def send_password_reset_email(user, request):
     """
     Envía un email con el enlace para restablecer la contraseña.
@@ -1,10 +1,43 @@
 """
 Validadores personalizados para la aplicación.
+
+MappedCommonPasswordValidator reemplaza a CommonPasswordValidator de
+Django, que descomprime y carga en un set las 20.000 contraseñas comunes
+en cada worker. La lista se precompila una vez en un arreglo ordenado de
+hashes de 8 bytes (PASSWORD_FILTER_PATH) que se abre con mmap: todos los
+workers comparten las mismas páginas del archivo en memoria y cada
+búsqueda es una búsqueda binaria de ~15 comparaciones.
+
+FastUserAttributeSimilarityValidator da el mismo resultado que
+UserAttributeSimilarityValidator sin crear un SequenceMatcher por cada
+parte de cada atributo.
+
+Para medir los validadores: python benchmarks/bench_password_validators.py
 """
+import gzip
+import hashlib
+import mmap
+import os
 import re
-from django.core.exceptions import ValidationError
+import struct
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import password_validation
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.utils.translation import gettext as _
 
+# Encabezado del filtro: marca, sha256 de la lista de origen y cantidad de registros
+FILTER_MAGIC = b'CPWF0001'
+FILTER_HEADER = struct.Struct('>8s32sQ')
+FILTER_RECORD_SIZE = 8
+
+UPPERCASE_RE = re.compile(r'[A-Z]')
+LOWERCASE_RE = re.compile(r'[a-z]')
+SPECIAL_CHARACTER_RE = re.compile(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]')
+
 
 class PasswordComplexityValidator:
     """
@@ -34,19 +67,19 @@ class PasswordComplexityValidator:
             )
 
         # Verificar mayúscula
-        if not re.search(r'[A-Z]', password):
+        if not UPPERCASE_RE.search(password):
             errors.append(
                 'La contraseña debe contener al menos una letra mayúscula.'
             )
 
         # Verificar minúscula
-        if not re.search(r'[a-z]', password):
+        if not LOWERCASE_RE.search(password):
             errors.append(
                 'La contraseña debe contener al menos una letra minúscula.'
             )
 
         # Verificar carácter especial
-        if not re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]', password):
+        if not SPECIAL_CHARACTER_RE.search(password):
             errors.append(
                 'La contraseña debe contener al menos un carácter especial '
                 '(!@#$%^&*()_+-=[]{}|;:,.<>?).'
@@ -70,3 +103,141 @@ class PasswordComplexityValidator:
             'una letra mayúscula, una minúscula, un carácter especial y no debe '
             'contener espacios ni emojis.'
         )
+
+
+def password_record(password):
+    """Registro del filtro de una contraseña (hash de 8 bytes de su forma normalizada)."""
+    return hashlib.blake2b(password.lower().strip().encode(), digest_size=FILTER_RECORD_SIZE).digest()
+
+
+def read_password_list(path):
+    """Lee una lista de contraseñas, comprimida con gzip o en texto plano."""
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            return file.read().splitlines()
+    except OSError:
+        with open(path, encoding='utf-8') as file:
+            return file.read().splitlines()
+
+
+def source_digest(path):
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).digest()
+
+
+def build_password_filter(source, path):
+    """
+    Precompila la lista de contraseñas en un arreglo ordenado de registros.
+    Se escribe en un archivo temporal y se renombra, así un worker nunca
+    abre un filtro a medio escribir.
+    """
+    records = sorted({password_record(password) for password in read_password_list(source) if password.strip()})
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as file:
+        file.write(FILTER_HEADER.pack(FILTER_MAGIC, source_digest(source), len(records)))
+        file.write(b''.join(records))
+    os.chmod(file.name, 0o644)
+    os.replace(file.name, path)
+    return len(records)
+
+
+class MappedCommonPasswordValidator:
+    """
+    Rechaza las contraseñas comunes buscándolas en el filtro precompilado.
+    El filtro se genera si no existe o si cambió la lista de origen.
+    """
+
+    def __init__(self, password_list_path=None):
+        self.source = password_list_path or (
+            Path(password_validation.__file__).resolve().parent / 'common-passwords.txt.gz'
+        )
+        path = settings.PASSWORD_FILTER_PATH
+        if not self._is_current(path):
+            build_password_filter(self.source, path)
+
+        with open(path, 'rb') as file:
+            self.filter = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.count = FILTER_HEADER.unpack_from(self.filter)[2]
+
+    def _is_current(self, path):
+        """Indica si el filtro existe y corresponde a la lista de origen."""
+        try:
+            with open(path, 'rb') as file:
+                magic, digest, _count = FILTER_HEADER.unpack(file.read(FILTER_HEADER.size))
+        except (OSError, struct.error):
+            return False
+        return magic == FILTER_MAGIC and digest == source_digest(self.source)
+
+    def __contains__(self, password):
+        record = password_record(password)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            start = FILTER_HEADER.size + middle * FILTER_RECORD_SIZE
+            current = self.filter[start:start + FILTER_RECORD_SIZE]
+            if current < record:
+                low = middle + 1
+            elif current > record:
+                high = middle
+            else:
+                return True
+        return False
+
+    def validate(self, password, user=None):
+        """Valida que la contraseña no esté en la lista de contraseñas comunes."""
+        if password in self:
+            raise ValidationError(
+                _('This password is too common.'),
+                code='password_too_common',
+            )
+
+    def get_help_text(self):
+        """Retorna el texto de ayuda para el validador."""
+        return _('Your password can’t be a commonly used password.')
+
+
+class FastUserAttributeSimilarityValidator(password_validation.UserAttributeSimilarityValidator):
+    """
+    UserAttributeSimilarityValidator con la misma regla: Django compara
+    SequenceMatcher.quick_ratio(), que es 2 * (caracteres en común, contando
+    repeticiones) / (longitud total). Aquí se calcula con Counter, contando
+    los caracteres de la contraseña una sola vez y sin repetir las partes
+    que se repiten entre atributos (en este proyecto username es el email).
+    """
+
+    def validate(self, password, user=None):
+        """Valida que la contraseña no se parezca a los datos del usuario."""
+        if not user:
+            return
+
+        password = password.lower()
+        password_counts = Counter(password)
+        checked = set()
+        for attribute_name in self.user_attributes:
+            value = getattr(user, attribute_name, None)
+            if not value or not isinstance(value, str):
+                continue
+            value_lower = value.lower()
+            for value_part in re.split(r'\W+', value_lower) + [value_lower]:
+                if value_part in checked:
+                    continue
+                checked.add(value_part)
+                if password_validation.exceeds_maximum_length_ratio(
+                    password, self.max_similarity, value_part
+                ):
+                    continue
+                common = sum(
+                    min(count, password_counts[char])
+                    for char, count in Counter(value_part).items()
+                )
+                if 2 * common / (len(password) + len(value_part)) >= self.max_similarity:
+                    try:
+                        verbose_name = str(user._meta.get_field(attribute_name).verbose_name)
+                    except FieldDoesNotExist:
+                        verbose_name = attribute_name
+                    raise ValidationError(
+                        self.get_error_message(),
+                        code='password_too_similar',
+                        params={'verbose_name': verbose_name},
+                    )
@@ -1,22 +1,35 @@
 """
 Vistas para autenticación y gestión de usuarios.
 """
+import hashlib
+import time
+
 from django.contrib import messages
-from django.contrib.auth import login, logout, authenticate
+from django.contrib.admin.views.decorators import staff_member_required
+from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
+from django.contrib.sessions.models import Session
+from django.db.models import Min
+from django.http import JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
-from django.views.decorators.http import require_http_methods
-from django.views.decorators.cache import never_cache
+from django.views.decorators.http import condition, require_http_methods
+from django.views.decorators.cache import cache_control, never_cache
 from django.core.exceptions import ValidationError
 
+from proyecto.datatables import ServerSideTable
+from proyecto.middleware import ServiceOverloaded
+from proyecto.templating import template_version
+
+from .admin import CustomUserAdmin, UserSessionAdmin
 from .forms import (
     CustomUserRegistrationForm,
     CustomAuthenticationForm,
     PasswordResetRequestForm,
     PasswordResetConfirmForm
 )
-from .models import CustomUser, UserSession
+from .models import DASHBOARD_FIELDS, CustomUser, UserSession
 from .utils import (
+    check_login_rate_limit,
     send_verification_email,
     send_login_notification_email,
     send_password_reset_email,
@@ -39,9 +52,21 @@ def page_register(request):
 
         if form.is_valid():
             try:
-                # Guardar el usuario
+                # Guardar el usuario: un solo INSERT; si el email ya está
+                # registrado, el índice único lo rechaza (ValidationError)
                 user = form.save()
-
+            except ValidationError as error:
+                form.add_error(None, error)
+            except ServiceOverloaded:
+                # Pool de hashing saturado: 503 con Retry-After (OverloadMiddleware)
+                raise
+            except Exception as e:
+                messages.error(
+                    request,
+                    'Ocurrió un error al crear tu cuenta. Por favor '
+                    'intenta de nuevo.'
+                )
+            else:
                 # Enviar email de verificación
                 try:
                     send_verification_email(user, request)
@@ -62,17 +87,10 @@ def page_register(request):
 
                 return redirect('page_login')
 
-            except Exception as e:
-                messages.error(
-                    request,
-                    'Ocurrió un error al crear tu cuenta. Por favor '
-                    'intenta de nuevo.'
-                )
-        else:
-            # Mostrar errores del formulario
-            for field, errors in form.errors.items():
-                for error in errors:
-                    messages.error(request, error)
+        # Mostrar errores del formulario
+        for field, errors in form.errors.items():
+            for error in errors:
+                messages.error(request, error)
     else:
         form = CustomUserRegistrationForm()
 
@@ -94,15 +112,30 @@ def page_login(request):
         return redirect('dashboard')
 
     if request.method == 'POST':
+        # Rechazar los intentos excesivos antes de que el formulario calcule el hash
+        retry_after = check_login_rate_limit(request)
+        if retry_after:
+            messages.error(
+                request,
+                'Demasiados intentos de inicio de sesión. Por favor intenta '
+                f'de nuevo en {retry_after} segundos.'
+            )
+            # Formulario sin validar: mostrar sus errores ejecutaría authenticate()
+            form = CustomAuthenticationForm(
+                request, initial={'username': request.POST.get('username', '')}
+            )
+            response = render(request, 'app_1/page_login.html', {'form': form}, status=429)
+            response['Retry-After'] = str(retry_after)
+            return response
+
         form = CustomAuthenticationForm(request, data=request.POST)
 
         if form.is_valid():
-            email = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
             remember_me = form.cleaned_data.get('remember_me', False)
 
-            # Autenticar usuario
-            user = authenticate(request, username=email, password=password)
+            # El formulario ya autenticó al usuario en is_valid(); no se
+            # vuelve a llamar a authenticate() para no calcular el hash dos veces
+            user = form.get_user()
 
             if user is not None:
                 # Iniciar sesión
@@ -227,7 +260,6 @@ def terminate_session(request, session_key):
             return redirect('dashboard')
 
         # Eliminar la sesión de Django
-        from django.contrib.sessions.models import Session
         try:
             Session.objects.get(session_key=session_key).delete()
         except Session.DoesNotExist:
@@ -251,6 +283,18 @@ def terminate_session(request, session_key):
     return redirect('dashboard')
 
 
+@login_required
+@never_cache
+@require_http_methods(["GET"])
+def session_keepalive(request):
+    """
+    Renueva la sesión (SessionMiddleware la guarda en cada request) sin
+    renderizar ninguna página. Responde los segundos que faltan para que
+    venza; las otras pestañas lo reciben por el canal de eventos.
+    """
+    return JsonResponse({'expires_in': request.session.get_expiry_age()})
+
+
 @require_http_methods(["GET"])
 def verify_email(request, token):
     """
@@ -274,13 +318,73 @@ def verify_email(request, token):
     return redirect('page_login')
 
 
+# Clave de sesión con la fecha (timestamp) en que vence la primera sesión listada
+DASHBOARD_EXPIRES_KEY = 'dashboard_expires_at'
+
+
+def dashboard_version_queryset(user):
+    """Versión del dashboard y campos mostrados de un usuario (una consulta por clave primaria)."""
+    return CustomUser.objects.filter(pk=user.pk).values('dashboard_updated_at', *sorted(DASHBOARD_FIELDS))
+
+
+def dashboard_version(request):
+    """
+    Versión del dashboard leída de la base de datos una vez por request.
+    request.user puede venir de la caché de usuarios (CachedModelBackend);
+    la versión no, para que ningún worker responda 304 con datos viejos.
+    Las vistas async la cargan antes con el ORM async.
+    """
+    if not hasattr(request, 'dashboard_version'):
+        request.dashboard_version = dashboard_version_queryset(request.user).first()
+    return request.dashboard_version
+
+
+def dashboard_etag(request):
+    """
+    ETag del dashboard calculado con la versión del usuario y la sesión,
+    sin consultar las sesiones ni renderizar la plantilla.
+    Retorna None cuando alguna sesión listada ya venció y hay que limpiarla.
+    """
+    if not request.user.is_authenticated:
+        return None
+
+    expires_at = request.session.get(DASHBOARD_EXPIRES_KEY)
+    if expires_at is not None and time.time() >= expires_at:
+        return None
+
+    version = dashboard_version(request)
+    if version is None:
+        return None
+
+    version = '|'.join(str(value) for value in (
+        request.user.pk,
+        *version.values(),
+        request.session.session_key,
+        template_version(),
+    ))
+    return hashlib.md5(version.encode(), usedforsecurity=False).hexdigest()
+
+
+def dashboard_last_modified(request):
+    """Fecha de la última modificación del perfil o de las sesiones."""
+    if not request.user.is_authenticated:
+        return None
+    version = dashboard_version(request)
+    return version['dashboard_updated_at'] if version else None
+
+
 @login_required
 @require_http_methods(["GET"])
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=dashboard_etag, last_modified_func=dashboard_last_modified)
 def dashboard(request):
     """
     Vista protegida del dashboard.
     Solo accesible para usuarios autenticados.
     Muestra información de sesiones activas.
+
+    Responde 304 Not Modified si el navegador ya tiene la versión actual
+    (ver dashboard_etag); en ese caso no se consultan las sesiones.
     """
     # Limpiar sesiones inválidas
     UserSession.cleanup_invalid_sessions(request.user)
@@ -288,6 +392,18 @@ def dashboard(request):
     # Obtener sesiones activas
     active_sessions = UserSession.objects.filter(user=request.user)
 
+    # Recordar cuándo vence la primera de las otras sesiones para volver a
+    # renderizar en ese momento (la actual se renueva en cada request)
+    expire_date = Session.objects.filter(
+        session_key__in=active_sessions.values('session_key')
+    ).exclude(
+        session_key=request.session.session_key
+    ).aggregate(Min('expire_date'))['expire_date__min']
+    expires_at = expire_date.timestamp() if expire_date else None
+    # Asignar marca la sesión como modificada: solo si el valor cambió
+    if request.session.get(DASHBOARD_EXPIRES_KEY) != expires_at:
+        request.session[DASHBOARD_EXPIRES_KEY] = expires_at
+
     # Detectar sesión actual
     current_session_key = request.session.session_key
 
@@ -435,6 +551,9 @@ def password_reset_confirm(request, token):
 
                 return redirect('page_login')
 
+            except ServiceOverloaded:
+                # Pool de hashing saturado: 503 con Retry-After (OverloadMiddleware)
+                raise
             except Exception as e:
                 messages.error(
                     request,
@@ -458,3 +577,61 @@ def password_reset_confirm(request, token):
 
     return render(request, 'app_1/password_reset_confirm.html', context)
 
+
+
+# Tablas del listado de staff (procesamiento del lado del servidor, ver
+# proyecto/datatables.py). Solo estas columnas se envían al navegador.
+STAFF_USER_COLUMNS = {
+    'email': 'email',
+    'first_name': 'first_name',
+    'last_name': 'last_name',
+    'email_verified': 'email_verified',
+    'is_active': 'is_active',
+    'date_joined': 'date_joined',
+    'last_login': 'last_login',
+}
+
+STAFF_SESSION_COLUMNS = {
+    'user_email': 'user__email',
+    'ip_address': 'ip_address',
+    'created_at': 'created_at',
+    'last_activity': 'last_activity',
+}
+
+
+@staff_member_required
+@require_http_methods(["GET"])
+def staff_users(request):
+    """
+    Listado de usuarios y sesiones para el staff. Las filas se piden por
+    página a staff_users_data y staff_sessions_data.
+    """
+    return render(request, 'app_1/staff_users.html')
+
+
+@staff_member_required
+@require_http_methods(["GET"])
+def staff_users_data(request):
+    """Página de usuarios en el formato de DataTables (JSON)."""
+    table = ServerSideTable(
+        CustomUser.objects.all(),
+        STAFF_USER_COLUMNS,
+        ordering=('-date_joined',),
+        search_fields=('email', 'first_name', 'last_name'),
+        indexed_search_fields=CustomUserAdmin.indexed_search_fields,
+    )
+    return table.response(request)
+
+
+@staff_member_required
+@require_http_methods(["GET"])
+def staff_sessions_data(request):
+    """Página de sesiones en el formato de DataTables (JSON)."""
+    table = ServerSideTable(
+        UserSession.objects.all(),
+        STAFF_SESSION_COLUMNS,
+        ordering=('-last_activity',),
+        search_fields=('user_email', 'ip_address'),
+        indexed_search_fields=UserSessionAdmin.indexed_search_fields,
+    )
+    return table.response(request)
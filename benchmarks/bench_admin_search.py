@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Benchmark de la búsqueda del admin de usuarios.
+
+Crea usuarios de prueba y compara, para varias búsquedas, la de Django
+(search_fields con icontains) con la de IndexedSearchMixin para la base
+de datos configurada (proyecto/search.py): milisegundos por búsqueda,
+resultados y, con --explain, el plan de la consulta para comprobar que usa
+los índices. Los usuarios creados se eliminan al terminar.
+
+Uso:
+    python benchmarks/bench_admin_search.py
+    python benchmarks/bench_admin_search.py --users 200000 --repeat 10 --explain
+
+Requiere que la base de datos y las variables de entorno del proyecto
+estén configuradas igual que para ejecutar el servidor, con las
+migraciones aplicadas (0005_search_indexes crea los índices).
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+FIRST_NAMES = ['Ana', 'Carlos', 'Lucía', 'Andrés', 'María', 'Jorge', 'Valentina', 'Mateo', 'Camila', 'Diego']
+LAST_NAMES = ['Gutiérrez', 'Rodríguez', 'Martínez', 'López', 'García', 'Pérez', 'Sánchez', 'Ramírez', 'Torres', 'Flores']
+DOMAINS = ['gmail.com', 'hotmail.com', 'outlook.com', 'ejemplo.com', 'empresa.co']
+
+
+def seed(prefix, count, batch_size=5000):
+    """Crea los usuarios de prueba (sin contraseña utilizable) por lotes."""
+    from django.db import connection
+
+    from app_1.models import CustomUser
+
+    generator = random.Random(42)
+    for start in range(0, count, batch_size):
+        users = []
+        for index in range(start, min(start + batch_size, count)):
+            first_name = generator.choice(FIRST_NAMES)
+            last_name = generator.choice(LAST_NAMES)
+            email = f'{prefix}.{first_name}.{last_name}{index}@{generator.choice(DOMAINS)}'.lower()
+            users.append(CustomUser(
+                email=email,
+                username=email,
+                first_name=first_name,
+                last_name=last_name,
+                password='!',
+            ))
+        CustomUser.objects.bulk_create(users)
+
+    # Estadísticas actualizadas para que el planificador considere los índices
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('ANALYZE app_1_customuser')
+        elif connection.vendor == 'mysql':
+            cursor.execute('ANALYZE TABLE app_1_customuser')
+        else:
+            cursor.execute('ANALYZE')
+
+
+def time_search(model_admin, search, term, repeat):
+    """Retorna (mediana en ms, resultados, queryset) de una búsqueda."""
+    from django.test import RequestFactory
+
+    from app_1.models import CustomUser
+
+    request = RequestFactory().get('/admin/app_1/customuser/', {'q': term})
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        queryset, _ = search(model_admin, request, CustomUser.objects.all(), term)
+        # Lo que hace el listado: contar (hasta el límite) y leer una página
+        results = queryset.order_by()[:10001].count()
+        list(queryset[:100])
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), results, queryset
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, default=50000, help='Usuarios de prueba a crear')
+    parser.add_argument('--repeat', type=int, default=5, help='Repeticiones por búsqueda')
+    parser.add_argument('--explain', action='store_true', help='Mostrar el plan de cada consulta')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'proyecto.settings')
+    import django
+    django.setup()
+
+    from django.contrib import admin
+    from django.contrib.admin import ModelAdmin
+    from django.db import connection
+
+    from app_1.models import CustomUser
+
+    model_admin = admin.site._registry[CustomUser]
+    lookups = model_admin.get_indexed_search_fields(CustomUser.objects.all())
+    prefix = f'bench-{uuid.uuid4().hex[:6]}'
+    terms = [prefix, f'{prefix}.ana', 'gutiérrez', 'torres', 'empresa.co']
+
+    print(f'\n📊 Búsqueda del admin con {args.users} usuarios de prueba ({connection.vendor})')
+    if not lookups:
+        print('   Sin búsqueda indexada para este motor: se compara search_fields consigo misma')
+
+    try:
+        start = time.perf_counter()
+        seed(prefix, args.users)
+        print(f'   Usuarios creados en {time.perf_counter() - start:.1f} s\n')
+
+        searches = {
+            'search_fields (Django)': ModelAdmin.get_search_results,
+            'IndexedSearchMixin': type(model_admin).get_search_results,
+        }
+        print(f'   {"Búsqueda":<24} {"Método":<24} {"ms":>9} {"Resultados":>11}')
+        for term in terms:
+            for label, search in searches.items():
+                elapsed, results, queryset = time_search(model_admin, search, term, args.repeat)
+                print(f'   {term[:24]:<24} {label:<24} {elapsed:9.2f} {results:>11}')
+                if args.explain:
+                    for line in queryset.order_by().explain().splitlines():
+                        print(f'      {line}')
+    finally:
+        users = CustomUser.objects.filter(email__startswith=prefix)
+        deleted = users.count()
+        users.delete()
+        print(f'\n🧹 Usuarios de prueba eliminados: {deleted}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+"""
+Benchmark de conexiones concurrentes: ASGI (uvicorn) contra WSGI (--workers 3, sync).
+
+Inicia Gunicorn dos veces en puertos locales, con la configuración anterior
+(proyecto.wsgi, --workers 3, worker sync) y en modo ASGI (proyecto.asgi con
+workers de uvicorn y las vistas async, ASGI_MODE=True), y para cada nivel
+de concurrencia abre todas las conexiones a la vez contra una URL.
+Reporta cuántas reciben respuesta antes del tiempo límite y sus latencias.
+
+Con --slow se mantienen además conexiones lentas durante la medición:
+clientes que envían las cabeceras de a poco (redes móviles, proxies sin
+buffer). Cada una ocupa un worker sync completo; un worker de uvicorn las
+atiende en su event loop sin dejar de responder a las demás.
+
+Uso:
+    python benchmarks/bench_asgi.py
+    python benchmarks/bench_asgi.py --path /login/ --levels 50,200,500 --slow 10 --timeout 5
+
+Requiere uvicorn y uvicorn-worker (requirements.txt), y que la base de
+datos y las variables de entorno del proyecto estén configuradas igual que
+para ejecutar el servidor.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Workers de ambos modos, como la configuración anterior de WSGI
+WORKERS = '3'
+
+
+def find_free_port():
+    """Obtiene un puerto TCP libre en localhost."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_server(port, timeout=30):
+    """Espera hasta que el servidor acepte conexiones."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def start_gunicorn(port, asgi):
+    """Inicia Gunicorn con gunicorn.conf.py en modo ASGI o WSGI (sync)."""
+    env = os.environ.copy()
+    env['GUNICORN_BIND'] = f'127.0.0.1:{port}'
+    env['ASGI_MODE'] = 'True' if asgi else 'False'
+    env.pop('GUNICORN_WORKER_CLASS', None)
+    command = [
+        sys.executable, '-m', 'gunicorn',
+        '--config', 'gunicorn.conf.py',
+        '--access-logfile', '/dev/null',
+        '--workers', WORKERS,
+    ]
+    if not asgi:
+        command += ['--threads', '1', '--worker-class', 'sync']
+    return subprocess.Popen(
+        command,
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+async def fetch(port, path, timeout):
+    """Un request completo en una conexión nueva; retorna la latencia o el error."""
+    start = time.perf_counter()
+    writer = None
+    try:
+        async with asyncio.timeout(timeout):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(
+                f'GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n'.encode()
+            )
+            await writer.drain()
+            status_line = await reader.readline()
+            await reader.read()
+        if not status_line.startswith(b'HTTP/1.1 ') or status_line[9:10] == b'5':
+            return None, 'error'
+        return time.perf_counter() - start, None
+    except TimeoutError:
+        return None, 'timeout'
+    except OSError:
+        return None, 'error'
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+async def hold_slow_connection(port, path, stop):
+    """Conexión que envía las cabeceras de a una hasta que termina la medición."""
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    except OSError:
+        return
+    try:
+        writer.write(f'GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n'.encode())
+        await writer.drain()
+        index = 0
+        while not stop.is_set():
+            writer.write(f'X-Slow-{index}: 1\r\n'.encode())
+            await writer.drain()
+            index += 1
+            try:
+                await asyncio.wait_for(stop.wait(), 1)
+            except TimeoutError:
+                pass
+    except OSError:
+        pass
+    finally:
+        writer.close()
+
+
+async def run_level(port, path, concurrency, slow, timeout):
+    """Abre las conexiones lentas y luego todas las del nivel a la vez."""
+    stop = asyncio.Event()
+    holders = [asyncio.create_task(hold_slow_connection(port, path, stop)) for _ in range(slow)]
+    # Dar tiempo a que el servidor acepte las conexiones lentas
+    if slow:
+        await asyncio.sleep(1)
+    try:
+        results = await asyncio.gather(*[fetch(port, path, timeout) for _ in range(concurrency)])
+    finally:
+        stop.set()
+        await asyncio.gather(*holders)
+    latencies = sorted(latency for latency, _ in results if latency is not None)
+    failures = [failure for _, failure in results if failure]
+    return latencies, failures.count('timeout'), failures.count('error')
+
+
+def report(concurrency, latencies, timeouts, errors):
+    """Imprime una fila de resultados."""
+    if latencies:
+        p50 = f'{statistics.median(latencies) * 1000:.0f}'
+        p95 = f'{latencies[max(0, int(len(latencies) * 0.95) - 1)] * 1000:.0f}'
+    else:
+        p50 = p95 = '-'
+    print(f'   {concurrency:>10} {len(latencies):>11} {timeouts:>8} {errors:>7} {p50:>9} {p95:>9}')
+
+
+def benchmark(label, asgi, args):
+    """Inicia Gunicorn, mide cada nivel de concurrencia y lo detiene."""
+    port = find_free_port()
+    process = start_gunicorn(port, asgi)
+    try:
+        if not wait_for_server(port):
+            print(f'❌ Gunicorn no inició ({label})')
+            process.terminate()
+            print(process.communicate()[1])
+            return
+        print(f'\n📊 {label}')
+        # Calentar workers antes de medir
+        asyncio.run(run_level(port, args.path, int(WORKERS) * 4, 0, args.timeout))
+        print(f'   {"Conexiones":>10} {"Respondidas":>11} {"Timeout":>8} {"Errores":>7} {"p50 (ms)":>9} {"p95 (ms)":>9}')
+        for concurrency in args.levels:
+            report(concurrency, *asyncio.run(run_level(port, args.path, concurrency, args.slow, args.timeout)))
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--path', default='/login/', help='URL a solicitar')
+    parser.add_argument('--levels', default='25,100,250',
+                        help='Conexiones concurrentes por nivel, separadas por coma')
+    parser.add_argument('--slow', type=int, default=0,
+                        help='Conexiones lentas abiertas durante cada nivel')
+    parser.add_argument('--timeout', type=float, default=5, help='Segundos máximos por request')
+    args = parser.parse_args()
+    args.levels = [int(level) for level in args.levels.split(',')]
+
+    print(f'⚙️  {WORKERS} workers por modo, {args.slow} conexiones lentas, '
+          f'tiempo límite {args.timeout:g} s, URL {args.path}')
+
+    benchmark('WSGI (proyecto.wsgi, --workers 3, sync)', False, args)
+    benchmark('ASGI (proyecto.asgi, uvicorn, vistas async)', True, args)
+
+
+if __name__ == '__main__':
+    main()
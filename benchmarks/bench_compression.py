@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Benchmark de compresión del HTML dinámico.
+
+Renderiza cada página con el cliente de pruebas de Django (sin compresión)
+y mide, para el HTML original y el minificado, los bytes resultantes con
+gzip y Brotli y el tiempo de CPU de cada compresión, con las mismas
+funciones y niveles que usa CompressionMiddleware.
+
+Uso:
+    python benchmarks/bench_compression.py
+    python benchmarks/bench_compression.py --path /login/ --path /register/ --iterations 500
+
+Requiere que la base de datos y las variables de entorno del proyecto
+estén configuradas igual que para ejecutar el servidor.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_PATHS = ['/login/', '/register/', '/password-reset/']
+
+
+def cpu_time_ms(function, iterations):
+    """Tiempo de CPU promedio (ms) de una llamada."""
+    start = time.process_time()
+    for _ in range(iterations):
+        function()
+    return (time.process_time() - start) / iterations * 1000
+
+
+def fetch_html(path):
+    """Obtiene el HTML de una página sin compresión ni minificación."""
+    from django.test import Client
+    from django.test.utils import override_settings
+
+    with override_settings(HTML_MINIFY=False, ALLOWED_HOSTS=['*']):
+        response = Client().get(path, HTTP_ACCEPT_ENCODING='identity')
+    if response.status_code != 200:
+        raise RuntimeError(f'{path}: HTTP {response.status_code}')
+    return response.content
+
+
+def report(path, html, iterations):
+    """Imprime bytes y CPU de cada variante de una página."""
+    from proyecto.middleware import brotli, compress, minify_html
+
+    minified = minify_html(html)
+    minify_ms = cpu_time_ms(lambda: minify_html(html), iterations)
+    encodings = ['gzip'] + (['br'] if brotli is not None else [])
+    kilobyte = 1024
+
+    print(f'\n📄 {path}')
+    print(f'   {"Variante":<24} {"Tamaño":>10} {"Ahorro":>8} {"CPU":>9}')
+    print(f'   {"original":<24} {len(html) / kilobyte:8.1f} KB {"":>8} {"":>9}')
+    print(f'   {"minificado":<24} {len(minified) / kilobyte:8.1f} KB '
+          f'{1 - len(minified) / len(html):7.1%} {minify_ms:6.3f} ms')
+
+    for label, content in (('original', html), ('minificado', minified)):
+        for encoding in encodings:
+            for pad in (False, True):
+                name = f'{label} + {encoding}' + (' (pad)' if pad else '')
+                size = len(compress(content, encoding, pad=pad))
+                elapsed = cpu_time_ms(lambda: compress(content, encoding, pad=pad), iterations)
+                print(f'   {name:<24} {size / kilobyte:8.1f} KB '
+                      f'{1 - size / len(html):7.1%} {elapsed:6.3f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--path', action='append', help='URL a medir (se puede repetir)')
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='Repeticiones para medir la CPU')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'proyecto.settings')
+    import django
+    django.setup()
+
+    from django.conf import settings
+
+    print('⚙️  Configuración de compresión:')
+    print(f'   Brotli calidad {settings.COMPRESSION_BROTLI_QUALITY}, '
+          f'gzip nivel {settings.COMPRESSION_GZIP_LEVEL}, '
+          f'mínimo {settings.COMPRESSION_MIN_SIZE} bytes, '
+          f'BREACH={settings.COMPRESSION_BREACH_MODE}')
+
+    for path in args.path or DEFAULT_PATHS:
+        try:
+            html = fetch_html(path)
+        except RuntimeError as error:
+            print(f'\n❌ {error}')
+            continue
+        report(path, html, args.iterations)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""
+Benchmark de throughput de Gunicorn con la configuración automática.
+
+Inicia Gunicorn con gunicorn.conf.py en un puerto local, genera carga
+concurrente contra una URL y reporta requests por segundo y latencias.
+Con --compare también mide la configuración anterior (--workers 3, sync)
+para comparar ambos resultados.
+
+Uso:
+    python benchmarks/bench_gunicorn.py
+    python benchmarks/bench_gunicorn.py --path /login/ --concurrency 32 --duration 15 --compare
+
+Requiere que la base de datos y las variables de entorno del proyecto
+estén configuradas igual que para ejecutar el servidor.
+"""
+
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def find_free_port():
+    """Obtiene un puerto TCP libre en localhost."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_server(port, timeout=30):
+    """Espera hasta que el servidor acepte conexiones."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def start_gunicorn(port, extra_args):
+    """Inicia Gunicorn con la configuración del proyecto."""
+    env = os.environ.copy()
+    env['GUNICORN_BIND'] = f'127.0.0.1:{port}'
+    command = [
+        sys.executable, '-m', 'gunicorn',
+        'proyecto.wsgi:application',
+        '--config', 'gunicorn.conf.py',
+        '--access-logfile', '/dev/null',
+        *extra_args,
+    ]
+    return subprocess.Popen(
+        command,
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def run_load(port, path, concurrency, duration):
+    """Genera carga con conexiones keep-alive y retorna latencias y errores."""
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client():
+        local_latencies = []
+        local_errors = 0
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                connection.request('GET', path)
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 500:
+                    local_errors += 1
+                else:
+                    local_latencies.append(time.perf_counter() - start)
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        connection.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors.append(local_errors)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return latencies, sum(errors)
+
+
+def report(label, latencies, errors, duration):
+    """Imprime los resultados de una ejecución."""
+    print(f'\n📊 {label}')
+    if not latencies:
+        print(f'   Sin respuestas exitosas ({errors} errores)')
+        return
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f'   Requests:     {len(latencies)} ({errors} errores)')
+    print(f'   Throughput:   {len(latencies) / duration:.1f} req/s')
+    print(f'   Latencia p50: {statistics.median(ordered) * 1000:.1f} ms')
+    print(f'   Latencia p95: {p95 * 1000:.1f} ms')
+
+
+def benchmark(label, extra_args, args):
+    """Inicia Gunicorn, ejecuta la carga y lo detiene."""
+    port = find_free_port()
+    process = start_gunicorn(port, extra_args)
+    try:
+        if not wait_for_server(port):
+            print(f'❌ Gunicorn no inició ({label})')
+            process.terminate()
+            print(process.communicate()[1])
+            return
+        # Calentar workers antes de medir
+        run_load(port, args.path, args.concurrency, 2)
+        latencies, errors = run_load(port, args.path, args.concurrency, args.duration)
+        report(label, latencies, errors, args.duration)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--path', default='/login/', help='URL a solicitar')
+    parser.add_argument('--concurrency', type=int, default=16, help='Clientes concurrentes')
+    parser.add_argument('--duration', type=float, default=10, help='Segundos de medición')
+    parser.add_argument('--compare', action='store_true',
+                        help='Medir también la configuración anterior (--workers 3, sync)')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    import importlib.util
+    spec = importlib.util.spec_from_file_location('gunicorn_conf', PROJECT_ROOT / 'gunicorn.conf.py')
+    conf = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(conf)
+
+    print('⚙️  Configuración automática:')
+    print(f'   CPU: {conf.CPU_COUNT}, memoria: {conf.MEMORY_MB} MB')
+    print(f'   {conf.workers} workers x {conf.threads} hilos ({conf.worker_class}), '
+          f'preload={conf.preload_app}, max_requests={conf.max_requests}')
+
+    benchmark('Configuración automática (gunicorn.conf.py)', [], args)
+
+    if args.compare:
+        benchmark(
+            'Configuración anterior (--workers 3, sync)',
+            ['--workers', '3', '--threads', '1', '--worker-class', 'sync'],
+            args,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+Benchmark de almacenamiento de mensajes flash en la cadena registro -> login.
+
+Para cada almacenamiento registra usuarios nuevos con POST /register/,
+sigue la redirección a /login/ (donde se muestra el mensaje) y reporta las
+consultas a django_session, el tamaño de la cookie de mensajes y el tiempo
+de la cadena. Los usuarios creados se eliminan al terminar.
+
+También guarda muchos mensajes largos (caso de desbordamiento) para ver
+si el almacenamiento recurre a la sesión.
+
+Uso:
+    python benchmarks/bench_messages.py
+    python benchmarks/bench_messages.py --iterations 20
+
+Requiere que la base de datos y las variables de entorno del proyecto
+estén configuradas igual que para ejecutar el servidor.
+"""
+
+import argparse
+import os
+import secrets
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+STORAGES = [
+    ('FallbackStorage (Django)', 'django.contrib.messages.storage.fallback.FallbackStorage'),
+    ('CompactCookieStorage', 'proyecto.message_storage.CompactCookieStorage'),
+]
+
+PASSWORD = 'Clave#Segura2024'
+
+
+def register_and_login(client, email):
+    """Ejecuta la cadena y retorna (consultas a django_session, bytes de la cookie, segundos)."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    data = {
+        'first_name': 'Benchmark',
+        'last_name': 'Mensajes',
+        'email': email,
+        'password1': PASSWORD,
+        'password2': PASSWORD,
+        'terms_accepted': 'on',
+    }
+
+    start = time.perf_counter()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post('/register/', data)
+        cookie = client.cookies.get('messages')
+        cookie_size = len(cookie.value) if cookie else 0
+        if response.status_code == 302:
+            client.get(response['Location'])
+    elapsed = time.perf_counter() - start
+
+    session_queries = sum('django_session' in query['sql'] for query in queries.captured_queries)
+    return session_queries, cookie_size, elapsed
+
+
+def overflow(storage_path, count, length):
+    """
+    Guarda muchos mensajes largos (por ejemplo, los errores de un formulario)
+    y retorna (sesión modificada, bytes de la cookie, mensajes descartados).
+    """
+    from importlib import import_module
+
+    from django.conf import settings
+    from django.contrib import messages
+    from django.http import HttpResponse
+    from django.test import RequestFactory
+    from django.utils.module_loading import import_string
+
+    request = RequestFactory().get('/')
+    request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+    request._messages = import_string(storage_path)(request)
+    for index in range(count):
+        # Texto aleatorio: los mensajes reales se comprimen peor que un texto repetido
+        messages.error(request, f'{index}: {secrets.token_urlsafe(length)[:length]}')
+
+    response = HttpResponse()
+    dropped = request._messages.update(response)
+    cookie = response.cookies.get('messages')
+    return request.session.modified, len(cookie.value) if cookie else 0, len(dropped or [])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=10, help='Registros por almacenamiento')
+    parser.add_argument('--messages', type=int, default=12,
+                        help='Mensajes del caso de desbordamiento')
+    parser.add_argument('--length', type=int, default=400,
+                        help='Caracteres por mensaje del caso de desbordamiento')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'proyecto.settings')
+    import django
+    django.setup()
+
+    from django.test import Client
+    from django.test.utils import override_settings
+
+    from app_1.models import CustomUser
+
+    prefix = f'bench-{uuid.uuid4().hex[:8]}'
+    try:
+        for number, (label, storage) in enumerate(STORAGES):
+            with override_settings(
+                MESSAGE_STORAGE=storage,
+                EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+                ALLOWED_HOSTS=['*'],
+                DEBUG=True,  # Registrar las consultas
+            ):
+                results = [
+                    register_and_login(Client(), f'{prefix}-{number}-{index}@example.com')
+                    for index in range(args.iterations)
+                ]
+
+            session_queries, cookie_sizes, times = zip(*results)
+            print(f'\n📊 {label}')
+            print(f'   Consultas a django_session: {statistics.mean(session_queries):.1f} por cadena')
+            print(f'   Cookie de mensajes:         {statistics.mean(cookie_sizes):.0f} bytes')
+            print(f'   Tiempo de la cadena:        {statistics.median(times) * 1000:.1f} ms (mediana)')
+
+            modified, cookie_size, dropped = overflow(storage, args.messages, args.length)
+            print(f'   {args.messages} mensajes de {args.length} caracteres: '
+                  f'sesión {"modificada" if modified else "sin cambios"}, '
+                  f'cookie {cookie_size} bytes, {dropped} descartados')
+    finally:
+        users = CustomUser.objects.filter(email__startswith=prefix)
+        deleted = users.count()
+        users.delete()
+        print(f'\n🧹 Usuarios de prueba eliminados: {deleted}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark de los validadores de contraseñas.
+
+Reporta:
+- Costo de carga y memoria de CommonPasswordValidator (Django, set en
+  cada worker) frente a MappedCommonPasswordValidator (filtro con mmap)
+- Microsegundos por validate() de cada validador de AUTH_PASSWORD_VALIDATORS
+  (y de los de Django que reemplazan, como referencia)
+- Cuántas veces se ejecutan los validadores al validar el formulario de registro
+
+Uso:
+    python benchmarks/bench_password_validators.py
+    python benchmarks/bench_password_validators.py --iterations 20000
+
+Requiere que las variables de entorno del proyecto estén configuradas
+igual que para ejecutar el servidor (no consulta la base de datos).
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from unittest import mock
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Contraseñas de ejemplo: válidas, comunes, numéricas y parecidas al usuario
+PASSWORDS = [
+    'Clave#Segura2024',
+    'password',
+    'Qwerty123!',
+    '12345678',
+    'Benchmark.Usuario1',
+    'x9$Lm2!pQr',
+]
+
+
+def load(validator_class):
+    """Retorna (validador, milisegundos de carga, KB de memoria de Python)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    validator = validator_class()
+    elapsed = (time.perf_counter() - start) * 1000
+    memory = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+    return validator, elapsed, memory
+
+
+def time_validate(validator, user, iterations):
+    """Mediana en microsegundos de validate() sobre las contraseñas de ejemplo."""
+    from django.core.exceptions import ValidationError
+
+    times = []
+    for password in PASSWORDS:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            try:
+                validator.validate(password, user)
+            except ValidationError:
+                pass
+        times.append((time.perf_counter() - start) / iterations * 1_000_000)
+    return statistics.median(times)
+
+
+def count_form_validations():
+    """Cantidad de llamadas a validate_password() al validar el formulario de registro."""
+    from django.contrib.auth import password_validation
+
+    from app_1.forms import CustomUserRegistrationForm
+
+    data = {
+        'first_name': 'Benchmark',
+        'last_name': 'Validadores',
+        'email': 'bench-validators@example.com',
+        'password1': PASSWORDS[0],
+        'password2': PASSWORDS[0],
+        'terms_accepted': 'on',
+    }
+    original = password_validation.validate_password
+    with mock.patch.object(password_validation, 'validate_password', wraps=original) as django_calls, \
+            mock.patch('app_1.forms.validate_password', wraps=original) as form_calls, \
+            mock.patch.object(CustomUserRegistrationForm, 'clean_email', lambda form: form.cleaned_data['email']):
+        CustomUserRegistrationForm(data).is_valid()
+    return django_calls.call_count + form_calls.call_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=5000, help='Llamadas por contraseña')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'proyecto.settings')
+    import django
+    django.setup()
+
+    from django.contrib.auth.password_validation import (
+        CommonPasswordValidator,
+        UserAttributeSimilarityValidator,
+        get_default_password_validators,
+    )
+
+    from app_1.models import CustomUser
+    from app_1.validators import MappedCommonPasswordValidator
+
+    print('\n📊 Carga de la lista de contraseñas comunes (por worker)')
+    for validator_class in (CommonPasswordValidator, MappedCommonPasswordValidator):
+        _, elapsed, memory = load(validator_class)
+        print(f'   {validator_class.__name__:<32} {elapsed:8.2f} ms {memory:10.1f} KB')
+
+    user = CustomUser(
+        email='benchmark.usuario@example.com',
+        username='benchmark.usuario@example.com',
+        first_name='Benchmark',
+        last_name='Usuario',
+    )
+    references = [CommonPasswordValidator(), UserAttributeSimilarityValidator()]
+    validators = [*references, *get_default_password_validators()]
+
+    print(f'\n📊 validate() ({args.iterations} llamadas por contraseña, mediana)')
+    total = 0
+    for validator in validators:
+        elapsed = time_validate(validator, user, args.iterations)
+        configured = validator not in references
+        total += elapsed if configured else 0
+        label = type(validator).__name__ + ('' if configured else ' (Django, referencia)')
+        print(f'   {label:<52} {elapsed:8.2f} µs')
+    print(f'   {"Total de AUTH_PASSWORD_VALIDATORS":<52} {total:8.2f} µs')
+
+    print(f'\n📊 Validaciones por formulario de registro: {count_form_validations()}')
+
+
+if __name__ == '__main__':
+    main()
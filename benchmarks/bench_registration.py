@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Benchmark de registros concurrentes.
+
+Registra usuarios con POST /register/ desde varios hilos; una parte de los
+registros repite un email con otras mayúsculas, como dos personas (o dos
+clics) registrando la misma cuenta a la vez. Reporta la latencia, las
+consultas por registro y verifica que cada email quede registrado una sola
+vez. Los usuarios creados se eliminan al terminar.
+
+Uso:
+    python benchmarks/bench_registration.py
+    python benchmarks/bench_registration.py --users 200 --threads 16
+    python benchmarks/bench_registration.py --real-hash   # Incluir el costo de PBKDF2
+
+Requiere que la base de datos y las variables de entorno del proyecto
+estén configuradas igual que para ejecutar el servidor.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+PASSWORD = 'Clave#Segura2024'
+
+
+def register(email):
+    """Registra un usuario y retorna (creado, consultas, segundos)."""
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+
+    data = {
+        'first_name': 'Benchmark',
+        'last_name': 'Registro',
+        'email': email,
+        'password1': PASSWORD,
+        'password2': PASSWORD,
+        'terms_accepted': 'on',
+    }
+    try:
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            response = Client().post('/register/', data)
+        elapsed = time.perf_counter() - start
+        return response.status_code == 302, len(queries.captured_queries), elapsed
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, default=60, help='Registros a ejecutar')
+    parser.add_argument('--threads', type=int, default=8, help='Registros simultáneos')
+    parser.add_argument('--duplicates', type=float, default=0.25,
+                        help='Fracción de registros que repiten un email con otras mayúsculas')
+    parser.add_argument('--real-hash', action='store_true',
+                        help='Usar los hashers configurados (por defecto MD5 para medir solo la base de datos)')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'proyecto.settings')
+    import django
+    django.setup()
+
+    from django.conf import settings
+    from django.db.models.functions import Lower
+    from django.test.utils import override_settings
+
+    from app_1.models import CustomUser
+
+    prefix = f'bench-{uuid.uuid4().hex[:8]}'
+    unique = args.users - int(args.users * args.duplicates)
+    emails = [f'{prefix}-{index}@example.com' for index in range(unique)]
+    # Los duplicados se intercalan para que compitan con el registro original
+    for index in range(args.users - unique):
+        emails.insert(index * 2 + 1, emails[index * 2].upper())
+
+    hashers = settings.PASSWORD_HASHERS if args.real_hash else [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+    try:
+        with override_settings(
+            PASSWORD_HASHERS=hashers,
+            EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+            ALLOWED_HOSTS=['*'],
+            DEBUG=True,  # Registrar las consultas
+        ):
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.threads) as executor:
+                results = list(executor.map(register, emails))
+            total = time.perf_counter() - start
+
+        created, queries, times = zip(*results)
+        times = sorted(times)
+        registered = (
+            CustomUser.objects.annotate(email_lower=Lower('email'))
+            .filter(email_lower__startswith=prefix)
+        )
+        print(f'\n📊 {args.users} registros, {args.threads} simultáneos '
+              f'({args.users - unique} con email repetido)')
+        print(f'   Creados / rechazados:  {sum(created)} / {args.users - sum(created)}')
+        print(f'   Usuarios en la base:   {registered.count()} (esperados {unique})')
+        print(f'   Consultas por registro: {statistics.mean(queries):.1f}')
+        print(f'   Latencia:              {statistics.median(times) * 1000:.1f} ms (mediana), '
+              f'{times[int(len(times) * 0.95) - 1] * 1000:.1f} ms (p95)')
+        print(f'   Registros por segundo: {args.users / total:.1f}')
+    finally:
+        users = CustomUser.objects.filter(email__istartswith=prefix)
+        deleted = users.count()
+        users.delete()
+        print(f'\n🧹 Usuarios de prueba eliminados: {deleted}')
+
+
+if __name__ == '__main__':
+    main()
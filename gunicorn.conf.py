@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+Configuración de Gunicorn para el proyecto.
+
+Gunicorn carga este archivo con ``--config gunicorn.conf.py``. Los valores
+se calculan automáticamente a partir de la CPU y la memoria disponibles en
+el contenedor, y cada uno puede sobrescribirse con variables de entorno:
+
+- ASGI_MODE: 'True' para servir proyecto.asgi con workers de uvicorn y las
+  vistas async (app_1/async_views.py); por defecto proyecto.wsgi con gthread
+- GUNICORN_BIND: Dirección de escucha (por defecto HOSTING_IP_PORT o 0.0.0.0:8080)
+- GUNICORN_WORKERS: Número de procesos worker
+- GUNICORN_THREADS: Hilos por worker (solo aplica a gthread)
+- GUNICORN_WORKER_CLASS: Clase de worker (por defecto gthread, o
+  uvicorn_worker.UvicornWorker con ASGI_MODE)
+- GUNICORN_WORKER_MEMORY_MB: Memoria estimada por worker para el cálculo automático
+- PASSWORD_HASHING_WORKERS: Procesos del pool de hashing por worker (ver
+  app_1/hashers.py); su memoria se suma a la de cada worker
+- GUNICORN_PRELOAD: 'True' para cargar la aplicación en el proceso maestro
+- GUNICORN_MAX_REQUESTS: Requests atendidos antes de reciclar un worker
+- GUNICORN_MAX_REQUESTS_JITTER: Variación aleatoria del reciclaje
+- GUNICORN_TIMEOUT: Segundos antes de reiniciar un worker bloqueado
+- GUNICORN_GRACEFUL_TIMEOUT: Segundos para terminar requests al reiniciar
+- GUNICORN_KEEPALIVE: Segundos que se mantiene abierta una conexión keep-alive
+
+Documentación: https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import math
+import os
+
+# Memoria estimada (MB) que consume cada worker con Django cargado
+DEFAULT_WORKER_MEMORY_MB = 150
+
+# Memoria estimada (MB) de cada proceso del pool de hashing de un worker
+HASHING_PROCESS_MEMORY_MB = 40
+
+# Memoria (MB) reservada para el proceso maestro y el sistema
+RESERVED_MEMORY_MB = 128
+
+# Límites de hilos por worker para cargas I/O (SMTP, base de datos)
+MIN_THREADS = 2
+MAX_THREADS = 8
+
+
+def env_int(name, default):
+    """Lee una variable de entorno entera, usando el valor por defecto si no es válida."""
+    value = os.getenv(name, '')
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+def read_first_line(path):
+    """Lee la primera línea de un archivo del sistema, o None si no existe."""
+    try:
+        with open(path) as file:
+            return file.readline().strip()
+    except OSError:
+        return None
+
+
+def detect_cpu_count():
+    """
+    Detecta las CPU disponibles para el proceso.
+    Respeta la afinidad del proceso y los límites de cgroups (v2 y v1)
+    que imponen plataformas como Railway o Heroku.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    # cgroups v2: "<cuota> <periodo>" o "max <periodo>"
+    cpu_max = read_first_line('/sys/fs/cgroup/cpu.max')
+    if cpu_max:
+        quota, _, period = cpu_max.partition(' ')
+        if quota != 'max' and period:
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+        return cpus
+
+    # cgroups v1
+    quota = read_first_line('/sys/fs/cgroup/cpu/cpu.cfs_quota_us')
+    period = read_first_line('/sys/fs/cgroup/cpu/cpu.cfs_period_us')
+    if quota and period and int(quota) > 0:
+        cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+
+    return cpus
+
+
+def detect_memory_mb():
+    """
+    Detecta la memoria disponible en MB.
+    Usa el límite del cgroup si existe y, si no, MemAvailable de /proc/meminfo.
+    Retorna None si no es posible determinarla.
+    """
+    for path in ('/sys/fs/cgroup/memory.max',
+                 '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        limit = read_first_line(path)
+        # Los límites "infinitos" de cgroups v1 son números enormes
+        if limit and limit.isdigit() and int(limit) < 1 << 60:
+            return int(limit) // (1024 * 1024)
+
+    try:
+        with open('/proc/meminfo') as file:
+            for line in file:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+
+    return None
+
+
+def compute_workers_and_threads(cpus, memory_mb, worker_memory_mb):
+    """
+    Calcula workers e hilos a partir de la CPU y la memoria disponibles.
+
+    Los workers siguen la regla (2 x CPU) + 1, limitada por la memoria.
+    Cuando la memoria recorta los workers, se compensan con más hilos
+    para mantener la concurrencia de las rutas I/O (email y base de datos).
+    """
+    cpu_workers = 2 * cpus + 1
+    workers = cpu_workers
+
+    if memory_mb is not None:
+        memory_workers = (memory_mb - RESERVED_MEMORY_MB) // worker_memory_mb
+        workers = max(1, min(workers, memory_workers))
+
+    threads = (4 * cpu_workers) // workers
+    threads = max(MIN_THREADS, min(MAX_THREADS, threads))
+
+    return workers, threads
+
+
+CPU_COUNT = detect_cpu_count()
+MEMORY_MB = detect_memory_mb()
+AUTO_WORKERS, AUTO_THREADS = compute_workers_and_threads(
+    CPU_COUNT,
+    MEMORY_MB,
+    env_int('GUNICORN_WORKER_MEMORY_MB', DEFAULT_WORKER_MEMORY_MB)
+    + env_int('PASSWORD_HASHING_WORKERS', 2) * HASHING_PROCESS_MEMORY_MB,
+)
+
+# ----------------------------------------------------------------------------
+# Servidor
+# ----------------------------------------------------------------------------
+bind = os.getenv('GUNICORN_BIND', os.getenv('HOSTING_IP_PORT', '0.0.0.0:8080'))
+
+# Aplicación a servir (el Procfile no la pasa en la línea de comandos)
+ASGI_MODE = os.getenv('ASGI_MODE', 'False') == 'True'
+wsgi_app = 'proyecto.asgi:application' if ASGI_MODE else 'proyecto.wsgi:application'
+
+# ----------------------------------------------------------------------------
+# Procesos y concurrencia
+# ----------------------------------------------------------------------------
+# gthread: cada worker atiende varios requests en hilos, útil mientras se
+# espera al servidor SMTP o a la base de datos. Con ASGI_MODE cada worker de
+# uvicorn atiende muchas conexiones en un event loop (threads no aplica)
+worker_class = os.getenv(
+    'GUNICORN_WORKER_CLASS',
+    'uvicorn_worker.UvicornWorker' if ASGI_MODE else 'gthread',
+)
+workers = env_int('GUNICORN_WORKERS', AUTO_WORKERS)
+threads = env_int('GUNICORN_THREADS', AUTO_THREADS)
+
+# Cargar Django una sola vez en el maestro; los workers comparten la memoria
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True') == 'True'
+
+# Reciclar workers periódicamente (con variación para no reiniciarlos a la vez)
+max_requests = env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = env_int('GUNICORN_MAX_REQUESTS_JITTER', max_requests // 10)
+
+# ----------------------------------------------------------------------------
+# Tiempos de espera
+# ----------------------------------------------------------------------------
+timeout = env_int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = env_int('GUNICORN_KEEPALIVE', 5)
+
+# Archivo de latido en memoria para evitar bloqueos por disco lento
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# ----------------------------------------------------------------------------
+# Logs (stdout/stderr, visibles en Railway)
+# ----------------------------------------------------------------------------
+accesslog = '-'
+errorlog = '-'
+
+
+# ----------------------------------------------------------------------------
+# Hooks
+# ----------------------------------------------------------------------------
+def warm_templates(log):
+    """
+    Compila las plantillas y llena la caché de fragmentos de las páginas
+    públicas (ver proyecto/templating.py). Un error no impide iniciar.
+    """
+    try:
+        from proyecto.templating import warm_templates as warm
+        compiled, rendered, errors = warm()
+    except Exception as error:
+        log.warning('No se pudieron precalentar las plantillas: %s', error)
+        return
+
+    log.info('Plantillas precalentadas: %s compiladas, %s páginas renderizadas', compiled, rendered)
+    for error in errors:
+        log.warning('Precalentamiento: %s', error)
+
+
+def when_ready(server):
+    """Registra la configuración seleccionada al iniciar el servidor."""
+    server.log.info(
+        'Configuración: %s workers x %s hilos (%s), CPU=%s, memoria=%s MB, preload=%s',
+        server.cfg.workers,
+        server.cfg.threads,
+        server.cfg.worker_class_str,
+        CPU_COUNT,
+        MEMORY_MB if MEMORY_MB is not None else 'desconocida',
+        server.cfg.preload_app,
+    )
+
+    # Con preload el maestro precalienta una vez y los workers heredan la
+    # memoria (plantillas compiladas y fragmentos) al hacer fork
+    if server.cfg.preload_app:
+        warm_templates(server.log)
+
+
+def post_worker_init(worker):
+    """Sin preload, cada worker precalienta sus plantillas antes de atender requests."""
+    if not worker.cfg.preload_app:
+        warm_templates(worker.log)
+
+
+def pre_fork(server, worker):
+    """Cierra las conexiones a la base de datos del maestro antes de crear workers."""
+    if server.cfg.preload_app:
+        from django.db import connections
+        connections.close_all()
+
+
+def post_fork(server, worker):
+    """
+    Descarta en el worker las conexiones heredadas del maestro.
+    Con preload, una conexión abierta al importar la aplicación quedaría
+    compartida entre procesos; se suelta sin cerrarla para que cada worker
+    abra la suya en su primer request.
+    """
+    if server.cfg.preload_app:
+        from django.db import connections
+        for connection in connections.all(initialized_only=True):
+            connection.connection = None
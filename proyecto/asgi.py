@@ -13,4 +13,7 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'proyecto.settings')
 
+# Bajo ASGI se usan las vistas async (app_1/async_views.py)
+os.environ.setdefault('ASGI_MODE', 'True')
+
 application = get_asgi_application()
@@ -0,0 +1,79 @@
+"""
+Envío de emails sin bloquear el event loop (vistas async bajo ASGI).
+
+El backend SMTP de Django es síncrono: mientras espera al servidor de
+correo bloquea el hilo. asend_messages() envía los EmailMessage de Django
+(EmailMultiAlternatives incluido) con aiosmtplib, así que una vista async
+espera al SMTP sin ocupar un hilo ni frenar las otras conexiones del worker.
+
+Usa la misma configuración que el backend SMTP (EMAIL_HOST, EMAIL_PORT,
+EMAIL_USE_TLS, EMAIL_USE_SSL, EMAIL_HOST_USER, EMAIL_HOST_PASSWORD y
+EMAIL_TIMEOUT). Con otro EMAIL_BACKEND (consola, locmem en pruebas) o sin
+aiosmtplib instalado, los mensajes se envían con el backend configurado en
+un hilo aparte.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.message import sanitize_address
+
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
+SMTP_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
+# Segundos de espera al servidor SMTP si EMAIL_TIMEOUT no está definido
+DEFAULT_TIMEOUT = 30
+
+
+def _send_with_backend(messages, fail_silently):
+    connection = get_connection(fail_silently=fail_silently)
+    return connection.send_messages(messages) or 0
+
+
+async def asend_messages(messages, fail_silently=False):
+    """
+    Envía los mensajes por una sola conexión SMTP.
+
+    Returns:
+        int: Cantidad de mensajes enviados
+    """
+    messages = [message for message in messages if message.recipients()]
+    if not messages:
+        return 0
+
+    if aiosmtplib is None or settings.EMAIL_BACKEND != SMTP_BACKEND:
+        return await sync_to_async(_send_with_backend, thread_sensitive=False)(messages, fail_silently)
+
+    sent = 0
+    try:
+        async with aiosmtplib.SMTP(
+            hostname=settings.EMAIL_HOST,
+            port=settings.EMAIL_PORT,
+            use_tls=settings.EMAIL_USE_SSL,
+            start_tls=settings.EMAIL_USE_TLS and not settings.EMAIL_USE_SSL,
+            timeout=settings.EMAIL_TIMEOUT or DEFAULT_TIMEOUT,
+        ) as smtp:
+            if settings.EMAIL_HOST_USER:
+                await smtp.login(settings.EMAIL_HOST_USER, settings.EMAIL_HOST_PASSWORD)
+            for message in messages:
+                # Igual que el backend SMTP de Django: direcciones saneadas y
+                # el MIME completo con CRLF
+                encoding = message.encoding or settings.DEFAULT_CHARSET
+                await smtp.sendmail(
+                    sanitize_address(message.from_email, encoding),
+                    [sanitize_address(address, encoding) for address in message.recipients()],
+                    message.message().as_bytes(linesep='\r\n'),
+                )
+                sent += 1
+    except Exception:
+        if not fail_silently:
+            raise
+    return sent
+
+
+async def asend_message(message, fail_silently=False):
+    """Envía un solo mensaje (ver asend_messages)."""
+    return await asend_messages([message], fail_silently=fail_silently)
@@ -0,0 +1,174 @@
+"""
+Construcción de los paquetes (bundles) de CSS y JavaScript por layout.
+
+Cada layout carga un solo CSS y un solo JS con las dependencias alojadas en
+el propio proyecto (proyecto/static/proyecto/vendor) en lugar de CDNs, de
+modo que el navegador no abre conexiones a otros dominios. Los paquetes se
+generan con ``python manage.py build_bundles`` y se versionan en Git; en
+producción collectstatic les agrega el hash del contenido al nombre y
+WhiteNoise los sirve con caché inmutable.
+
+Configuración (settings.py):
+- STATIC_BUNDLES: Diccionario {ruta del paquete: [rutas estáticas de origen]}
+- STATIC_BUNDLES_ROOT: Directorio donde se escriben los paquetes
+
+La minificación usa rcssmin y rjsmin si están instalados; si no, los
+archivos solo se concatenan.
+"""
+import os
+import posixpath
+import re
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import AppDirectoriesFinder, FileSystemFinder
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+# Comentarios de source maps (los .map no se publican)
+CSS_SOURCEMAP_RE = re.compile(r'/\*#\s*sourceMappingURL=[^*]*\*/')
+JS_SOURCEMAP_RE = re.compile(r'^\s*//[#@]\s*sourceMappingURL=.*$', re.MULTILINE)
+
+# @charset solo es válido al inicio del archivo final
+CSS_CHARSET_RE = re.compile(r'@charset\s+"[^"]*"\s*;', re.IGNORECASE)
+
+# Fuentes de Google que el tema importa; se usan las de proyecto/vendor/roboto
+CSS_REMOTE_FONT_IMPORT_RE = re.compile(
+    r'@import\s+url\(\s*[\'"]?https?://fonts\.googleapis\.com/[^)]*\)\s*;', re.IGNORECASE
+)
+
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)(?P<url>[^'")]+)\1\s*\)""", re.IGNORECASE)
+
+# Prefijos de URLs que no se reescriben
+EXTERNAL_PREFIXES = ('data:', 'http:', 'https:', '//', '#', '/')
+
+
+def locate_source(path):
+    """Retorna la ruta absoluta de un archivo estático de origen, o None."""
+    for finder in (FileSystemFinder(), AppDirectoriesFinder()):
+        match = finder.find(path)
+        if match:
+            return match
+    return None
+
+
+def read_source(path):
+    """Lee un archivo de origen del paquete."""
+    full_path = locate_source(path)
+    if full_path is None:
+        raise FileNotFoundError(f'Archivo de origen no encontrado: {path}')
+    with open(full_path, encoding='utf-8') as file:
+        return file.read()
+
+
+def rebase_css_urls(content, source_name, bundle_name):
+    """
+    Reescribe las url(...) relativas de un CSS para que sigan apuntando
+    al mismo archivo desde la ubicación del paquete.
+    """
+    source_dir = posixpath.dirname(source_name)
+    bundle_dir = posixpath.dirname(bundle_name)
+
+    def rebase(match):
+        url = match['url'].strip()
+        if url.lower().startswith(EXTERNAL_PREFIXES):
+            return match.group(0)
+
+        parts = urlsplit(url)
+        target = posixpath.normpath(posixpath.join(source_dir, parts.path))
+        rebased = posixpath.relpath(target, bundle_dir)
+        if parts.query:
+            rebased += f'?{parts.query}'
+        if parts.fragment:
+            rebased += f'#{parts.fragment}'
+        return f'url("{rebased}")'
+
+    return CSS_URL_RE.sub(rebase, content)
+
+
+def build_css(bundle_name, sources):
+    """
+    Concatena y minifica los CSS de un paquete.
+    Las fuentes de iconos completas se reemplazan por los subconjuntos de
+    ICON_CSS (ver proyecto/icons.py) y se eliminan los @import de Google
+    Fonts, que bloquean el render con una conexión a otro dominio.
+    """
+    # Importación local: proyecto.icons usa las funciones de este módulo
+    from proyecto.icons import strip_icon_css
+
+    has_charset = False
+    parts = []
+    for source in sources:
+        content = read_source(source)
+        content = CSS_SOURCEMAP_RE.sub('', content)
+        content, charsets = CSS_CHARSET_RE.subn('', content)
+        content = CSS_REMOTE_FONT_IMPORT_RE.sub('', content)
+        if source != settings.ICON_CSS:
+            content = strip_icon_css(content)
+        has_charset = has_charset or bool(charsets)
+        content = rebase_css_urls(content, source, bundle_name)
+        if rcssmin is not None:
+            content = rcssmin.cssmin(content, keep_bang_comments=True)
+        parts.append(f'/* {source} */\n{content.strip()}\n')
+
+    header = '@charset "UTF-8";\n' if has_charset else ''
+    return header + '\n'.join(parts)
+
+
+def build_js(sources):
+    """Concatena y minifica los JS de un paquete."""
+    parts = []
+    for source in sources:
+        content = read_source(source)
+        content = JS_SOURCEMAP_RE.sub('', content)
+        # Los archivos .min ya vienen minificados
+        if rjsmin is not None and '.min.' not in source:
+            content = rjsmin.jsmin(content, keep_bang_comments=True)
+        # El punto y coma evita que dos archivos se unan en una sola expresión
+        parts.append(f'/* {source} */\n{content.strip()}\n;')
+    return '\n'.join(parts) + '\n'
+
+
+def build_bundle(bundle_name, sources):
+    """Genera el contenido de un paquete según su extensión."""
+    if bundle_name.endswith('.css'):
+        return build_css(bundle_name, sources)
+    if bundle_name.endswith('.js'):
+        return build_js(sources)
+    raise ValueError(f'Tipo de paquete no soportado: {bundle_name}')
+
+
+def bundle_path(bundle_name):
+    """Ruta absoluta donde se escribe un paquete."""
+    return os.path.join(settings.STATIC_BUNDLES_ROOT, *bundle_name.split('/'))
+
+
+def write_bundle(bundle_name, content):
+    """
+    Escribe el paquete solo si su contenido cambió, para conservar la fecha
+    de modificación (la usan boot y la caché de hashes de collectstatic).
+
+    Returns:
+        bool: True si el archivo se escribió
+    """
+    path = bundle_path(bundle_name)
+    try:
+        with open(path, encoding='utf-8') as file:
+            if file.read() == content:
+                return False
+    except OSError:
+        pass
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as file:
+        file.write(content)
+    os.replace(path + '.tmp', path)
+    return True
@@ -0,0 +1,179 @@
+"""
+Procesamiento del lado del servidor para DataTables.
+
+Con procesamiento del lado del cliente (initializeDataTables.js sin
+data-source) la página envía todas las filas al navegador. ServerSideTable
+implementa el protocolo serverSide de DataTables sobre un queryset: el
+navegador pide una página con su orden y búsqueda, y la respuesta trae solo
+esas filas en JSON.
+
+- Lista blanca de columnas: solo las declaradas en columns se pueden
+  mostrar, ordenar o buscar; cualquier otra columna es un error 400
+- Paginación por clave: al avanzar o retroceder una página, el navegador
+  envía el cursor de la primera o la última fila (parámetros after/before)
+  y la consulta continúa desde esa fila sobre el índice en lugar de usar
+  OFFSET. Al saltar a una página cualquiera se usa OFFSET
+- Conteos sin recorrer la tabla (count_rows() de proyecto/pagination.py)
+- Búsqueda sobre índices según la base de datos (proyecto/search.py)
+
+Configuración (settings.py):
+- DATATABLES_MAX_LENGTH: Máximo de filas por página
+"""
+from django.conf import settings
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.http import JsonResponse
+
+from proyecto.exports import serialize
+from proyecto.pagination import count_rows, decode_cursor, encode_cursor, keyset_filter
+from proyecto.search import indexed_lookups, lookup_field, search_queryset
+
+
+class TableRequestError(Exception):
+    """Parámetros de DataTables inválidos o fuera de la lista blanca."""
+
+
+def parse_int(value, default, name):
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise TableRequestError(f'{name} debe ser un número')
+
+
+class ServerSideTable:
+    """
+    Tabla de DataTables con procesamiento del lado del servidor.
+
+    Args:
+        queryset: Filas de la tabla
+        columns: {nombre de la columna en DataTables: ruta del campo}, por
+            ejemplo {'email': 'email', 'user_email': 'user__email'}
+        ordering: Orden por defecto, como ('-date_joined',)
+        search_fields: Columnas donde buscar con icontains
+        indexed_search_fields: {motor: lookups} para buscar sobre índices
+            (como en IndexedSearchMixin); si el motor no está, search_fields
+    """
+
+    def __init__(self, queryset, columns, ordering, search_fields=(), indexed_search_fields=None):
+        self.queryset = queryset
+        self.columns = dict(columns)
+        self.ordering = tuple(ordering)
+        self.search_lookups = (
+            indexed_lookups(indexed_search_fields or {}, queryset)
+            or [f'{self.columns[name]}__icontains' for name in search_fields]
+        )
+
+    def response(self, request):
+        """Respuesta JSON para una petición de DataTables (GET)."""
+        params = request.GET
+        try:
+            draw = parse_int(params.get('draw'), 0, 'draw')
+            return JsonResponse(self.get_data(params, draw))
+        except (TableRequestError, IncorrectLookupParameters) as error:
+            return JsonResponse({'draw': params.get('draw'), 'error': str(error)}, status=400)
+
+    def get_ordering(self, params):
+        """
+        Orden pedido por DataTables (order[i][column] es el índice de
+        columns[i][data]), o el orden por defecto.
+
+        Returns:
+            list: [(ruta del campo, descendente), ...] terminada en la clave primaria
+        """
+        ordering = []
+        index = 0
+        while f'order[{index}][column]' in params:
+            column = parse_int(params.get(f'order[{index}][column]'), None, 'order')
+            name = params.get(f'columns[{column}][data]')
+            if name not in self.columns:
+                raise TableRequestError(f'No se puede ordenar por la columna {name!r}')
+            descending = params.get(f'order[{index}][dir]') == 'desc'
+            ordering.append((self.columns[name], descending))
+            index += 1
+
+        if not ordering:
+            ordering = [(name.lstrip('-'), name.startswith('-')) for name in self.ordering]
+        # La clave primaria desempata filas con el mismo valor
+        if ordering[-1][0] != 'pk':
+            ordering.append(('pk', ordering[-1][1]))
+        return ordering
+
+    def get_keyset(self, ordering):
+        """
+        Rutas, campos y sentido para paginar por clave, o None si el orden
+        no lo permite (sentidos mezclados o columnas que admiten NULL).
+        """
+        descending = ordering[0][1]
+        if any(direction != descending for _, direction in ordering):
+            return None
+        model = self.queryset.model
+        paths = [path for path, _ in ordering]
+        fields = [
+            model._meta.pk if path == 'pk' else lookup_field(model, f'{path}__exact')
+            for path in paths
+        ]
+        if any(field.null for field in fields):
+            return None
+        return paths, fields, descending
+
+    def get_data(self, params, draw):
+        start = max(0, parse_int(params.get('start'), 0, 'start'))
+        length = parse_int(params.get('length'), 10, 'length')
+        # length = -1 es "Todos" en DataTables: también se limita
+        if length <= 0 or length > settings.DATATABLES_MAX_LENGTH:
+            length = settings.DATATABLES_MAX_LENGTH
+
+        ordering = self.get_ordering(params)
+        queryset = self.queryset.order_by(*[f'-{path}' if desc else path for path, desc in ordering])
+        total, _ = count_rows(self.queryset)
+
+        search = params.get('search[value]', '').strip()
+        if search:
+            queryset = search_queryset(queryset, self.search_lookups, search)
+            filtered, _ = count_rows(queryset)
+        else:
+            filtered = total
+
+        keyset = self.get_keyset(ordering)
+        after = params.get('after') if keyset else None
+        before = params.get('before') if keyset and not after else None
+        paths = list(self.columns.values())
+        rows = queryset.values_list(*paths, *[path for path, _ in ordering])
+        if before:
+            key_paths, fields, descending = keyset
+            values = decode_cursor(before, fields)
+            reverse = [path if descending else f'-{path}' for path in key_paths]
+            rows = rows.filter(keyset_filter(key_paths, values, descending, after=False)).order_by(*reverse)
+        elif after:
+            key_paths, fields, descending = keyset
+            values = decode_cursor(after, fields)
+            rows = rows.filter(keyset_filter(key_paths, values, descending, after=True))
+        else:
+            rows = rows[start:]
+
+        rows = list(rows[:length + 1])
+        has_more = len(rows) > length
+        rows = rows[:length]
+        if before:
+            rows.reverse()
+
+        names = list(self.columns)
+        data = [dict(zip(names, map(serialize, row[:len(names)]))) for row in rows]
+        cursors = None
+        if keyset and rows:
+            cursors = {
+                'first': encode_cursor(rows[0][len(names):]),
+                'last': encode_cursor(rows[-1][len(names):]),
+            }
+
+        # Los conteos pueden ser aproximados: nunca menos de lo ya recorrido,
+        # para que DataTables habilite la página siguiente si hay más filas
+        filtered = max(filtered, start + len(rows) + (1 if has_more and not before else 0))
+        return {
+            'draw': draw,
+            'recordsTotal': max(total, filtered),
+            'recordsFiltered': filtered,
+            'data': data,
+            'cursors': cursors,
+        }
@@ -0,0 +1,258 @@
+"""
+Finders de archivos estáticos del proyecto.
+
+ReachableFileSystemFinder reemplaza al FileSystemFinder de Django y solo
+expone los archivos de STATICFILES_DIRS que son alcanzables desde las
+plantillas del proyecto. El grafo de referencias se construye así:
+
+1. Las plantillas (DIRS de TEMPLATES y carpetas templates/ de las
+   aplicaciones del proyecto) aportan las rutas usadas con {% static %}
+2. Cada CSS alcanzable aporta sus url(...) y @import
+3. Cada JS alcanzable aporta las cadenas que apuntan a archivos existentes
+
+Los archivos que ningún camino referencia (imágenes de demostración,
+mapas de jqvmap, temas alternativos, .map, librerías sin usar) no se
+recolectan con collectstatic ni se sirven en desarrollo.
+
+Configuración (settings.py):
+- STATICFILES_REACHABLE_EXTRA: Patrones (fnmatch) de archivos que se cargan
+  dinámicamente y deben incluirse aunque ninguna plantilla los referencie
+
+Para ver el grafo calculado: python manage.py static_graph
+"""
+import fnmatch
+import os
+import posixpath
+import re
+from urllib.parse import unquote, urlsplit
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles.finders import AppDirectoriesFinder, FileSystemFinder
+
+# {% static 'ruta' %} o {% static "ruta" %}
+TEMPLATE_STATIC_RE = re.compile(r"""{%\s*static\s+(['"])(?P<path>[^'"]+)\1""")
+
+# url(...) e @import "..." dentro de hojas de estilo
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)(?P<path>[^'")]+)\1\s*\)""", re.IGNORECASE)
+CSS_IMPORT_RE = re.compile(r"""@import\s+(['"])(?P<path>[^'"]+)\1""", re.IGNORECASE)
+
+# Cadenas de JavaScript que parecen rutas de archivos estáticos
+# (se excluyen los .map: solo los usan las herramientas de desarrollo)
+JS_ASSET_RE = re.compile(
+    r"""(['"])(?P<path>[\w./-]+\.(?:css|js|json|png|jpe?g|gif|svg|ico|webp|woff2?|ttf|eot))\1"""
+)
+
+# Prefijos de URLs que no apuntan a archivos locales
+EXTERNAL_PREFIXES = ('data:', 'http:', 'https:', '//', '#', 'about:', 'javascript:')
+
+
+class StaticGraph:
+    """
+    Grafo de archivos estáticos alcanzables desde las plantillas.
+
+    Attributes:
+        reachable: Rutas estáticas alcanzables (relativas a STATIC_URL)
+        missing: Pares (origen, referencia) que apuntan a archivos inexistentes
+        sources: Archivos que originaron el recorrido (plantillas y patrones extra)
+    """
+
+    def __init__(self, locate, all_paths=()):
+        """
+        Args:
+            locate: Función que recibe una ruta estática y retorna la ruta
+                absoluta del archivo, o None si no existe
+            all_paths: Todas las rutas estáticas disponibles, usadas para
+                resolver los patrones de STATICFILES_REACHABLE_EXTRA
+        """
+        self.locate = locate
+        self.all_paths = all_paths
+        self.reachable = set()
+        self.missing = set()
+        self.sources = []
+
+    def build(self):
+        """Recorre el grafo desde las plantillas y los patrones extra."""
+        pending = []
+
+        for template in iter_template_files():
+            self.sources.append(template)
+            for path in scan_template(template):
+                pending.append((template, path))
+
+        for pattern in getattr(settings, 'STATICFILES_REACHABLE_EXTRA', []):
+            self.sources.append(pattern)
+            for path in fnmatch.filter(self.all_paths, pattern):
+                pending.append((pattern, path))
+
+        while pending:
+            origin, path = pending.pop()
+            if path in self.reachable:
+                continue
+
+            full_path = self.locate(path)
+            if full_path is None:
+                self.missing.add((origin, path))
+                continue
+
+            self.reachable.add(path)
+            for reference in self.references(path, full_path):
+                pending.append((path, reference))
+
+        return self
+
+    def references(self, path, full_path):
+        """Retorna las rutas estáticas que referencia un CSS o JS."""
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in ('.css', '.js'):
+            return []
+
+        with open(full_path, encoding='utf-8', errors='replace') as file:
+            content = file.read()
+
+        base_dir = posixpath.dirname(path)
+
+        if extension == '.css':
+            references = []
+            for regex in (CSS_URL_RE, CSS_IMPORT_RE):
+                for match in regex.finditer(content):
+                    resolved = resolve_reference(base_dir, match['path'])
+                    if resolved:
+                        references.append(resolved)
+            return references
+
+        # En JS las rutas se resuelven contra la página, no contra el script;
+        # se prueban las ubicaciones habituales y solo se aceptan las que existen
+        top_dir = path.split('/', 1)[0] if '/' in path else ''
+        references = []
+        for match in JS_ASSET_RE.finditer(content):
+            for candidate_base in (base_dir, top_dir, ''):
+                resolved = resolve_reference(candidate_base, match['path'])
+                if resolved and self.locate(resolved):
+                    references.append(resolved)
+                    break
+        return references
+
+
+def resolve_reference(base_dir, reference):
+    """
+    Convierte una referencia de CSS/JS en una ruta estática normalizada,
+    o None si es externa o sale del árbol de estáticos.
+    """
+    reference = reference.strip()
+    if not reference or reference.lower().startswith(EXTERNAL_PREFIXES):
+        return None
+
+    reference = unquote(urlsplit(reference).path)
+    if not reference:
+        return None
+
+    if reference.startswith('/'):
+        static_url = urlsplit(settings.STATIC_URL).path
+        if not reference.startswith(static_url):
+            return None
+        path = reference[len(static_url):]
+    else:
+        path = posixpath.join(base_dir, reference)
+
+    path = posixpath.normpath(path)
+    if path.startswith('..') or path == '.':
+        return None
+    return path
+
+
+def template_directories():
+    """Directorios de TEMPLATES['DIRS'] y carpetas templates/ de las aplicaciones del proyecto."""
+    directories = []
+    for backend in settings.TEMPLATES:
+        directories.extend(str(directory) for directory in backend.get('DIRS', []))
+
+    base_dir = str(settings.BASE_DIR)
+    for app_config in apps.get_app_configs():
+        if app_config.path.startswith(base_dir):
+            directories.append(os.path.join(app_config.path, 'templates'))
+    return directories
+
+
+def iter_template_files():
+    """Recorre las plantillas de TEMPLATES['DIRS'] y de las aplicaciones del proyecto."""
+    for directory in template_directories():
+        for root, _, files in os.walk(directory):
+            for name in sorted(files):
+                if name.endswith(('.html', '.txt')):
+                    yield os.path.join(root, name)
+
+
+def scan_template(template):
+    """Retorna las rutas usadas con {% static %} en una plantilla."""
+    with open(template, encoding='utf-8') as file:
+        return [match['path'] for match in TEMPLATE_STATIC_RE.finditer(file.read())]
+
+
+def templates_signature():
+    """Firma de las plantillas (ruta y fecha) para detectar cambios en desarrollo."""
+    signature = []
+    for template in iter_template_files():
+        try:
+            signature.append((template, os.stat(template).st_mtime_ns))
+        except OSError:
+            pass
+    return tuple(signature)
+
+
+class ReachableFileSystemFinder(FileSystemFinder):
+    """
+    FileSystemFinder que solo encuentra y lista archivos alcanzables.
+
+    En producción el grafo se calcula una vez por proceso; con DEBUG se
+    recalcula cuando cambia alguna plantilla.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._graph = None
+        self._signature = None
+        self._app_finder = AppDirectoriesFinder()
+
+    @property
+    def graph(self):
+        """Grafo de archivos alcanzables (calculado de forma diferida)."""
+        if self._graph is not None and not settings.DEBUG:
+            return self._graph
+
+        signature = templates_signature()
+        if self._graph is None or signature != self._signature:
+            self._signature = signature
+            self._graph = StaticGraph(self.locate, self.all_paths()).build()
+        return self._graph
+
+    def locate(self, path):
+        """Busca una ruta en STATICFILES_DIRS y en las aplicaciones, sin filtrar."""
+        for prefix, root in self.locations:
+            matched_path = super().find_location(root, path, prefix)
+            if matched_path:
+                return matched_path
+        return self._app_finder.find(path) or None
+
+    def all_paths(self):
+        """Lista todas las rutas de STATICFILES_DIRS, sin filtrar."""
+        paths = []
+        for path, storage in super().list(['CVS', '.*', '*~']):
+            prefix = getattr(storage, 'prefix', None)
+            paths.append(f'{prefix}/{path}' if prefix else path)
+        return paths
+
+    def find_location(self, root, path, prefix=None):
+        """Encuentra el archivo solo si es alcanzable desde las plantillas."""
+        if posixpath.normpath(path.replace(os.sep, '/')) not in self.graph.reachable:
+            return None
+        return super().find_location(root, path, prefix)
+
+    def list(self, ignore_patterns):
+        """Lista solo los archivos alcanzables."""
+        reachable = self.graph.reachable
+        for path, storage in super().list(ignore_patterns):
+            prefix = getattr(storage, 'prefix', None)
+            name = f'{prefix}/{path}' if prefix else path
+            if name.replace(os.sep, '/') in reachable:
+                yield path, storage
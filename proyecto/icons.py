@@ -0,0 +1,250 @@
+"""
+Subconjuntos de las fuentes de iconos (Font Awesome y nextgen-icons).
+
+Las familias completas pesan varios MB, pero las plantillas usan unas
+pocas decenas de iconos. ``python manage.py subset_icons``:
+
+1. Busca las clases fa-* / ni-* en las plantillas y en el JS alcanzable,
+   y los glifos que los CSS usan directamente en content
+2. Genera para cada familia un woff2 con solo esos glifos
+   (proyecto/webfonts/subset/)
+3. Genera un CSS con las @font-face de los subconjuntos y solo las reglas
+   de los iconos usados (proyecto/css/icons.css)
+
+Al construir los paquetes (build_bundles) se eliminan de los CSS de origen
+las @font-face de las fuentes completas y las reglas de iconos, de modo
+que el paquete solo incluye icons.css.
+
+Configuración (settings.py):
+- ICON_FONTS: Familias a recortar (fuente de origen, font-family, peso, clase y prefijo)
+- ICON_GLYPH_CSS: CSS de origen con las reglas .fa-nombre:before { content }
+- ICON_EXTRA_CLASSES: Iconos que se arman dinámicamente y no aparecen literalmente
+- ICON_CSS: Ruta estática del CSS generado
+"""
+import os
+import re
+
+from django.conf import settings
+
+from proyecto.bundles import locate_source, read_source
+from proyecto.finders import ReachableFileSystemFinder, iter_template_files
+
+# Directorio (ruta estática) de las fuentes recortadas
+SUBSET_DIR = 'proyecto/webfonts/subset'
+
+# Reglas CSS sin bloques anidados: selectores { declaraciones }
+CSS_RULE_RE = re.compile(r'(?P<selectors>[^{}]+)\{(?P<body>[^{}]*)\}')
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_CONTENT_RE = re.compile(r'content\s*:\s*"\\(?P<code>[0-9a-fA-F]+)"')
+FONT_FACE_RE = re.compile(r'@font-face\s*\{(?P<body>[^{}]*)\}', re.IGNORECASE)
+FONT_FAMILY_RE = re.compile(r"""font-family\s*:\s*['"]?(?P<family>[^'";]+)""", re.IGNORECASE)
+FONT_WEIGHT_RE = re.compile(r'font-weight\s*:\s*(?P<weight>[\w-]+)', re.IGNORECASE)
+
+# Área de uso privado de Unicode, donde las fuentes de iconos ubican sus glifos
+PRIVATE_USE_AREA = range(0xE000, 0xF900)
+
+# Pesos con nombre de CSS
+FONT_WEIGHT_NAMES = {'normal': '400', 'bold': '700'}
+
+
+def icon_prefixes():
+    """Prefijos de las clases de iconos configuradas (fa-, ni-)."""
+    return sorted({font['prefix'] for font in settings.ICON_FONTS.values()})
+
+
+def glyph_selector_re():
+    """Expresión para selectores de iconos: .fa-nombre:before o .ni-nombre::before."""
+    prefixes = '|'.join(re.escape(prefix) for prefix in icon_prefixes())
+    return re.compile(rf'^\.(?P<name>(?:{prefixes})[\w-]+)::?before$')
+
+
+def iter_glyph_rules(content):
+    """
+    Recorre las reglas de iconos de un CSS.
+
+    Yields:
+        tuple: (match de la regla, nombres de los iconos, código del glifo)
+    """
+    selector_re = glyph_selector_re()
+    for match in CSS_RULE_RE.finditer(content):
+        code = CSS_CONTENT_RE.search(match['body'])
+        if code is None:
+            continue
+        selectors = [
+            selector.strip()
+            for selector in CSS_COMMENT_RE.sub('', match['selectors']).split(',')
+        ]
+        names = [selector_re.match(selector) for selector in selectors]
+        if selectors and all(names):
+            yield match, [name['name'] for name in names], int(code['code'], 16)
+
+
+def load_glyph_map():
+    """Retorna {clase de icono: código del glifo} a partir de ICON_GLYPH_CSS."""
+    glyphs = {}
+    for source in settings.ICON_GLYPH_CSS:
+        for _, names, code in iter_glyph_rules(read_source(source)):
+            for name in names:
+                glyphs[name] = code
+    return glyphs
+
+
+def iter_scanned_files():
+    """Plantillas del proyecto y archivos JS alcanzables desde ellas."""
+    yield from iter_template_files()
+
+    finder = ReachableFileSystemFinder()
+    for path in sorted(finder.graph.reachable):
+        if path.endswith('.js'):
+            yield finder.locate(path)
+
+
+def iter_scanned_css():
+    """CSS de los paquetes (salvo ICON_CSS) y CSS alcanzables desde las plantillas."""
+    sources = {
+        source
+        for bundle, bundle_sources in settings.STATIC_BUNDLES.items() if bundle.endswith('.css')
+        for source in bundle_sources if source != settings.ICON_CSS
+    }
+    finder = ReachableFileSystemFinder()
+    sources.update(path for path in finder.graph.reachable if path.endswith('.css'))
+    for source in sorted(sources):
+        path = locate_source(source)
+        if path is not None:
+            yield path
+
+
+def find_css_codepoints():
+    """
+    Códigos de glifos que los CSS usan directamente en content (por ejemplo
+    .dropdown-item:after { font-family: 'nextgen-icons'; content: "\\f2fb" }),
+    fuera de las reglas .fa-nombre:before que reemplaza ICON_CSS.
+    """
+    families = {font['family'] for font in settings.ICON_FONTS.values()}
+    codepoints = set()
+    for path in iter_scanned_css():
+        with open(path, encoding='utf-8', errors='replace') as file:
+            content = CSS_COMMENT_RE.sub('', file.read())
+        glyph_rules = {match.start() for match, _, _ in iter_glyph_rules(content)}
+        for match in CSS_RULE_RE.finditer(content):
+            if match.start() in glyph_rules:
+                continue
+            code = CSS_CONTENT_RE.search(match['body'])
+            if code is None or int(code['code'], 16) not in PRIVATE_USE_AREA:
+                continue
+            # Sin font-family la regla puede heredar cualquier familia de iconos
+            family = FONT_FAMILY_RE.search(match['body'])
+            if family is None or family['family'].strip() in families:
+                codepoints.add(int(code['code'], 16))
+    return codepoints
+
+
+def find_used_icons(glyphs):
+    """
+    Busca las clases de iconos usadas en plantillas y JS.
+    Solo se consideran las que tienen un glifo (se descartan fa-spin, fa-2x...).
+    """
+    prefixes = '|'.join(re.escape(prefix) for prefix in icon_prefixes())
+    class_re = re.compile(rf'(?<![\w-])(?:{prefixes})[a-z0-9-]+')
+
+    used = set(getattr(settings, 'ICON_EXTRA_CLASSES', []))
+    for path in iter_scanned_files():
+        with open(path, encoding='utf-8', errors='replace') as file:
+            used.update(class_re.findall(file.read()))
+
+    return {name: glyphs[name] for name in used if name in glyphs}
+
+
+def subset_font(source_path, codepoints, output_path):
+    """Genera un woff2 con solo los glifos indicados."""
+    from fontTools import subset
+
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = []
+    options.name_IDs = []
+    options.notdef_outline = True
+    options.ignore_missing_unicodes = True
+
+    font = subset.load_font(source_path, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    subset.save_font(font, output_path + '.tmp', options)
+    font.close()
+    os.replace(output_path + '.tmp', output_path)
+
+
+def build_icon_css(used):
+    """Genera el CSS con las @font-face recortadas y las reglas de los iconos usados."""
+    lines = [
+        '/* Generado por "python manage.py subset_icons" - no editar */',
+    ]
+    for key, font in settings.ICON_FONTS.items():
+        lines.append(
+            f"@font-face {{\n"
+            f"  font-family: '{font['family']}';\n"
+            f"  font-style: normal;\n"
+            f"  font-weight: {font['weight']};\n"
+            f"  font-display: block;\n"
+            f"  src: url(\"../webfonts/subset/{key}.woff2\") format(\"woff2\"); }}\n"
+        )
+        lines.append(
+            f".{font['class']} {{\n"
+            f"  font-family: '{font['family']}';\n"
+            f"  font-weight: {font['weight']}; }}\n"
+        )
+
+    for name, code in sorted(used.items()):
+        lines.append(f'.{name}:before {{\n  content: "\\{code:x}"; }}\n')
+
+    return '\n'.join(lines)
+
+
+def normalize_weight(weight):
+    """Peso de una @font-face como número en texto ('normal' -> '400')."""
+    weight = str(weight).strip().lower()
+    return FONT_WEIGHT_NAMES.get(weight, weight)
+
+
+def strip_icon_css(content):
+    """
+    Elimina de un CSS las @font-face de las familias y pesos recortados y
+    las reglas de iconos; ambas quedan reemplazadas por ICON_CSS. Las
+    @font-face de otros pesos (por ejemplo, Font Awesome 5 Pro 900) se
+    conservan.
+    """
+    subset_faces = {
+        (font['family'], normalize_weight(font['weight'])) for font in settings.ICON_FONTS.values()
+    }
+
+    def strip_font_face(match):
+        family = FONT_FAMILY_RE.search(match['body'])
+        weight = FONT_WEIGHT_RE.search(match['body'])
+        face = (
+            family['family'].strip() if family else None,
+            normalize_weight(weight['weight'] if weight else 'normal'),
+        )
+        if face in subset_faces:
+            return ''
+        return match.group(0)
+
+    content = FONT_FACE_RE.sub(strip_font_face, content)
+
+    # Se recorre de atrás hacia adelante para no alterar las posiciones
+    for match, _, _ in reversed(list(iter_glyph_rules(content))):
+        content = content[:match.start()] + '\n' + content[match.end():]
+    return content
+
+
+def icon_sources():
+    """Retorna {clave de familia: ruta absoluta de la fuente de origen}."""
+    sources = {}
+    for key, font in settings.ICON_FONTS.items():
+        path = locate_source(font['font'])
+        if path is None:
+            raise FileNotFoundError(f"Fuente de origen no encontrada: {font['font']}")
+        sources[key] = path
+    return sources
@@ -0,0 +1,83 @@
+"""
+Almacenamiento de mensajes flash solo en cookie.
+
+El FallbackStorage por defecto guarda en la sesión los mensajes que no
+caben en la cookie, lo que agrega una escritura en django_session. Con
+CompactCookieStorage los mensajes nunca tocan la sesión:
+
+1. Los mensajes repetidos (mismo nivel, texto y etiquetas) se guardan una vez
+2. La cookie se firma y se comprime con zlib cuando eso la reduce (igual
+   que CookieStorage)
+3. Si no cabe en max_cookie_size, se recortan los textos largos que no son
+   HTML (MESSAGE_MAX_LENGTH) y, como último recurso, se descartan los
+   mensajes más antiguos
+
+Configuración (settings.py):
+- MESSAGE_STORAGE: 'proyecto.message_storage.CompactCookieStorage'
+- MESSAGE_MAX_LENGTH: Caracteres a los que se recorta un mensaje cuando la cookie no alcanza
+
+Para medir la cadena registro -> login: python benchmarks/bench_messages.py
+"""
+from django.conf import settings
+from django.contrib.messages.storage.base import Message
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.http import SimpleCookie
+from django.utils.safestring import SafeData
+
+
+class CompactCookieStorage(CookieStorage):
+    """CookieStorage que deduplica, recorta y nunca delega en la sesión."""
+
+    def _get(self, *args, **kwargs):
+        """Lee los mensajes de la cookie; no hay otro almacenamiento que consultar."""
+        messages, _ = super()._get(*args, **kwargs)
+        return messages, True
+
+    def _store(self, messages, response, *args, **kwargs):
+        """
+        Guarda los mensajes en la cookie.
+
+        Returns:
+            list: Mensajes descartados por falta de espacio (con DEBUG,
+                MessageMiddleware lanza un error para advertirlo)
+        """
+        messages = self._deduplicate(messages)
+
+        if not self._fits(messages):
+            messages = [self._truncate(message) for message in messages]
+
+        # Descartar los más antiguos hasta que la cookie quepa
+        dropped = 0
+        while dropped < len(messages) and not self._fits(messages[dropped:]):
+            dropped += 1
+
+        self._update_cookie(self._encode(messages[dropped:]), response)
+        return messages[:dropped]
+
+    def _fits(self, messages):
+        """Indica si los mensajes caben en la cookie (con el escapado de SimpleCookie)."""
+        if not self.max_cookie_size:
+            return True
+        encoded = self._encode(messages)
+        return not encoded or len(SimpleCookie().value_encode(encoded)[1]) <= self.max_cookie_size
+
+    @staticmethod
+    def _deduplicate(messages):
+        """Elimina los mensajes idénticos conservando el orden."""
+        seen = set()
+        unique = []
+        for message in messages:
+            key = (message.level, str(message.message), message.extra_tags)
+            if key not in seen:
+                seen.add(key)
+                unique.append(message)
+        return unique
+
+    @staticmethod
+    def _truncate(message):
+        """Recorta el texto de un mensaje; el HTML (mark_safe) no se corta para no romperlo."""
+        max_length = settings.MESSAGE_MAX_LENGTH
+        text = message.message
+        if isinstance(text, SafeData) or len(str(text)) <= max_length:
+            return message
+        return Message(message.level, str(text)[:max_length - 1] + '…', message.extra_tags)
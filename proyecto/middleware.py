@@ -0,0 +1,231 @@
+"""
+Middleware de respuestas del proyecto.
+
+OverloadMiddleware convierte ServiceOverloaded (por ejemplo, el pool de
+hashing de contraseñas saturado, ver app_1/hashers.py) en una respuesta
+503 con Retry-After, para que el cliente reintente más tarde.
+
+CompressionMiddleware comprime las respuestas dinámicas (HTML de render(),
+JSON, CSV) con Brotli o gzip según Accept-Encoding; los archivos estáticos
+ya los comprime WhiteNoise. Opcionalmente elimina la indentación del HTML
+antes de comprimir.
+
+BREACH: un atacante que puede inyectar texto en una página comprimida y
+medir su tamaño puede deducir secretos de la misma página. Django ya
+enmascara el token CSRF en cada respuesta; además, en las páginas con
+formularios CSRF:
+- 'pad': se comprime agregando bytes aleatorios de longitud aleatoria
+  (nombre de archivo en la cabecera gzip o comentario HTML con Brotli),
+  de modo que el tamaño deja de revelar coincidencias
+- 'skip': no se comprimen
+- 'off': se comprimen como cualquier otra página
+
+Configuración (settings.py):
+- COMPRESSION_MIN_SIZE: Bytes mínimos para comprimir
+- COMPRESSION_CONTENT_TYPES: Tipos MIME que se comprimen
+- COMPRESSION_BROTLI_QUALITY: Calidad de Brotli (0-11; 4-5 equilibra CPU y tamaño)
+- COMPRESSION_GZIP_LEVEL: Nivel de gzip (1-9)
+- COMPRESSION_BREACH_MODE: 'pad', 'skip' u 'off'
+- HTML_MINIFY: Eliminar la indentación y líneas vacías del HTML
+
+Para medir bytes y CPU: python benchmarks/bench_compression.py
+
+SessionMiddleware es el de Django, salvo que no guarda la sesión cuando la
+vista marca request.renew_session = False: con SESSION_SAVE_EVERY_REQUEST
+cada request renueva la expiración, y el canal de eventos de la sesión
+(app_1/session_events.py) no es actividad del usuario.
+
+Todos heredan de MiddlewareMixin, que los hace compatibles con WSGI y con
+ASGI. Bajo ASGI (ver app_1/async_views.py) MiddlewareMixin ejecuta sus
+métodos process_* en un hilo con sync_to_async en cada request (un cambio
+de hilo por método), pero la cadena sigue siendo async y las vistas async
+se ejecutan en el bucle de eventos.
+"""
+import gzip
+import re
+import secrets
+
+from django.conf import settings
+from django.contrib.sessions.middleware import SessionMiddleware as DjangoSessionMiddleware
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bytes aleatorios máximos para la mitigación de BREACH
+MAX_RANDOM_BYTES = 100
+
+# Marca del campo oculto que agrega {% csrf_token %}
+CSRF_FIELD_MARKER = b'name="csrfmiddlewaretoken"'
+
+# Etiquetas cuyo contenido depende de los espacios y no se modifica
+HTML_PROTECTED_RE = re.compile(
+    rb'(<(pre|textarea|script|style)\b.*?</\2\s*>)', re.IGNORECASE | re.DOTALL
+)
+
+# Espacios que incluyen al menos un salto de línea (indentación y líneas vacías)
+HTML_NEWLINE_SPACE_RE = re.compile(rb'[ \t\r]*\n\s*')
+
+ACCEPT_ENCODING_RE = re.compile(r'\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?\s*')
+
+
+class ServiceOverloaded(Exception):
+    """Un recurso limitado (pool de procesos, cola) está saturado; reintentar más tarde."""
+
+    retry_after = 5
+
+
+def minify_html(content):
+    """
+    Reemplaza cada bloque de espacios que contiene un salto de línea por un
+    solo salto de línea. Es seguro porque el navegador ya trata esos
+    espacios como uno; no se tocan <pre>, <textarea>, <script> ni <style>.
+    """
+    parts = HTML_PROTECTED_RE.split(content)
+    # split() intercala: texto, bloque protegido, nombre de etiqueta, texto...
+    result = []
+    for index, part in enumerate(parts):
+        position = index % 3
+        if position == 0:
+            result.append(HTML_NEWLINE_SPACE_RE.sub(b'\n', part))
+        elif position == 1:
+            result.append(part)
+    return b''.join(result).strip() + b'\n'
+
+
+def parse_accept_encoding(header):
+    """Retorna {codificación: q} del encabezado Accept-Encoding."""
+    encodings = {}
+    for item in header.split(','):
+        match = ACCEPT_ENCODING_RE.fullmatch(item)
+        if not match:
+            continue
+        try:
+            quality = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+        encodings[match.group(1).lower()] = quality
+    return encodings
+
+
+def choose_encoding(header):
+    """Elige 'br' o 'gzip' según Accept-Encoding (Brotli tiene preferencia), o None."""
+    encodings = parse_accept_encoding(header)
+    wildcard = encodings.get('*', 0)
+    candidates = ('br', 'gzip') if brotli is not None else ('gzip',)
+    best, best_quality = None, 0
+    for encoding in candidates:
+        quality = encodings.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def random_padding():
+    """Comentario HTML de longitud aleatoria para ocultar el tamaño comprimido."""
+    return b'<!-- ' + secrets.token_hex(secrets.randbelow(MAX_RANDOM_BYTES) + 1).encode() + b' -->'
+
+
+def compress(content, encoding, pad=False):
+    """
+    Comprime el contenido con la codificación indicada.
+
+    Args:
+        content: Bytes a comprimir
+        encoding: 'br' o 'gzip'
+        pad: Agregar bytes aleatorios (mitigación de BREACH)
+    """
+    if encoding == 'br':
+        if pad:
+            content += random_padding()
+        return brotli.compress(
+            content,
+            mode=brotli.MODE_TEXT,
+            quality=settings.COMPRESSION_BROTLI_QUALITY,
+        )
+
+    if pad:
+        # Django agrega un nombre de archivo aleatorio en la cabecera gzip
+        return compress_string(content, max_random_bytes=MAX_RANDOM_BYTES)
+    return gzip.compress(content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """Minifica y comprime las respuestas dinámicas según Accept-Encoding."""
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.content_types = tuple(settings.COMPRESSION_CONTENT_TYPES)
+
+    def process_response(self, request, response):
+        # Streaming (exportaciones, eventos) y respuestas ya codificadas se dejan igual
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type not in self.content_types:
+            return response
+
+        content = response.content
+        if content_type == 'text/html' and settings.HTML_MINIFY:
+            content = minify_html(content)
+            response.content = content
+            response.headers['Content-Length'] = str(len(content))
+
+        if len(content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        has_secret = CSRF_FIELD_MARKER in content
+        mode = settings.COMPRESSION_BREACH_MODE
+        if has_secret and mode == 'skip':
+            return response
+
+        compressed = compress(content, encoding, pad=has_secret and mode == 'pad')
+        if len(compressed) >= len(content):
+            return response
+
+        response.content = compressed
+        response.headers['Content-Length'] = str(len(compressed))
+        response.headers['Content-Encoding'] = encoding
+
+        # Un ETag fuerte debe volverse débil al cambiar la representación
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+
+        return response
+
+
+class OverloadMiddleware(MiddlewareMixin):
+    """Responde 503 Service Unavailable cuando una vista lanza ServiceOverloaded."""
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, ServiceOverloaded):
+            return None
+        response = HttpResponse(
+            'El servicio está ocupado. Por favor intenta de nuevo en unos segundos.',
+            status=503,
+            content_type='text/plain; charset=utf-8',
+        )
+        response['Retry-After'] = str(exception.retry_after)
+        return response
+
+
+class SessionMiddleware(DjangoSessionMiddleware):
+    """SessionMiddleware de Django que respeta request.renew_session = False."""
+
+    def process_response(self, request, response):
+        if getattr(request, 'renew_session', True):
+            return super().process_response(request, response)
+        return response
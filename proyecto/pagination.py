@@ -0,0 +1,254 @@
+"""
+Paginación del admin para tablas grandes.
+
+En cada página del listado, el admin de Django ejecuta un COUNT(*) exacto
+(dos sin filtros: el del resultado y el total) y pide las filas con OFFSET,
+que recorre todas las filas anteriores. Con millones de usuarios cada
+página tarda segundos. KeysetPaginationMixin lo reemplaza por:
+
+- EstimatedCountPaginator: sin filtros, el total es la estimación del
+  planificador (pg_class.reltuples en PostgreSQL, information_schema.tables
+  en MySQL); con filtros o búsqueda, un COUNT limitado a ADMIN_COUNT_LIMIT
+- Paginación por clave (keyset): con el orden por defecto del listado, los
+  enlaces "Anterior" y "Siguiente" continúan desde la última fila mostrada
+  con WHERE (date_joined, id) < (...) sobre un índice, en lugar de OFFSET
+- Conteos de los filtros bajo demanda: solo con el botón "Mostrar conteos"
+  (ShowFacets.ALLOW), nunca en cada página
+
+Con otro orden (al hacer clic en una columna) el listado vuelve a la
+paginación numerada de Django con el conteo estimado.
+
+Configuración (settings.py):
+- ADMIN_ESTIMATED_COUNT_THRESHOLD: Filas desde las que se usa la estimación
+- ADMIN_COUNT_LIMIT: Máximo de filas que cuenta un listado filtrado
+"""
+import base64
+import json
+
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+# Parámetros de la URL con la fila desde la que continúa la página
+AFTER_VAR = 'after'
+BEFORE_VAR = 'before'
+
+
+def estimated_count(model, using='default'):
+    """
+    Cantidad aproximada de filas de la tabla según las estadísticas de la
+    base de datos, o None si el motor no la ofrece (SQLite) o aún no hay
+    estadísticas (tabla sin ANALYZE).
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    if connection.vendor == 'postgresql':
+        sql = 'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass'
+    elif connection.vendor == 'mysql':
+        sql = (
+            'SELECT table_rows FROM information_schema.tables '
+            'WHERE table_schema = DATABASE() AND table_name = %s'
+        )
+    else:
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+    # PostgreSQL reporta -1 si la tabla nunca se analizó
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def count_rows(queryset):
+    """
+    Cantidad de filas del queryset sin recorrer la tabla completa: sin
+    filtros, la estimación de la base de datos (desde
+    ADMIN_ESTIMATED_COUNT_THRESHOLD filas); con filtros, un COUNT que se
+    detiene en ADMIN_COUNT_LIMIT.
+
+    Returns:
+        tuple: (cantidad, si es aproximada)
+    """
+    if not queryset.query.where:
+        estimate = estimated_count(queryset.model, queryset.db)
+        if estimate is not None and estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+            return estimate, True
+
+    # SELECT COUNT(*) FROM (... LIMIT n)
+    limit = settings.ADMIN_COUNT_LIMIT
+    count = queryset.order_by()[:limit + 1].count()
+    if count > limit:
+        return limit, True
+    return count, False
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator cuyo count no recorre la tabla completa (ver count_rows()).
+
+    is_estimate indica que count es aproximado (estimación o límite
+    alcanzado), para mostrarlo como tal en el listado.
+    """
+
+    is_estimate = False
+
+    @cached_property
+    def count(self):
+        count, self.is_estimate = count_rows(self.object_list)
+        return count
+
+
+def encode_cursor(values):
+    """Codifica los valores de la clave de una fila para la URL."""
+    data = json.dumps([str(value) for value in values])
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, fields):
+    """
+    Decodifica un cursor de encode_cursor() con los campos de la clave.
+
+    Raises:
+        IncorrectLookupParameters: Si el cursor no es válido (el admin
+            redirige al listado sin parámetros)
+    """
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise ValueError('cantidad de valores incorrecta')
+        return [field.to_python(value) for field, value in zip(fields, values)]
+    except Exception as error:
+        raise IncorrectLookupParameters(f'Cursor inválido: {error}') from error
+
+
+def keyset_filter(names, values, descending, after):
+    """
+    Condición (a, b) < (x, y) escrita con OR para cualquier motor:
+    a <= x AND (a < x OR (a = x AND b < y)). Con orden ascendente o hacia
+    atrás se invierte la comparación.
+
+    La cota a <= x es redundante, pero sin ella el OR no es un rango del
+    índice: la base de datos recorre el índice desde la primera fila y
+    filtra, como con OFFSET. Con ella busca directamente desde x.
+    """
+    lookup = 'lt' if descending == after else 'gt'
+    condition = Q()
+    for index, name in enumerate(names):
+        equal = {names[previous]: values[previous] for previous in range(index)}
+        condition |= Q(**equal, **{f'{name}__{lookup}': values[index]})
+    return Q(**{f'{names[0]}__{lookup}e': values[0]}) & condition
+
+
+class KeysetChangeList(ChangeList):
+    """ChangeList que pagina por clave con el orden por defecto del ModelAdmin."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        # Los cursores no son filtros del listado ni se conservan en los
+        # enlaces de filtros y columnas (que vuelven a la primera página)
+        for name in (AFTER_VAR, BEFORE_VAR):
+            for params in (self.params, self.filter_params):
+                params.pop(name, None)
+        self.after = request.GET.get(AFTER_VAR)
+        self.before = request.GET.get(BEFORE_VAR)
+        return super().get_queryset(request, exclude_parameters)
+
+    @cached_property
+    def keyset(self):
+        """Campos y sentido de la clave, o None si el orden no es el por defecto."""
+        # ModelAdmin.get_queryset() ya ordena por ordering y el ChangeList lo
+        # repite: ('-date_joined', '-date_joined', '-pk')
+        ordering = list(dict.fromkeys(self.queryset.query.order_by))
+        if ordering != list(self.model_admin.keyset_ordering) or self.show_all:
+            return None
+        descending = ordering[0].startswith('-')
+        if any(name.startswith('-') != descending for name in ordering):
+            return None
+        names = [name.lstrip('-') for name in ordering]
+        fields = [self.lookup_opts.pk if name == 'pk' else self.lookup_opts.get_field(name) for name in names]
+        return names, fields, descending
+
+    def get_results(self, request):
+        if not self.keyset:
+            return super().get_results(request)
+
+        rows, has_more = self.get_keyset_rows()
+        if self.before and not has_more:
+            # No hay filas antes de esta página: es la primera
+            self.before = None
+            rows, has_more = self.get_keyset_rows()
+
+        self.paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        self.result_count = self.paginator.count
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.result_list = self.queryset.filter(pk__in=[row[0] for row in rows])
+        self.can_show_all = False
+
+        # Enlaces a la primera página, la anterior y la siguiente (None si no hay)
+        has_previous = bool(self.after or self.before)
+        has_next = bool(self.before) or has_more
+        self.multi_page = has_previous or has_next
+        self.first_page_url = self.get_query_string() if has_previous else None
+        self.previous_page_url = None
+        self.next_page_url = None
+        if rows and has_previous:
+            self.previous_page_url = self.get_query_string({BEFORE_VAR: encode_cursor(rows[0][1:])})
+        if rows and has_next:
+            self.next_page_url = self.get_query_string({AFTER_VAR: encode_cursor(rows[-1][1:])})
+
+    def get_keyset_rows(self):
+        """
+        Ubica la página con la clave, con una consulta que el índice resuelve
+        sin leer las filas anteriores. Después se cargan solo las filas de la
+        página con el orden y select_related del listado.
+
+        Returns:
+            tuple: ([(pk, *clave), ...] en el orden del listado, si hay más
+            filas en el sentido de la consulta)
+        """
+        names, fields, descending = self.keyset
+        per_page = self.list_per_page
+        keys = self.queryset.values_list('pk', *names)
+        if self.before:
+            values = decode_cursor(self.before, fields)
+            reverse = [name if descending else f'-{name}' for name in names]
+            keys = keys.filter(keyset_filter(names, values, descending, after=False)).order_by(*reverse)
+        elif self.after:
+            values = decode_cursor(self.after, fields)
+            keys = keys.filter(keyset_filter(names, values, descending, after=True))
+
+        rows = list(keys[:per_page + 1])
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        if self.before:
+            rows.reverse()
+        return rows, has_more
+
+
+class KeysetPaginationMixin:
+    """
+    ModelAdmin con conteos estimados y paginación por clave.
+
+    keyset_ordering es el orden por defecto del listado tal como lo deja el
+    admin: el de ordering más la clave primaria para desempatar (por ejemplo
+    ('-date_joined', '-pk')). Debe tener un índice con esos campos.
+    """
+
+    keyset_ordering = ()
+    paginator = EstimatedCountPaginator
+    # Sin el COUNT(*) de la tabla completa junto al resultado filtrado
+    show_full_result_count = False
+    # Los conteos de cada filtro se calculan solo cuando se piden
+    show_facets = admin.ShowFacets.ALLOW
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
@@ -0,0 +1,167 @@
+"""
+Publicación y suscripción de eventos para las conexiones abiertas (SSE).
+
+Las vistas y señales publican un evento en un canal (publish(), desde
+cualquier hilo) y las conexiones de server-sent events de ese canal lo
+reciben al instante (subscribe(), en el event loop de ASGI), en lugar de
+que el navegador pregunte periódicamente.
+
+Brokers (PUBSUB en settings.py, con la misma forma que CACHES):
+- InProcessBroker: colas en la memoria del proceso. Solo llegan los eventos
+  publicados por el mismo worker; quien se suscribe debe verificar el
+  estado por su cuenta de vez en cuando (ver InProcessBroker.shared)
+- RedisBroker: PUBLISH/SUBSCRIBE de Redis, los eventos llegan a las
+  conexiones de cualquier worker o servidor. Cada suscripción usa su propia
+  conexión a Redis; si esa conexión se cae, la suscripción deja de estar
+  activa (ver Subscription.active)
+
+Los mensajes son diccionarios serializables con JSON.
+"""
+import asyncio
+import json
+import logging
+import threading
+from contextlib import asynccontextmanager
+from functools import cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+try:
+    import redis
+    import redis.asyncio
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Mensajes pendientes por suscripción; si el cliente no los consume se descartan
+MAX_PENDING = 100
+
+
+def _deliver(queue, message):
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        pass
+
+
+class Subscription:
+    """Mensajes de un canal para una conexión."""
+
+    def __init__(self, queue, listener=None):
+        self.queue = queue
+        self.listener = listener
+
+    @property
+    def active(self):
+        """
+        False si la tarea que recibe los mensajes del broker terminó (p. ej.
+        se cayó la conexión a Redis): ya no llegarán eventos de otros
+        workers y quien se suscribe debe verificar el estado por su cuenta.
+        """
+        return self.listener is None or not self.listener.done()
+
+    async def get(self, timeout):
+        """Siguiente mensaje, o None si no llega ninguno en timeout segundos."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class InProcessBroker:
+    """Pub/sub en la memoria del proceso (un solo worker o desarrollo)."""
+
+    # Los eventos no cruzan procesos
+    shared = False
+
+    def __init__(self, **options):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def publish(self, channel, message):
+        """
+        Envía el mensaje a las suscripciones del canal.
+
+        Returns:
+            int: Suscripciones que lo recibirán
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_deliver, queue, message)
+            except RuntimeError:
+                pass  # El event loop de la suscripción ya se cerró
+        return len(subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        entry = (asyncio.get_running_loop(), asyncio.Queue(MAX_PENDING))
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(entry)
+        try:
+            yield Subscription(entry[1])
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(channel, set())
+                subscribers.discard(entry)
+                if not subscribers:
+                    self._subscribers.pop(channel, None)
+
+
+class RedisBroker:
+    """Pub/sub de Redis, compartido por todos los workers y servidores."""
+
+    shared = True
+
+    def __init__(self, location, **options):
+        if redis is None:
+            raise ImportError('RedisBroker requiere el paquete redis')
+        self.location = location
+        self._client = None
+
+    def publish(self, channel, message):
+        if self._client is None:
+            self._client = redis.Redis.from_url(self.location)
+        return self._client.publish(channel, json.dumps(message))
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        client = redis.asyncio.Redis.from_url(self.location)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        queue = asyncio.Queue(MAX_PENDING)
+
+        async def listen():
+            async for item in pubsub.listen():
+                _deliver(queue, json.loads(item['data']))
+
+        def stopped(task):
+            if not task.cancelled() and task.exception() is not None:
+                logger.error('Se perdió la suscripción a %s: %s', channel, task.exception())
+
+        try:
+            await pubsub.subscribe(channel)
+            listener = asyncio.create_task(listen())
+            listener.add_done_callback(stopped)
+            try:
+                yield Subscription(queue, listener)
+            finally:
+                listener.cancel()
+                await asyncio.gather(listener, return_exceptions=True)
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
+
+@cache
+def get_broker():
+    """Broker configurado en settings.PUBSUB (uno por proceso)."""
+    options = {name.lower(): value for name, value in settings.PUBSUB.items() if name != 'BACKEND'}
+    return import_string(settings.PUBSUB['BACKEND'])(**options)
+
+
+def publish(channel, message):
+    """Publica un mensaje con el broker configurado (ver get_broker)."""
+    return get_broker().publish(channel, message)
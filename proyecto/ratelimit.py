@@ -0,0 +1,194 @@
+"""
+Límites de solicitudes con token bucket compartido entre workers.
+
+Cada identidad (una IP, un email) tiene una cubeta de `capacity` fichas
+que se recupera a `per_minute` fichas por minuto; cada intento consume una
+ficha y, sin fichas, el intento se rechaza indicando cuántos segundos
+faltan para la próxima.
+
+El estado vive en la caché RATE_LIMIT_CACHE para que todos los workers de
+Gunicorn vean las mismas cubetas:
+- Con Redis la actualización es atómica (un script Lua por intento)
+- Con la caché de archivos (un solo servidor) se lee y se escribe bajo un
+  lock de archivo (fcntl.flock), también atómico entre los workers
+- Con otra caché, bajo un lock del proceso (LocMem no se comparte entre
+  procesos: solo sirve en desarrollo)
+
+También cuenta los intentos permitidos y rechazados de cada límite
+(rate_limit_stats() y "python manage.py rate_limit_stats").
+
+Configuración (settings.py):
+- RATE_LIMIT_CACHE: Alias de caché del estado y los contadores
+- LOGIN_RATE_LIMITS: Cubetas del login por IP, por email e IP y por email
+"""
+import hashlib
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.redis import RedisCache
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Resultado de cada intento en los contadores
+OUTCOMES = ('allowed', 'rejected')
+
+# Lee la cubeta, la recarga según el tiempo transcurrido y consume una ficha.
+# Retorna {permitido, fichas restantes}; el estado se guarda como "fichas:hora"
+TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local tokens, updated = capacity, now
+local state = redis.call('GET', KEYS[1])
+if state then
+    local separator = string.find(state, ':')
+    tokens = tonumber(string.sub(state, 1, separator - 1))
+    updated = tonumber(string.sub(state, separator + 1))
+end
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('SET', KEYS[1], tokens .. ':' .. now, 'EX', math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+# Archivo de lock dentro del directorio de la caché de archivos (la caché
+# solo lista y borra sus archivos .djcache)
+LOCK_FILE = 'buckets.lock'
+
+_lock = threading.Lock()
+_scripts = {}
+
+
+def get_cache():
+    return caches[settings.RATE_LIMIT_CACHE]
+
+
+@contextmanager
+def bucket_lock(cache):
+    """
+    Lock para leer y escribir una cubeta: de archivo con la caché de
+    archivos, para que los workers no pisen sus escrituras; si no, del proceso.
+    """
+    with _lock:
+        if fcntl is None or not isinstance(cache, FileBasedCache):
+            yield
+            return
+        os.makedirs(cache._dir, exist_ok=True)
+        with open(os.path.join(cache._dir, LOCK_FILE), 'a') as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+
+def _refill(tokens, updated, now, capacity, rate):
+    return min(capacity, tokens + max(0.0, now - updated) * rate)
+
+
+class TokenBucket:
+    """
+    Cubetas de un límite (por ejemplo 'login:ip'), una por identidad.
+
+    Args:
+        name: Nombre del límite (prefijo de las claves y de los contadores)
+        capacity: Intentos seguidos permitidos (tamaño de la ráfaga)
+        per_minute: Fichas que se recuperan por minuto
+    """
+
+    def __init__(self, name, capacity, per_minute):
+        self.name = name
+        self.capacity = capacity
+        self.rate = per_minute / 60
+
+    def key(self, identity):
+        # Las identidades (emails) no se guardan en claro en la caché
+        digest = hashlib.sha256(str(identity).encode()).hexdigest()[:32]
+        return f'ratelimit:{self.name}:{digest}'
+
+    def take(self, identity):
+        """
+        Consume una ficha de la cubeta de la identidad.
+
+        Returns:
+            int: 0 si el intento se permite; si no, segundos hasta la próxima ficha
+        """
+        cache = get_cache()
+        now = time.time()
+        if isinstance(cache, RedisCache):
+            allowed, tokens = self._take_redis(cache, identity, now)
+        else:
+            allowed, tokens = self._take_locked(cache, identity, now)
+
+        record(self.name, 'allowed' if allowed else 'rejected')
+        if allowed:
+            return 0
+        return max(1, math.ceil((1 - tokens) / self.rate))
+
+    def _take_redis(self, cache, identity, now):
+        key = cache.make_and_validate_key(self.key(identity))
+        # RedisCache no expone scripts: se usa su cliente de redis-py
+        client = cache._cache.get_client(key, write=True)
+        script = _scripts.get(id(client))
+        if script is None:
+            script = _scripts[id(client)] = client.register_script(TAKE_SCRIPT)
+        allowed, tokens = script(keys=[key], args=[self.capacity, self.rate, now])
+        return bool(allowed), float(tokens)
+
+    def _take_locked(self, cache, identity, now):
+        key = self.key(identity)
+        with bucket_lock(cache):
+            tokens, updated = cache.get(key, (self.capacity, now))
+            tokens = _refill(tokens, updated, now, self.capacity, self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            cache.set(key, (tokens, now), int(self.capacity / self.rate) + 1)
+        return allowed, tokens
+
+
+def counter_key(name, outcome):
+    return f'ratelimit:stats:{name}:{outcome}'
+
+
+def record(name, outcome):
+    """Suma un intento permitido o rechazado a los contadores del límite."""
+    cache = get_cache()
+    key = counter_key(name, outcome)
+    # add() crea el contador sin expiración; incr() es atómico en Redis
+    if not cache.add(key, 1, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+
+def rate_limit_stats(names, reset=False):
+    """
+    Contadores de los límites indicados.
+
+    Returns:
+        dict: {nombre: {'allowed': n, 'rejected': n}}
+    """
+    cache = get_cache()
+    keys = {(name, outcome): counter_key(name, outcome) for name in names for outcome in OUTCOMES}
+    values = cache.get_many(keys.values())
+    if reset:
+        cache.delete_many(keys.values())
+    stats = {name: {} for name in names}
+    for (name, outcome), key in keys.items():
+        stats[name][outcome] = values.get(key, 0)
+    return stats
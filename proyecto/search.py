@@ -0,0 +1,99 @@
+"""
+Búsqueda del admin sobre índices según la base de datos.
+
+Con search_fields el admin busca cada palabra con icontains en todos los
+campos: LIKE '%texto%', que ningún índice B-tree resuelve, así que cada
+búsqueda recorre la tabla completa. IndexedSearchMixin usa, según la base
+de datos elegida con DATABASE_SELECTOR, búsquedas que sí usan un índice:
+
+- postgresql: icontains sobre índices GIN de trigramas (pg_trgm) de
+  UPPER(campo), la misma expresión que genera Django para icontains
+- mysql: búsqueda por prefijo (LIKE 'texto%') sobre índices B-tree; la
+  collation de MySQL ya ignora mayúsculas
+- Otros motores (SQLite en desarrollo): search_fields como siempre
+
+Las búsquedas con igualdad (como una IP) se omiten para las palabras que no
+son un valor válido del campo, en lugar de fallar o convertir la columna a
+texto. Los índices se crean en la migración 0005_search_indexes; si pg_trgm
+no se puede instalar, la búsqueda funciona igual, sin índice.
+"""
+from django.contrib.admin.utils import lookup_spawns_duplicates
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.text import smart_split, unescape_string_literal
+
+# Lookups que aceptan cualquier texto; el resto (exact) solo valores del campo
+TEXT_LOOKUPS = {'icontains', 'contains', 'istartswith', 'startswith'}
+
+
+def lookup_field(model, lookup):
+    """Campo del modelo al que se refiere un lookup como 'user__email__icontains'."""
+    opts = model._meta
+    field = None
+    for part in lookup.split(LOOKUP_SEP)[:-1]:
+        field = opts.get_field(part)
+        if hasattr(field, 'path_infos'):
+            opts = field.path_infos[-1].to_opts
+    return field
+
+
+def accepts(field, value):
+    """Indica si value es un valor válido del campo (por ejemplo, una IP)."""
+    try:
+        field.run_validators(field.to_python(value))
+    except ValidationError:
+        return False
+    return True
+
+
+def indexed_lookups(lookups_by_vendor, queryset):
+    """Lookups de búsqueda para la base de datos del queryset, o None."""
+    return lookups_by_vendor.get(connections[queryset.db].vendor)
+
+
+def search_queryset(queryset, lookups, search_term):
+    """
+    Filtra el queryset con cada palabra de search_term (todas deben
+    coincidir) en alguno de los lookups, como la búsqueda del admin.
+    """
+    fields = {lookup: lookup_field(queryset.model, lookup) for lookup in lookups}
+    for bit in smart_split(search_term):
+        if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+            bit = unescape_string_literal(bit)
+        condition = Q()
+        for lookup, field in fields.items():
+            if lookup.rsplit(LOOKUP_SEP, 1)[-1] in TEXT_LOOKUPS or accepts(field, bit):
+                condition |= Q(**{lookup: bit})
+        # Una palabra que no es válida para ningún campo no encuentra nada
+        queryset = queryset.filter(condition) if condition else queryset.none()
+    return queryset
+
+
+class IndexedSearchMixin:
+    """
+    ModelAdmin que busca con los lookups de indexed_search_fields según la
+    base de datos, por ejemplo:
+
+        indexed_search_fields = {
+            'postgresql': ('email__icontains', 'ip_address__exact'),
+            'mysql': ('email__istartswith', 'ip_address__exact'),
+        }
+
+    Con otro motor se usa search_fields.
+    """
+
+    indexed_search_fields = {}
+
+    def get_indexed_search_fields(self, queryset):
+        return indexed_lookups(self.indexed_search_fields, queryset)
+
+    def get_search_results(self, request, queryset, search_term):
+        lookups = self.get_indexed_search_fields(queryset)
+        if not lookups or not search_term:
+            return super().get_search_results(request, queryset, search_term)
+
+        queryset = search_queryset(queryset, lookups, search_term)
+        may_have_duplicates = any(lookup_spawns_duplicates(self.opts, lookup) for lookup in lookups)
+        return queryset, may_have_duplicates
@@ -10,7 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
-# Importar os para manejar las variables de entorno
+# Importar os para manejar las variables de entorno (y json para leer la configuración de hashing)
+import json
 import os
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
@@ -77,15 +78,44 @@ AUTH_USER_MODEL = 'app_1.CustomUser'
 # Middleware
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware', # Seguridad
-    'django.contrib.sessions.middleware.SessionMiddleware', # Sesiones
+    'whitenoise.middleware.WhiteNoiseMiddleware', # Whitenoise para archivos estáticos (antes de sesiones para no procesarlas en cada estático)
+    'proyecto.middleware.CompressionMiddleware', # Compresión Brotli/gzip del HTML y JSON dinámicos (los estáticos los comprime WhiteNoise)
+    'proyecto.middleware.SessionMiddleware', # Sesiones (sin renovarlas en el canal de eventos de la sesión)
     'django.middleware.common.CommonMiddleware', # Común (Middleware)
     'django.middleware.csrf.CsrfViewMiddleware', # Protección contra falsificación de solicitudes entre sitios (CSRF)
     'django.contrib.auth.middleware.AuthenticationMiddleware', # Autenticación
     'django.contrib.messages.middleware.MessageMiddleware', # Mensajes
+    'proyecto.middleware.OverloadMiddleware', # 503 con Retry-After cuando un recurso limitado está saturado
     'django.middleware.clickjacking.XFrameOptionsMiddleware', # Protección contra ataques de clics en el marco
-    'whitenoise.middleware.WhiteNoiseMiddleware', # Whitenoise para archivos estáticos
 ]
 
+# Compression Configuration
+# Configuración de compresión de respuestas dinámicas (ver proyecto/middleware.py)
+
+# Las respuestas más pequeñas caben en un paquete TCP; comprimirlas no ahorra tiempo
+COMPRESSION_MIN_SIZE = 1024
+
+# Tipos MIME que se comprimen (las imágenes y archivos ya comprimidos se excluyen)
+COMPRESSION_CONTENT_TYPES = [
+    'text/html',
+    'text/plain',
+    'text/csv',
+    'text/css',
+    'application/json',
+    'application/javascript',
+    'application/xml',
+]
+
+# Calidad de Brotli y nivel de gzip: valores medios, la compresión se hace en cada request
+COMPRESSION_BROTLI_QUALITY = 5
+COMPRESSION_GZIP_LEVEL = 6
+
+# Páginas con token CSRF (BREACH): 'pad' agrega bytes aleatorios, 'skip' no las comprime
+COMPRESSION_BREACH_MODE = 'pad'
+
+# Eliminar indentación y líneas vacías del HTML (en desarrollo se conserva para depurar)
+HTML_MINIFY = IS_DEPLOYED
+
 # Session Configuration
 # Configuración de sesiones
 # https://docs.djangoproject.com/en/5.2/topics/http/sessions/
@@ -114,6 +144,23 @@ SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = 'Lax'
 
 
+# Segundos entre latidos del canal de eventos de la sesión (app_1/session_events.py):
+# mantienen la conexión abierta a través de proxies y, sin Redis, son el
+# momento en que se verifica en la base de datos que la sesión sigue activa
+SESSION_EVENTS_HEARTBEAT = 25
+
+
+# Messages Configuration
+# Configuración de mensajes flash
+# https://docs.djangoproject.com/en/5.2/ref/contrib/messages/
+
+# Solo cookie firmada: los mensajes nunca se guardan en la sesión (ver proyecto/message_storage.py)
+MESSAGE_STORAGE = 'proyecto.message_storage.CompactCookieStorage'
+
+# Caracteres a los que se recorta un mensaje de texto si la cookie supera su tamaño máximo
+MESSAGE_MAX_LENGTH = 300
+
+
 # URL Configuration
 # Configuración de URL
 # https://docs.djangoproject.com/en/5.2/topics/http/urls/
@@ -126,22 +173,126 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'proyecto/templates')], # Directorios de plantillas
-        'APP_DIRS': True, # Aplicaciones de plantillas
+        # APP_DIRS se reemplaza por los cargadores explícitos de OPTIONS
+        'APP_DIRS': False,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug', # Depuración
                 'django.template.context_processors.request', # Solicitudes
                 'django.contrib.auth.context_processors.auth', # Autenticación
                 'django.contrib.messages.context_processors.messages', # Mensajes
+                'proyecto.templating.template_context', # Versión de plantillas (caché de fragmentos)
+            ],
+            # Cargador en caché: cada plantilla se compila una vez por proceso
+            # (con DEBUG Django lo reinicia al detectar cambios en las plantillas)
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader', # DIRS
+                    'django.template.loaders.app_directories.Loader', # templates/ de las aplicaciones
+                ]),
             ],
         },
     },
 ]
 
+# Cache Configuration
+# Configuración de caché
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Con REDIS_URL la caché por defecto se comparte entre workers y servidores;
+# sin ella cada proceso tiene la suya (las invalidaciones no se propagan)
+REDIS_URL = os.getenv('REDIS_URL', '')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'default',
+    },
+    # Fragmentos de plantillas ({% cache ... using='templates' %}): se guardan
+    # en la memoria de cada proceso para no pagar red ni serialización
+    'templates': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'templates',
+        'OPTIONS': {'MAX_ENTRIES': 1000},
+    },
+    # Estado de los límites de intentos (proyecto/ratelimit.py): debe ser
+    # compartido por los workers; sin Redis se usa una caché en archivos
+    'ratelimit': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'tmp', 'ratelimit-cache'),
+    },
+}
+
+# Pub/sub de eventos para las conexiones abiertas (proyecto/pubsub.py), con la
+# forma de CACHES. Con REDIS_URL los eventos (sesión cerrada desde otro
+# dispositivo, sesión renovada) llegan a las conexiones de cualquier worker;
+# sin Redis solo a las del mismo proceso
+PUBSUB = {
+    'BACKEND': 'proyecto.pubsub.RedisBroker',
+    'LOCATION': REDIS_URL,
+} if REDIS_URL else {
+    'BACKEND': 'proyecto.pubsub.InProcessBroker',
+}
+
+# Alias de caché de los límites de intentos y sus contadores
+RATE_LIMIT_CACHE = 'ratelimit'
+
+# Límites del login (token bucket): intentos seguidos permitidos y fichas
+# que se recuperan por minuto. Por IP (varias personas pueden compartir una),
+# por email normalizado desde una IP (fuerza bruta contra una cuenta) y por
+# email desde cualquier IP (ataques distribuidos). El techo global es alto
+# para que un atacante con una sola IP no bloquee el login de otra persona
+LOGIN_RATE_LIMITS = {
+    'ip': {'capacity': 30, 'per_minute': 15},
+    'email_ip': {'capacity': 5, 'per_minute': 2},
+    'email': {'capacity': 50, 'per_minute': 10},
+}
+
+# Proxies de confianza delante de la aplicación (p. ej. 1 en Railway o
+# Heroku). El límite por IP toma la entrada de X-Forwarded-For que agregó el
+# proxy más externo; con 0 usa REMOTE_ADDR. Las entradas de la izquierda las
+# escribe el cliente y no sirven para identificarlo
+TRUSTED_PROXY_COUNT = int(os.getenv('TRUSTED_PROXY_COUNT', '0'))
+
+# Listados del admin (proyecto/pagination.py): desde cuántas filas el total
+# sin filtros es la estimación de la base de datos en lugar de COUNT(*), y
+# hasta cuántas filas se cuenta un listado filtrado
+ADMIN_ESTIMATED_COUNT_THRESHOLD = 100000
+ADMIN_COUNT_LIMIT = 10000
+
+# Máximo de filas por página de las tablas de DataTables del lado del servidor
+# (proyecto/datatables.py); "Todos" también se limita a este valor
+DATATABLES_MAX_LENGTH = 100
+
+# Filas que se leen de la base de datos por bloque al exportar (proyecto/exports.py).
+# En PostgreSQL se usa un cursor del lado del servidor; detrás de pgbouncer en
+# modo transaction hay que activar DISABLE_SERVER_SIDE_CURSORS en DATABASES
+EXPORT_CHUNK_SIZE = 2000
+
+# Segundos que se conserva cada fragmento en caché; la clave incluye
+# TEMPLATE_VERSION, así que un cambio de plantillas nunca sirve HTML viejo
+TEMPLATE_FRAGMENT_TIMEOUT = 24 * 60 * 60
+
+# Páginas públicas que se renderizan al iniciar cada worker (warm_templates)
+TEMPLATE_WARMUP_URLS = ['page_login', 'page_register', 'password_reset_request']
+
 # WSGI Configuration
 # Configuración de WSGI
 WSGI_APPLICATION = 'proyecto.wsgi.application'
 
+# ASGI Configuration
+# Configuración de ASGI (uvicorn bajo Gunicorn, ver gunicorn.conf.py)
+ASGI_APPLICATION = 'proyecto.asgi.application'
+
+# Con ASGI_MODE=True el login, el dashboard y la verificación de email usan
+# las vistas async de app_1/async_views.py (proyecto/asgi.py lo activa)
+ASGI_MODE = os.getenv('ASGI_MODE', 'False') == 'True'
+
 
 # Database
 # Configuración de la base de datos
@@ -152,15 +303,90 @@ DATABASES = {
 }
 
 
+# Authentication backends
+# Backends de autenticación
+# https://docs.djangoproject.com/en/5.2/topics/auth/customizing/#specifying-authentication-backends
+
+# ModelBackend con el usuario de la sesión en caché (ver app_1/backends.py)
+AUTHENTICATION_BACKENDS = ['app_1.backends.CachedModelBackend']
+
+# Guardar el usuario de la sesión en caché solo si la caché es compartida
+# (Redis): con la caché en memoria de cada proceso, la invalidación al
+# desactivar al usuario o cambiar su contraseña no llegaría a los otros workers
+USER_CACHE_ENABLED = bool(REDIS_URL)
+
+# Segundos que se conserva el usuario en caché
+USER_CACHE_TIMEOUT = 300
+
+# Guardar en caché los permisos de cada usuario (has_perm en el admin) solo
+# si la caché es compartida (Redis): con la caché en memoria de cada proceso,
+# el cambio de versión al modificar un grupo no llegaría a los otros workers
+PERMISSION_CACHE_ENABLED = bool(REDIS_URL)
+
+# Segundos que se conservan en caché los permisos de cada usuario
+PERMISSION_CACHE_TIMEOUT = 600
+
+
+# Password hashers
+# Algoritmos de cifrado de contraseñas
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+
+# Algoritmo y parámetros de hashing medidos en el servidor con
+# "python manage.py calibrate_hashers" (ver app_1/hashers.py). Sin el
+# archivo se usan los valores por defecto de Django con PBKDF2
+PASSWORD_HASHING_CONFIG = os.getenv(
+    'PASSWORD_HASHING_CONFIG', os.path.join(BASE_DIR, 'password_hashers.json')
+)
+try:
+    with open(PASSWORD_HASHING_CONFIG, encoding='utf-8') as _config_file:
+        _hashing_config = json.load(_config_file)
+except FileNotFoundError:
+    _hashing_config = {}
+
+# Parámetros por algoritmo, por ejemplo {'pbkdf2_sha256': {'iterations': 870000}}
+PASSWORD_HASHER_PARAMS = _hashing_config.get('params', {})
+
+# Hashers que calculan en un pool de procesos (mismos formatos de Django).
+# El primero es el que se usa para las contraseñas nuevas; los demás
+# permiten verificar hashes antiguos, que se recalculan al iniciar sesión
+_CALIBRATED_HASHERS = {
+    'pbkdf2_sha256': 'app_1.hashers.PooledPBKDF2PasswordHasher',
+    'argon2': 'app_1.hashers.CalibratedArgon2PasswordHasher',
+    'scrypt': 'app_1.hashers.CalibratedScryptPasswordHasher',
+}
+_preferred_hasher = _CALIBRATED_HASHERS[_hashing_config.get('algorithm', 'pbkdf2_sha256')]
+PASSWORD_HASHERS = [
+    _preferred_hasher,
+    *(hasher for hasher in _CALIBRATED_HASHERS.values() if hasher != _preferred_hasher),
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+
+# Procesos del pool de hashing por worker de Gunicorn (0 = calcular en el mismo proceso)
+PASSWORD_HASHING_WORKERS = int(os.getenv('PASSWORD_HASHING_WORKERS', '2'))
+
+# Hashes en curso o en espera por worker; los siguientes reciben 503
+# (contrapresión). Depende del tamaño del pool y no de los hilos de gthread
+# (hasta 8): con el doble de procesos, cada hash espera a lo sumo uno
+PASSWORD_HASHING_MAX_PENDING = int(os.getenv(
+    'PASSWORD_HASHING_MAX_PENDING', str(2 * max(1, PASSWORD_HASHING_WORKERS))
+))
+
+# Segundos máximos de espera por un espacio en el pool y por el resultado
+PASSWORD_HASHING_TIMEOUT = 10
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
 AUTH_PASSWORD_VALIDATORS = [
     {
-        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+        # Misma regla que UserAttributeSimilarityValidator, sin SequenceMatcher
+        'NAME': 'app_1.validators.FastUserAttributeSimilarityValidator',
     },
     {
-        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+        # Misma lista que CommonPasswordValidator, en un filtro compartido con mmap
+        'NAME': 'app_1.validators.MappedCommonPasswordValidator',
     },
     {
         'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
@@ -170,6 +396,10 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Filtro precompilado de contraseñas comunes (se genera al primer uso si
+# no existe o si cambió la lista de Django)
+PASSWORD_FILTER_PATH = os.path.join(BASE_DIR, 'tmp', 'common-passwords.bin')
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -198,7 +428,24 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Backends de almacenamiento (Django 5.1+ ignora STATICFILES_STORAGE)
+# Los estáticos se procesan con hash en el nombre y compresión incremental:
+# solo se recomprimen los archivos que cambiaron, en un pool de procesos
+# https://docs.djangoproject.com/en/5.2/ref/settings/#storages
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'proyecto.storage.IncrementalCompressedManifestStaticFilesStorage',
+    },
+}
+
+# Caché de hashes y archivos comprimidos entre ejecuciones de collectstatic
+STATICFILES_CACHE_DIR = os.path.join(BASE_DIR, 'tmp', 'staticfiles-cache')
+
+# Procesos para comprimir archivos estáticos (None = uno por CPU)
+STATICFILES_COMPRESS_WORKERS = None
 
 STATIC_URL = '/staticfiles/' if IS_DEPLOYED else '/static/'
 
@@ -220,6 +467,87 @@ STATICFILES_DIRS = (
     os.path.join(BASE_DIR, 'app_1', 'static', 'app_1'),
 )
 
+# Buscadores de archivos estáticos: de STATICFILES_DIRS solo se recolectan y
+# sirven los archivos alcanzables desde las plantillas (ver proyecto/finders.py)
+STATICFILES_FINDERS = [
+    'proyecto.finders.ReachableFileSystemFinder',
+    'django.contrib.staticfiles.finders.AppDirectoriesFinder',
+]
+
+# Archivos que se cargan dinámicamente y ninguna plantilla referencia
+# (por ejemplo, 'proyecto/css/themes/cust-theme-*.css' si se habilita el
+# selector de temas). Revisar con: python manage.py static_graph
+STATICFILES_REACHABLE_EXTRA = []
+
+# Paquetes de CSS y JS por layout (un solo archivo de cada tipo por página)
+# Las dependencias se alojan en proyecto/static/proyecto/vendor en lugar de CDNs
+# Regenerar después de modificar un archivo de origen: python manage.py build_bundles
+STATIC_BUNDLES_ROOT = os.path.join(BASE_DIR, 'proyecto', 'static')
+STATIC_BUNDLES = {
+    # proyecto/common/auth_base.html (el tema y el skin se cargan aparte
+    # porque theme-loader.js los reemplaza según las preferencias). Roboto
+    # local en lugar del @import de Google Fonts del tema
+    'proyecto/bundles/auth.css': [
+        'proyecto/vendor/roboto/roboto.css',
+        'proyecto/css/vendors.bundle.css',
+        'proyecto/css/app.bundle.css',
+        'proyecto/css/icons.css',
+    ],
+    'proyecto/bundles/auth.js': [
+        'proyecto/js/vendors.bundle.js',
+        'proyecto/js/app.bundle.js',
+    ],
+    # proyecto/common/project_base.html
+    'proyecto/bundles/project.css': [
+        'proyecto/vendor/roboto/roboto.css',
+        'proyecto/vendor/bootstrap/bootstrap.min.css',
+        'proyecto/vendor/datatables/datatables.min.css',
+    ],
+    'proyecto/bundles/project.js': [
+        'proyecto/vendor/jquery/jquery.min.js',
+        'proyecto/vendor/popper/popper.min.js',
+        'proyecto/vendor/bootstrap/bootstrap.min.js',
+        'proyecto/vendor/datatables/datatables.min.js',
+        'proyecto/js/miscellaneous/tables/initializeDataTables.js',
+        'proyecto/js/miscellaneous/preferences/themeBasedOnPreference.js',
+    ],
+}
+
+# Fuentes de iconos recortadas a los iconos usados en plantillas y JS
+# Regenerar después de agregar o quitar iconos: python manage.py subset_icons
+ICON_FONTS = {
+    'fa-light': {
+        'font': 'proyecto/webfonts/fa-light-300.ttf',
+        'family': 'Font Awesome 5 Pro',
+        'weight': 300,
+        'class': 'fal',
+        'prefix': 'fa-',
+    },
+    'fa-brands': {
+        'font': 'proyecto/webfonts/fa-brands-400.ttf',
+        'family': 'Font Awesome 5 Brands',
+        'weight': 400,
+        'class': 'fab',
+        'prefix': 'fa-',
+    },
+    'nextgen-icons': {
+        'font': 'proyecto/webfonts/nextgen-icons.ttf',
+        'family': 'nextgen-icons',
+        'weight': 'normal',
+        'class': 'ni',
+        'prefix': 'ni-',
+    },
+}
+
+# CSS con las reglas .fa-nombre:before { content: ... } de cada icono
+ICON_GLYPH_CSS = ['proyecto/css/vendors.bundle.css']
+
+# Iconos cuyo nombre se arma dinámicamente en JS (no aparecen literalmente)
+ICON_EXTRA_CLASSES = []
+
+# CSS generado con las @font-face recortadas y los iconos usados
+ICON_CSS = 'proyecto/css/icons.css'
+
 # Configuración para almacenar archivos multimedia en el sistema de archivos (S3)
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
@@ -1,6 +1,61 @@
 // Initialize DataTables
 // Source: https://datatables.net/manual/installation
+// Server-side processing: https://datatables.net/manual/server-side
 
 $(document).ready(function () {
-    $('table').DataTable();
+    // Tablas con todas las filas en el HTML
+    $('table').not('[data-source]').DataTable();
+
+    // Tablas con data-source: cada página se pide al servidor (proyecto/datatables.py)
+    $('table[data-source]').each(function () {
+        initializeServerSideTable(this);
+    });
 });
+
+// Inicializa una tabla con procesamiento del lado del servidor. Las columnas
+// salen del atributo data-column de cada <th>. Al pasar a la página siguiente
+// o anterior se envía el cursor de la última o la primera fila (after/before)
+// para que el servidor continúe desde ahí en lugar de usar OFFSET.
+function initializeServerSideTable(table) {
+    let lastPage = null;
+    let pendingPage = null;
+
+    const columns = $(table).find('thead th').map(function () {
+        return {
+            data: this.dataset.column,
+            orderable: this.dataset.orderable !== 'false',
+            // Los valores se muestran como texto, nunca como HTML
+            render: $.fn.dataTable.render.text(),
+        };
+    }).get();
+
+    $(table).DataTable({
+        serverSide: true,
+        processing: true,
+        searchDelay: 400,
+        pageLength: parseInt(table.dataset.pageLength || '25', 10),
+        lengthMenu: [10, 25, 50, 100],
+        // Sin orden inicial: el servidor usa el orden por defecto de la tabla
+        order: [],
+        columns: columns,
+        ajax: {
+            url: table.dataset.source,
+            data: function (data) {
+                // Los cursores solo sirven con el mismo orden, búsqueda y tamaño de página
+                const key = JSON.stringify([data.order, data.search.value, data.length]);
+                if (lastPage && lastPage.key === key && lastPage.cursors) {
+                    if (data.start === lastPage.start + data.length) {
+                        data.after = lastPage.cursors.last;
+                    } else if (data.start === lastPage.start - data.length && data.start > 0) {
+                        data.before = lastPage.cursors.first;
+                    }
+                }
+                pendingPage = { key: key, start: data.start };
+            },
+            dataSrc: function (json) {
+                lastPage = { key: pendingPage.key, start: pendingPage.start, cursors: json.cursors };
+                return json.data;
+            },
+        },
+    });
+}
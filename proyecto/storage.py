@@ -0,0 +1,321 @@
+"""
+Backend de almacenamiento de archivos estáticos para collectstatic.
+
+Extiende CompressedManifestStaticFilesStorage de WhiteNoise para que los
+despliegues no repitan trabajo:
+- Guarda en caché el hash de contenido de cada archivo entre ejecuciones
+- Comprime solo los archivos que cambiaron, reutilizando los archivos
+  .gz/.br ya generados para el mismo contenido
+- Comprime en un pool de procesos en lugar de un solo hilo
+- Reporta el tiempo empleado y los bytes ahorrados
+
+Configuración (settings.py):
+- STATICFILES_CACHE_DIR: Directorio de la caché (por defecto tmp/staticfiles-cache)
+- STATICFILES_COMPRESS_WORKERS: Procesos de compresión (por defecto, uno por CPU)
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from whitenoise.compress import Compressor
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Relación máxima tamaño comprimido / original para conservar una versión comprimida
+EFFECTIVE_RATIO = 0.95
+
+# Archivos dentro del directorio de caché
+HASH_CACHE_FILE = 'hashes.json'
+BLOBS_DIR = 'blobs'
+
+
+def compress_data(data, suffix):
+    """Comprime los datos con el algoritmo que corresponde al sufijo."""
+    if suffix == '.br':
+        return brotli.compress(data)
+    return Compressor.compress_gzip(data)
+
+
+def compress_file(full_path, suffixes, blobs_dir):
+    """
+    Genera las versiones comprimidas de un archivo.
+
+    Se ejecuta en los procesos del pool. Los resultados se guardan en el
+    directorio de caché indexados por el hash del contenido, de modo que
+    un archivo con el mismo contenido no se vuelve a comprimir aunque
+    STATIC_ROOT se haya eliminado.
+
+    Returns:
+        dict: Archivos generados, tamaños y si se comprimió o se reutilizó
+    """
+    stat = os.stat(full_path)
+    result = {
+        'outputs': [],
+        'original_size': stat.st_size,
+        'compressed_size': stat.st_size,
+        'reused': True,
+    }
+
+    # Si las versiones comprimidas ya existen con la misma fecha que el
+    # original (WhiteNoise copia la fecha), el archivo no cambió y no se lee
+    existing = [full_path + suffix for suffix in suffixes]
+    if all(os.path.exists(path) and os.stat(path).st_mtime == stat.st_mtime for path in existing):
+        result['outputs'] = existing
+        result['compressed_size'] = min(os.path.getsize(path) for path in existing)
+        return result
+
+    with open(full_path, 'rb') as file:
+        data = file.read()
+    digest = hashlib.sha256(data).hexdigest()
+    blob_base = os.path.join(blobs_dir, digest[:2], digest)
+
+    for suffix in suffixes:
+        blob_path = blob_base + suffix
+        skip_marker = blob_path + '.skip'
+
+        if os.path.exists(skip_marker):
+            # La compresión no fue efectiva para este contenido
+            break
+
+        if not os.path.exists(blob_path):
+            result['reused'] = False
+            compressed = compress_data(data, suffix)
+            if not data or len(compressed) / len(data) > EFFECTIVE_RATIO:
+                os.makedirs(os.path.dirname(skip_marker), exist_ok=True)
+                open(skip_marker, 'w').close()
+                # Si Brotli no es efectivo, gzip tampoco lo será
+                break
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            temp_path = f'{blob_path}.{os.getpid()}.tmp'
+            with open(temp_path, 'wb') as file:
+                file.write(compressed)
+            os.replace(temp_path, blob_path)
+
+        output_path = full_path + suffix
+        shutil.copyfile(blob_path, output_path)
+        os.utime(output_path, (stat.st_atime, stat.st_mtime))
+        result['outputs'].append(output_path)
+        result['compressed_size'] = min(
+            result['compressed_size'],
+            os.path.getsize(output_path),
+        )
+
+    return result
+
+
+class IncrementalCompressedManifestStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Almacenamiento con manifiesto, compresión incremental y caché de hashes.
+
+    Las referencias de CSS a archivos inexistentes (fuentes o imágenes que el
+    tema no incluye) se dejan sin modificar en lugar de abortar collectstatic,
+    y se listan en el reporte final.
+    """
+
+    # Si una plantilla referencia un archivo que no está en el manifiesto,
+    # se usa la URL sin hash en lugar de lanzar un error 500 (ver stored_name)
+    manifest_strict = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_dir = getattr(
+            settings,
+            'STATICFILES_CACHE_DIR',
+            os.path.join(settings.BASE_DIR, 'tmp', 'staticfiles-cache'),
+        )
+        self.compress_workers = getattr(settings, 'STATICFILES_COMPRESS_WORKERS', None)
+        self.stats = {}
+        self.missing_references = set()
+        self.missing_files = set()
+        self._hash_cache = None
+
+    # ------------------------------------------------------------------
+    # Caché de hashes de contenido
+    # ------------------------------------------------------------------
+    def load_hash_cache(self):
+        """Carga la caché de hashes guardada en la ejecución anterior."""
+        try:
+            with open(os.path.join(self.cache_dir, HASH_CACHE_FILE)) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def save_hash_cache(self):
+        """Guarda la caché de hashes para la siguiente ejecución."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, HASH_CACHE_FILE)
+        with open(path + '.tmp', 'w') as file:
+            json.dump(self._hash_cache, file)
+        os.replace(path + '.tmp', path)
+
+    def file_hash(self, name, content=None):
+        """
+        Retorna el hash del archivo, reutilizando el de la ejecución anterior
+        si el archivo en STATIC_ROOT conserva el mismo tamaño y fecha.
+        El contenido ajustado en memoria (CSS con URLs reescritas) siempre se
+        vuelve a calcular.
+        """
+        if content is None or isinstance(content, ContentFile) or self._hash_cache is None:
+            return super().file_hash(name, content)
+
+        try:
+            stat = os.stat(self.path(name))
+        except OSError:
+            return super().file_hash(name, content)
+
+        key = f'{stat.st_size}:{stat.st_mtime_ns}'
+        cached = self._hash_cache.get(name)
+        if cached and cached[0] == key:
+            self.stats['hashes_reused'] += 1
+            return cached[1]
+
+        file_hash = super().file_hash(name, content)
+        self._hash_cache[name] = [key, file_hash]
+        return file_hash
+
+    # ------------------------------------------------------------------
+    # Referencias a archivos inexistentes
+    # ------------------------------------------------------------------
+    def stored_name(self, name):
+        """
+        Retorna el nombre sin hash si el archivo no existe, en lugar de
+        fallar, y lo registra como error (una vez por archivo).
+        """
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            if name not in self.missing_files:
+                self.missing_files.add(name)
+                logger.error('Archivo estático inexistente, se usa la URL sin hash: %s', name)
+            return name
+
+    def url_converter(self, name, hashed_files, template=None):
+        """Deja sin cambios las URLs de CSS que apuntan a archivos inexistentes."""
+        converter = super().url_converter(name, hashed_files, template)
+
+        def tolerant_converter(matchobj):
+            try:
+                return converter(matchobj)
+            except ValueError:
+                self.missing_references.add((name, matchobj['url']))
+                return matchobj['matched']
+
+        return tolerant_converter
+
+    # ------------------------------------------------------------------
+    # Procesamiento
+    # ------------------------------------------------------------------
+    def post_process(self, *args, **kwargs):
+        self.stats = {
+            'hashes_reused': 0,
+            'files_compressed': 0,
+            'files_reused': 0,
+            'original_bytes': 0,
+            'compressed_bytes': 0,
+            'reused_bytes': 0,
+        }
+        self.missing_references = set()
+        self._hash_cache = self.load_hash_cache()
+        started = time.perf_counter()
+
+        yield from super().post_process(*args, **kwargs)
+
+        if not kwargs.get('dry_run'):
+            self.save_hash_cache()
+        self._hash_cache = None
+        self.stats['seconds'] = time.perf_counter() - started
+
+    def compress_files(self, paths):
+        """Comprime en un pool de procesos los archivos que cambiaron."""
+        extensions = getattr(settings, 'WHITENOISE_SKIP_COMPRESS_EXTENSIONS', None)
+        self.compressor = self.create_compressor(extensions=extensions, quiet=True)
+
+        suffixes = ['.br', '.gz'] if brotli is not None else ['.gz']
+        blobs_dir = os.path.join(self.cache_dir, BLOBS_DIR)
+        names = sorted(path for path in paths if self.compressor.should_compress(path))
+        full_paths = [self.path(name) for name in names]
+
+        with ProcessPoolExecutor(max_workers=self.compress_workers) as executor:
+            results = executor.map(
+                compress_file,
+                full_paths,
+                [suffixes] * len(names),
+                [blobs_dir] * len(names),
+                chunksize=16,
+            )
+            contents = {}
+            for name, full_path, result in zip(names, full_paths, results):
+                self.merge_compression(contents, self.content_key(name), result)
+                prefix_len = len(full_path) - len(name)
+                for output_path in result['outputs']:
+                    yield name, output_path[prefix_len:]
+
+        for result in contents.values():
+            self.record_compression(result)
+
+    def content_key(self, name):
+        """
+        Nombre con hash del manifiesto, común al original y a su copia con
+        hash: las estadísticas cuentan cada archivo una sola vez.
+        """
+        return self.hashed_files.get(self.hash_key(self.clean_name(name)), name)
+
+    @staticmethod
+    def merge_compression(contents, key, result):
+        """
+        Agrupa los resultados por archivo: el original y su copia con hash
+        se comprimen a la vez y solo uno encuentra la caché vacía, así que
+        el archivo se reutilizó solo si ninguna copia se comprimió.
+        """
+        merged = contents.setdefault(key, result)
+        if merged is not result:
+            merged['reused'] = merged['reused'] and result['reused']
+
+    def record_compression(self, result):
+        """Acumula las estadísticas de compresión de un contenido."""
+        self.stats['original_bytes'] += result['original_size']
+        self.stats['compressed_bytes'] += result['compressed_size']
+        if result['reused']:
+            self.stats['files_reused'] += 1
+            self.stats['reused_bytes'] += result['original_size']
+        else:
+            self.stats['files_compressed'] += 1
+
+    def summary(self):
+        """
+        Retorna un resumen legible de la última ejecución de post_process,
+        o una lista vacía si no se ha ejecutado.
+        """
+        if not self.stats:
+            return []
+
+        megabyte = 1024 * 1024
+        saved = self.stats['original_bytes'] - self.stats['compressed_bytes']
+        lines = [
+            f"Tiempo de post-procesamiento: {self.stats.get('seconds', 0):.2f} s",
+            f"Hashes reutilizados: {self.stats['hashes_reused']}",
+            f"Archivos comprimidos: {self.stats['files_compressed']}, "
+            f"reutilizados de la caché: {self.stats['files_reused']} "
+            f"({self.stats['reused_bytes'] / megabyte:.1f} MB sin recomprimir)",
+            f"Bytes ahorrados por compresión: {saved / megabyte:.1f} MB "
+            f"({self.stats['original_bytes'] / megabyte:.1f} MB -> "
+            f"{self.stats['compressed_bytes'] / megabyte:.1f} MB)",
+        ]
+        if self.missing_references:
+            lines.append(
+                f'Referencias CSS a archivos inexistentes (sin modificar): '
+                f'{len(self.missing_references)}'
+            )
+        return lines
@@ -0,0 +1,120 @@
+"""
+Carga de plantillas en caché, precalentamiento y caché de fragmentos.
+
+Las páginas de autenticación (login, registro y restablecimiento de
+contraseña) comparten el mismo layout para todos los usuarios; solo
+cambian el token CSRF, los mensajes y el formulario. Para que cada GET
+renderice únicamente esas partes:
+
+1. TEMPLATES usa el cargador en caché de forma explícita: cada plantilla
+   se lee y compila una sola vez por proceso
+2. Los fragmentos estáticos del layout se envuelven en {% cache %} con la
+   clave TEMPLATE_VERSION, que cambia cuando cambian las plantillas o el
+   manifiesto de estáticos, de modo que nunca se sirve HTML desactualizado
+3. warm_templates() compila todas las plantillas y renderiza las páginas
+   de TEMPLATE_WARMUP_URLS al iniciar Gunicorn (ver gunicorn.conf.py), así
+   el primer visitante no paga la compilación ni el llenado de la caché
+
+Configuración (settings.py):
+- CACHES['templates']: Caché de los fragmentos (memoria local del proceso)
+- TEMPLATE_FRAGMENT_TIMEOUT: Segundos que se conserva cada fragmento
+- TEMPLATE_WARMUP_URLS: Nombres de URL que se renderizan al precalentar
+"""
+import hashlib
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.urls import NoReverseMatch, reverse
+
+from proyecto.finders import template_directories, templates_signature
+
+_version = None
+_version_signature = None
+
+
+def template_version():
+    """
+    Versión de las plantillas usada como clave de los fragmentos.
+
+    En producción se calcula una vez por proceso; con DEBUG se recalcula
+    cuando cambia alguna plantilla.
+    """
+    global _version, _version_signature
+
+    if _version is not None and not settings.DEBUG:
+        return _version
+
+    signature = templates_signature()
+    if _version is None or signature != _version_signature:
+        digest = hashlib.md5(usedforsecurity=False)
+        for path, mtime in signature:
+            digest.update(f'{path}:{mtime}\n'.encode())
+        digest.update(settings.STATIC_URL.encode())
+        # Con ManifestStaticFilesStorage las URLs de {% static %} dependen del manifiesto
+        digest.update(str(getattr(staticfiles_storage, 'manifest_hash', '')).encode())
+        _version_signature = signature
+        _version = digest.hexdigest()[:12]
+    return _version
+
+
+def template_context(request):
+    """Context processor: expone la versión y la duración de los fragmentos."""
+    return {
+        'TEMPLATE_VERSION': template_version(),
+        'TEMPLATE_FRAGMENT_TIMEOUT': settings.TEMPLATE_FRAGMENT_TIMEOUT,
+    }
+
+
+def iter_template_names():
+    """Nombres (relativos a su directorio) de todas las plantillas del proyecto."""
+    for directory in template_directories():
+        for root, _, files in os.walk(directory):
+            for name in sorted(files):
+                if name.endswith(('.html', '.txt')):
+                    path = os.path.join(root, name)
+                    yield os.path.relpath(path, directory).replace(os.sep, '/')
+
+
+def warm_templates():
+    """
+    Compila todas las plantillas y renderiza las páginas públicas para
+    llenar el cargador en caché y la caché de fragmentos.
+
+    Returns:
+        tuple: (plantillas compiladas, páginas renderizadas, errores)
+    """
+    # Importación local: django.test solo se necesita al precalentar
+    from django.test import Client
+
+    engine = engines['django']
+    errors = []
+
+    compiled = 0
+    for name in iter_template_names():
+        try:
+            engine.get_template(name)
+            compiled += 1
+        except (TemplateDoesNotExist, TemplateSyntaxError) as error:
+            errors.append(f'{name}: {error}')
+
+    host = next(
+        (host.lstrip('.') for host in settings.ALLOWED_HOSTS if host not in ('*', '')),
+        'localhost',
+    )
+    client = Client(HTTP_HOST=host)
+
+    rendered = 0
+    for url_name in getattr(settings, 'TEMPLATE_WARMUP_URLS', []):
+        try:
+            response = client.get(reverse(url_name))
+        except NoReverseMatch as error:
+            errors.append(f'{url_name}: {error}')
+            continue
+        if response.status_code == 200:
+            rendered += 1
+        else:
+            errors.append(f'{url_name}: HTTP {response.status_code}')
+
+    return compiled, rendered, errors
@@ -2,13 +2,20 @@
 """
 Script para iniciar la aplicación Django
 - Crea y activa entorno virtual
-- Actualiza pip
-- Instala dependencias
-- Ejecuta las migraciones
+- Actualiza pip e instala dependencias (solo si requirements.txt o el
+  intérprete cambiaron desde la última instalación)
+- Recolecta archivos estáticos en paralelo con las migraciones
 - Inicia el servidor de desarrollo
 - Abre el navegador en la URL de la aplicación
+- Reporta el tiempo de cada fase
+
+Opciones:
+    --force-install   Reinstalar dependencias aunque no haya cambios
+    --purge-cache     Limpiar la caché de pip y de wheels antes de instalar
 """
 
+import argparse
+import hashlib
 import os
 import sys
 import subprocess
@@ -20,8 +27,38 @@ import urllib.request
 import shutil
 import glob
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Archivo dentro de .venv con la huella de requirements.txt e intérprete instalados
+REQUIREMENTS_FINGERPRINT_FILE = ".requirements-fingerprint"
+
+# Caché persistente de wheels compilados (no se borra entre ejecuciones)
+WHEELHOUSE_DIR = Path(__file__).parent / "tmp" / "wheelhouse"
+
+# Procesos de pip que construyen wheels en paralelo
+WHEEL_BUILD_WORKERS = min(8, os.cpu_count() or 1)
+
+# Tiempo de cada fase: (nombre, segundos)
+PHASE_TIMINGS = []
+
+def run_phase(name, func, *args):
+    """Ejecuta una fase y registra su duración"""
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        PHASE_TIMINGS.append((name, time.perf_counter() - start))
+
+def print_phase_timings(total):
+    """Imprime el tiempo de cada fase"""
+    print()
+    print("⏱️  Tiempos de inicio:")
+    for name, duration in PHASE_TIMINGS:
+        print(f"   {name:<28} {duration:8.2f} s")
+    print(f"   {'total':<28} {total:8.2f} s")
+    print()
+
 def setup_mysql_library_path():
     """Configura todas las variables de entorno necesarias para MySQL"""
     print("🔍 Detectando y configurando bibliotecas de MySQL...")
@@ -265,9 +302,96 @@ def fix_and_upgrade_pip(python_executable):
             print("⚠️  No se pudo actualizar pip, pero continuando...")
             return True
 
+def compute_requirements_fingerprint(python_executable):
+    """
+    Calcula la huella de requirements.txt y del intérprete del entorno virtual.
+    Si alguno cambia (nueva dependencia, otra versión de Python), hay que reinstalar.
+    """
+    digest = hashlib.sha256()
+    requirements_file = Path(__file__).parent / "requirements.txt"
+    if requirements_file.exists():
+        digest.update(requirements_file.read_bytes())
+
+    result = subprocess.run([
+        str(python_executable),
+        "-c",
+        "import sys, platform; print(sys.version); print(platform.platform()); print(sys.base_prefix)"
+    ], capture_output=True, text=True)
+    digest.update(result.stdout.encode())
+    return digest.hexdigest()
+
+def read_requirements_fingerprint(venv_path):
+    """Lee la huella de la última instalación, o None si no existe"""
+    try:
+        return (venv_path / REQUIREMENTS_FINGERPRINT_FILE).read_text().strip()
+    except OSError:
+        return None
+
+def save_requirements_fingerprint(venv_path, fingerprint):
+    """Guarda la huella después de una instalación exitosa"""
+    (venv_path / REQUIREMENTS_FINGERPRINT_FILE).write_text(fingerprint)
+
+def parse_requirements(requirements_file):
+    """Retorna las dependencias de requirements.txt (sin comentarios ni opciones)"""
+    requirements = []
+    for line in requirements_file.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line and not line.startswith("-"):
+            requirements.append(line)
+    return requirements
+
+def wheel_exists(requirement):
+    """Indica si ya hay un wheel en la caché para una dependencia fijada (paquete==versión)"""
+    name, separator, version = requirement.partition("==")
+    if not separator:
+        return False
+    normalized = re.sub(r"[-_.]+", "_", name.strip()).lower()
+    for wheel in WHEELHOUSE_DIR.glob("*.whl"):
+        wheel_name, _, rest = wheel.name.partition("-")
+        if wheel_name.lower() == normalized and rest.startswith(f"{version.strip()}-"):
+            return True
+    return False
+
+def build_wheel(python_executable, requirement):
+    """Construye (o descarga) el wheel de una dependencia en la caché de wheels"""
+    result = subprocess.run([
+        str(python_executable),
+        "-m",
+        "pip",
+        "wheel",
+        "--no-deps",
+        "--wheel-dir", str(WHEELHOUSE_DIR),
+        "--find-links", str(WHEELHOUSE_DIR),
+        requirement
+    ], capture_output=True, text=True)
+    return requirement, result.returncode == 0
+
+def build_wheels(python_executable, requirements):
+    """
+    Construye en paralelo los wheels que faltan en la caché.
+    Las dependencias con extensiones en C (mysqlclient, Pillow...) son las que
+    más tardan; compilarlas a la vez reduce el tiempo de la primera instalación.
+    """
+    WHEELHOUSE_DIR.mkdir(parents=True, exist_ok=True)
+    missing = [requirement for requirement in requirements if not wheel_exists(requirement)]
+
+    if not missing:
+        print(f"✅ {len(requirements)} wheels disponibles en la caché")
+        return True
+
+    print(f"🛞 Construyendo {len(missing)} wheels en paralelo ({WHEEL_BUILD_WORKERS} procesos)...")
+    with ThreadPoolExecutor(max_workers=WHEEL_BUILD_WORKERS) as executor:
+        results = list(executor.map(lambda requirement: build_wheel(python_executable, requirement), missing))
+
+    failed = [requirement for requirement, success in results if not success]
+    for requirement in failed:
+        print(f"⚠️  No se pudo construir el wheel de {requirement}")
+    return not failed
+
 def purge_pip_cache(python_executable):
-    """Limpia el caché de pip"""
+    """Limpia el caché de pip y la caché de wheels del proyecto"""
     print("🧹 Limpiando caché de pip...")
+    shutil.rmtree(WHEELHOUSE_DIR, ignore_errors=True)
     try:
         subprocess.run([
             str(python_executable), 
@@ -304,18 +428,35 @@ def install_requirements(python_executable):
         print("❌ Pip no está funcionando correctamente")
         return False
     
-    # Intentar instalación sin caché desde el principio
-    print("📋 Instalando desde requirements.txt (sin caché)...")
+    # Construir los wheels en paralelo e instalar desde la caché local
+    build_wheels(python_executable, parse_requirements(requirements_file))
+
+    print("📋 Instalando desde requirements.txt (caché de wheels)...")
     try:
-        result = subprocess.run([
-            str(python_executable), 
-            "-m", 
-            "pip", 
-            "install",
-            "--no-cache-dir",
-            "-r", 
-            str(requirements_file)
-        ], check=True, capture_output=True, text=True)
+        try:
+            result = subprocess.run([
+                str(python_executable),
+                "-m",
+                "pip",
+                "install",
+                "--no-index",
+                "--find-links", str(WHEELHOUSE_DIR),
+                "-r",
+                str(requirements_file)
+            ], check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError:
+            # Falta algún wheel (por ejemplo, una dependencia transitiva no fijada
+            # en requirements.txt): instalar con el índice, usando la caché de pip
+            print("   Algunos paquetes no están en la caché, descargando del índice...")
+            result = subprocess.run([
+                str(python_executable),
+                "-m",
+                "pip",
+                "install",
+                "--find-links", str(WHEELHOUSE_DIR),
+                "-r",
+                str(requirements_file)
+            ], check=True, capture_output=True, text=True)
         print("✅ Dependencias instaladas exitosamente")
         if result.stdout:
             # Mostrar solo las líneas importantes del output
@@ -334,7 +475,6 @@ def install_requirements(python_executable):
                 "-m", 
                 "pip", 
                 "install", 
-                "--no-cache-dir",
                 "--force-reinstall",
                 "-r", 
                 str(requirements_file)
@@ -449,34 +589,20 @@ def verify_mysqldb_import(python_executable):
         
         return False
 
-def create_default_superuser(python_executable):
-    """Crea el superusuario por defecto si no existe"""
-    print("👤 Creando superusuario por defecto (si no existe)...")
-    try:
-        result = subprocess.run([
-            str(python_executable),
-            "create_default_superuser.py"
-        ], cwd=Path(__file__).parent, check=True, capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
-    except subprocess.CalledProcessError as e:
-        print(f"⚠️  Advertencia al crear superusuario (puede ser normal si ya existe)")
-        if e.stderr:
-            print(f"Advertencia: {e.stderr}")
-        # No hacer sys.exit(1) aquí porque puede fallar si ya existe
+def run_manage_command(python_executable, *arguments):
+    """Ejecuta un comando de manage.py y retorna el resultado"""
+    return subprocess.run([
+        str(python_executable),
+        "manage.py",
+        *arguments
+    ], cwd=Path(__file__).parent, check=True, capture_output=True, text=True)
 
-def run_migrations(python_executable):
-    """Ejecuta las migraciones de Django"""
-    # Primero recolectar archivos estáticos
+def collect_static(python_executable):
+    """Recolecta los archivos estáticos (boot lo omite si no cambiaron)"""
     print("📁 Recolectando archivos estáticos...")
     try:
-        result = subprocess.run([
-            str(python_executable),
-            "manage.py",
-            "collectstatic",
-            "--noinput"
-        ], cwd=Path(__file__).parent, check=True, capture_output=True, text=True)
-        print("✅ Archivos estáticos recolectados exitosamente")
+        result = run_manage_command(python_executable, "boot", "--no-migrate", "--no-superuser")
+        print("✅ Archivos estáticos listos")
         if result.stdout:
             print(result.stdout)
     except subprocess.CalledProcessError as e:
@@ -485,14 +611,14 @@ def run_migrations(python_executable):
             print(f"Advertencia: {e.stderr}")
         # No hacer sys.exit(1) aquí porque collectstatic puede fallar si no está configurado
 
-    # Después ejecutar makemigrations
+def run_migrations(python_executable):
+    """
+    Ejecuta makemigrations, migrate y la creación del superusuario.
+    Van en secuencia porque cada paso depende del anterior.
+    """
     print("🔄 Ejecutando makemigrations...")
     try:
-        result = subprocess.run([
-            str(python_executable),
-            "manage.py",
-            "makemigrations"
-        ], cwd=Path(__file__).parent, check=True, capture_output=True, text=True)
+        result = run_manage_command(python_executable, "makemigrations")
         print("✅ Makemigrations completado exitosamente")
         if result.stdout:
             print(result.stdout)
@@ -502,14 +628,10 @@ def run_migrations(python_executable):
             print(f"Advertencia: {e.stderr}")
         # No hacer sys.exit(1) aquí porque makemigrations puede fallar si no hay cambios
 
-    # Después ejecutar migrate
-    print("🔄 Ejecutando migraciones...")
+    # boot aplica las migraciones solo si hay pendientes y crea el superusuario
+    print("🔄 Ejecutando migraciones y superusuario por defecto...")
     try:
-        result = subprocess.run([
-            str(python_executable),
-            "manage.py",
-            "migrate"
-        ], cwd=Path(__file__).parent, check=True, capture_output=True, text=True)
+        result = run_manage_command(python_executable, "boot", "--no-static")
         print("✅ Migraciones completadas exitosamente")
         if result.stdout:
             print(result.stdout)
@@ -519,8 +641,21 @@ def run_migrations(python_executable):
             print(f"Error: {e.stderr}")
         sys.exit(1)
 
-    # Finalmente crear superusuario
-    create_default_superuser(python_executable)
+def run_setup_tasks(python_executable):
+    """
+    Ejecuta en paralelo las tareas independientes entre sí:
+    - collectstatic (solo archivos)
+    - makemigrations -> migrate -> superusuario (base de datos)
+    - verificación de MySQLdb (solo importación)
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(run_phase, "collectstatic", collect_static, python_executable),
+            executor.submit(run_phase, "migraciones y superusuario", run_migrations, python_executable),
+            executor.submit(run_phase, "verificación de MySQLdb", verify_mysqldb_import, python_executable),
+        ]
+        for future in futures:
+            future.result()
 
 def open_browser_delayed():
     """Abre el navegador después de un pequeño delay para que el servidor esté listo"""
@@ -557,8 +692,82 @@ def start_server(python_executable):
         print(f"❌ Error al iniciar el servidor: {e}")
         sys.exit(1)
 
+def parse_arguments():
+    """Lee las opciones de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Iniciador de la aplicación Django")
+    parser.add_argument("--force-install", action="store_true",
+                        help="Reinstalar dependencias aunque requirements.txt no haya cambiado")
+    parser.add_argument("--purge-cache", action="store_true",
+                        help="Limpiar la caché de pip y de wheels antes de instalar")
+    return parser.parse_args()
+
+def install_dependencies(python_executable, venv_path, args):
+    """
+    Actualiza pip e instala las dependencias si el entorno virtual no coincide
+    con requirements.txt y el intérprete actuales.
+
+    Returns:
+        tuple: (venv_path, python_executable), que cambian si se recrea el entorno
+    """
+    fingerprint = compute_requirements_fingerprint(python_executable)
+    if not args.force_install and fingerprint == read_requirements_fingerprint(venv_path):
+        print("✅ Dependencias al día (requirements.txt e intérprete sin cambios), se omite la instalación")
+        return venv_path, python_executable
+
+    # Paso 2: Verificar y configurar pip
+    pip_success = fix_and_upgrade_pip(python_executable)
+    
+    if not pip_success:
+        print("\n🔄 Intentando recrear el entorno virtual...")
+        venv_path = recreate_virtual_environment()
+        python_executable = get_venv_python(venv_path)
+        
+        if not fix_and_upgrade_pip(python_executable):
+            print("❌ Error crítico con pip, no se puede continuar")
+            print("\n💡 Soluciones manuales:")
+            print("   1. Eliminar manualmente la carpeta .venv")
+            print("   2. Verificar que Python esté correctamente instalado")
+            print("   3. Ejecutar: python -m venv .venv")
+            sys.exit(1)
+    
+    # Paso 2.5: Limpiar caché de pip (solo si se solicita)
+    if args.purge_cache:
+        purge_pip_cache(python_executable)
+    
+    # Paso 3: Instalar dependencias
+    if not install_requirements(python_executable):
+        print("\n🔄 ¿Desea intentar recrear el entorno virtual? (s/n)")
+        try:
+            response = input().lower().strip()
+            if response in ['s', 'si', 'sí', 'y', 'yes']:
+                print("🔄 Recreando entorno virtual...")
+                venv_path = recreate_virtual_environment()
+                python_executable = get_venv_python(venv_path)
+                
+                if fix_and_upgrade_pip(python_executable) and install_requirements(python_executable):
+                    print("✅ Dependencias instaladas después de recrear entorno virtual")
+                else:
+                    print("❌ Error persistente al instalar dependencias")
+                    sys.exit(1)
+            else:
+                print("❌ No se pudieron instalar las dependencias")
+                sys.exit(1)
+        except (KeyboardInterrupt, EOFError):
+            print("\n❌ Operación cancelada por el usuario")
+            sys.exit(1)
+    
+    save_requirements_fingerprint(venv_path, compute_requirements_fingerprint(python_executable))
+    
+    # Paso 3.5: Listar paquetes instalados
+    list_installed_packages(python_executable)
+    
+    return venv_path, python_executable
+
 def main():
     """Función principal"""
+    args = parse_arguments()
+    started = time.perf_counter()
+    
     print("=" * 60)
     print("🐍 INICIADOR DE APLICACIÓN DJANGO CON ENTORNO VIRTUAL")
     print("=" * 60)
@@ -577,7 +786,7 @@ def main():
     
     try:
         # Paso 1: Crear/verificar entorno virtual
-        venv_path = create_virtual_environment()
+        venv_path = run_phase("entorno virtual", create_virtual_environment)
         python_executable = get_venv_python(venv_path)
         
         if not python_executable.exists():
@@ -586,55 +795,14 @@ def main():
         
         print(f"🐍 Usando Python del entorno virtual: {python_executable}")
         
-        # Paso 2: Verificar y configurar pip
-        pip_success = fix_and_upgrade_pip(python_executable)
-        
-        if not pip_success:
-            print("\n🔄 Intentando recrear el entorno virtual...")
-            venv_path = recreate_virtual_environment()
-            python_executable = get_venv_python(venv_path)
-            
-            if not fix_and_upgrade_pip(python_executable):
-                print("❌ Error crítico con pip, no se puede continuar")
-                print("\n💡 Soluciones manuales:")
-                print("   1. Eliminar manualmente la carpeta .venv")
-                print("   2. Verificar que Python esté correctamente instalado")
-                print("   3. Ejecutar: python -m venv .venv")
-                sys.exit(1)
-        
-        # Paso 2.5: Limpiar caché de pip
-        purge_pip_cache(python_executable)
-        
-        # Paso 3: Instalar dependencias
-        if not install_requirements(python_executable):
-            print("\n🔄 ¿Desea intentar recrear el entorno virtual? (s/n)")
-            try:
-                response = input().lower().strip()
-                if response in ['s', 'si', 'sí', 'y', 'yes']:
-                    print("🔄 Recreando entorno virtual...")
-                    venv_path = recreate_virtual_environment()
-                    python_executable = get_venv_python(venv_path)
-                    
-                    if fix_and_upgrade_pip(python_executable) and install_requirements(python_executable):
-                        print("✅ Dependencias instaladas después de recrear entorno virtual")
-                    else:
-                        print("❌ Error persistente al instalar dependencias")
-                        sys.exit(1)
-                else:
-                    print("❌ No se pudieron instalar las dependencias")
-                    sys.exit(1)
-            except (KeyboardInterrupt, EOFError):
-                print("\n❌ Operación cancelada por el usuario")
-                sys.exit(1)
-        
-        # Paso 3.5: Listar paquetes instalados
-        list_installed_packages(python_executable)
-        
-        # Paso 4: Ejecutar migraciones
-        run_migrations(python_executable)
+        # Pasos 2 y 3: pip y dependencias (se omiten si no hay cambios)
+        venv_path, python_executable = run_phase(
+            "dependencias", install_dependencies, python_executable, venv_path, args
+        )
         
-        # Paso 4.5: Verificar importación de MySQLdb
-        verify_mysqldb_import(python_executable)
+        # Paso 4: Archivos estáticos, migraciones y verificación de MySQLdb en paralelo
+        run_phase("preparación del proyecto", run_setup_tasks, python_executable)
+        print_phase_timings(time.perf_counter() - started)
         
         # Paso 5: Iniciar servidor
         start_server(python_executable)